@@ -0,0 +1,3 @@
+from auth.session import authorized_http, build_service, get_credentials
+
+__all__ = [authorized_http, build_service, get_credentials]
@@ -0,0 +1,105 @@
+"""
+Process-wide Google API credentials and service objects.
+
+SheetsClient and DriveClient share one set of credentials, loaded from
+token.pickle once per process and refreshed ahead of expiry rather than on a
+failed request. Services are built once each from the discovery documents
+bundled with google-api-python-client, so no discovery document is fetched.
+Each thread executes requests over its own authorized Http, since httplib2
+connections aren't thread-safe; the main thread's is shared by every service.
+
+The Google client libraries take a few hundred milliseconds to import, so
+they are imported inside the functions that need them: runs served from the
+local store never load them.
+"""
+
+import os
+import pickle
+import datetime
+import threading
+
+from settings import GOOGLE_API_SCOPES
+
+# If modifying these scopes, delete the file token.pickle.
+SCOPES = GOOGLE_API_SCOPES
+
+TOKEN_FILE = 'token.pickle'
+CLIENT_SECRETS_FILES = ['sheets_credentials.json', 'drive_credentials.json']
+
+# Refresh tokens this long before they expire, so a long run never sends a stale one
+REFRESH_MARGIN = datetime.timedelta(minutes=10)
+
+_lock = threading.RLock()
+_local = threading.local()
+_credentials = None
+_services = {}
+
+
+def _save(creds):
+    with open(TOKEN_FILE, 'wb') as token:
+        pickle.dump(creds, token)
+
+
+def _expiring(creds):
+    if creds.expiry is None:
+        return False
+    # google-auth keeps expiry as a naive UTC datetime
+    expiry = creds.expiry
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=datetime.timezone.utc)
+    return expiry - REFRESH_MARGIN <= datetime.datetime.now(datetime.timezone.utc)
+
+
+def get_credentials():
+    """The process's credentials, authorizing or refreshing them when needed"""
+    global _credentials
+
+    with _lock:
+        creds = _credentials
+        if creds is None and os.path.exists(TOKEN_FILE):
+            # The file token.pickle stores the user's access and refresh tokens, and is
+            # created automatically when the authorization flow completes for the first
+            # time.
+            with open(TOKEN_FILE, 'rb') as token:
+                creds = pickle.load(token)
+
+        if creds and creds.refresh_token and (not creds.valid or _expiring(creds)):
+            from google.auth.transport.requests import Request
+
+            creds.refresh(Request())
+            _save(creds)
+        elif not creds or not creds.valid:
+            # If there are no (valid) credentials available, let the user log in.
+            from google_auth_oauthlib.flow import InstalledAppFlow
+
+            client_secrets = next((f for f in CLIENT_SECRETS_FILES if os.path.exists(f)), CLIENT_SECRETS_FILES[0])
+            flow = InstalledAppFlow.from_client_secrets_file(client_secrets, SCOPES)
+            creds = flow.run_local_server(port=0)
+            _save(creds)
+
+        _credentials = creds
+        return creds
+
+
+def authorized_http():
+    """This thread's authorized Http, over the shared credentials"""
+    import httplib2
+    import google_auth_httplib2
+
+    creds = get_credentials()
+    if getattr(_local, 'credentials', None) is not creds:
+        _local.http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+        _local.credentials = creds
+    return _local.http
+
+
+def build_service(name, version):
+    """The process's service object for a Google API, e.g. build_service('drive', 'v3')"""
+    from googleapiclient.discovery import build
+
+    with _lock:
+        if (name, version) not in _services:
+            _services[(name, version)] = build(
+                name, version, http=authorized_http(), static_discovery=True, cache_discovery=False
+            )
+        return _services[(name, version)]
@@ -0,0 +1,118 @@
+"""
+Golden test and per-row benchmark for squarespace.compile_row_encoder().
+
+Builds SquareSpace rows by running synthetic sheet rows through the real
+Inventory.clean() and transform() (image matching stubbed out), adds hand-made
+edge cases (missing scalar keys, None and empty lists, numbers given as strings,
+quotes, commas and newlines), then writes them through the old
+SquareSpaceInventorySchema().dump() + csv.DictWriter path and through the
+compiled encoder + csv.writer. The two CSVs must be byte-identical.
+
+Usage (from sheet_sync/):
+    python benchmarks/csv_encoder.py
+    python benchmarks/csv_encoder.py --rows 5000 --repeat 10
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import synthetic
+from resources.configuration import Configuration
+from resources.inventory import Inventory, FUZZY_MATCH_THRESHOLD
+from resources.tags import TagResolver
+from squarespace import SquareSpaceInventorySchema, INVENTORY_HEADER, compile_row_encoder
+
+CONFIGURATION = Configuration()
+
+EDGE_CASES = [
+    # join_lists() requires the list keys; every other key may be missing
+    {"categories": [], "tags": [], "image_url": None},
+    {"title": "Quoted \"title\", with commas", "description": "<p>line one\nline two</p>", "price": "4.99",
+     "stock": "3", "categories": [], "tags": [], "image_url": None},
+    {"title": "Ünïcode ☘", "price": 5, "weight": 2, "categories": ["a", "b"], "tags": ["x"],
+     "image_url": ["https://example.com/a.jpg", "https://example.com/b.jpg"], "sku": 1234},
+    {"title": None, "price": None, "stock": 0, "categories": None, "tags": None, "image_url": []},
+    {"option_value_1": 4.0, "sale_price": 1e-7, "length": 123456789.125, "visible": "No",
+     "categories": [], "tags": [], "image_url": None},
+]
+
+
+def transformed_rows(n):
+    """Rows of the products Inventory.transform() yields, with image matching stubbed out"""
+    inventory = Inventory.__new__(Inventory)
+    inventory.categories = {page: set() for page in ["perennials", "trees-and-shrubs", "veggies", "houseplants", "herbs"]}
+    inventory.title_map = {}
+    inventory.tag_resolver = TagResolver(
+        {section["name"]: section["tags"] for section in [CONFIGURATION.plants, CONFIGURATION.veggies, CONFIGURATION.houseplants]},
+        FUZZY_MATCH_THRESHOLD,
+    )
+    inventory.match_image_metadata = lambda item: [f"https://drive.example/{item['sku']}"] if item["sku"] % 3 else None
+
+    raw_data = synthetic.raw_data(n)
+    rows = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for category in ["plants", "veggies", "houseplants"]:
+            products = inventory.transform(inventory.clean(raw_data[category]), getattr(CONFIGURATION, category))
+            rows += [row for _, variants in products for row in variants]
+    return rows
+
+
+def legacy_write(f, rows):
+    """Inventory.write() before the compiled encoder"""
+    schema = SquareSpaceInventorySchema()
+    fieldnames = list(SquareSpaceInventorySchema._declared_fields.keys())
+    writer = csv.DictWriter(f, fieldnames=fieldnames)
+
+    writer.writerow(INVENTORY_HEADER)
+    for item in rows:
+        writer.writerow(schema.dump(item))
+
+
+def encoded_write(f, rows):
+    fieldnames, encode = compile_row_encoder(SquareSpaceInventorySchema)
+    writer = csv.writer(f)
+
+    writer.writerow([INVENTORY_HEADER[name] for name in fieldnames])
+    writer.writerows(map(encode, rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000, help="synthetic plant rows (default: 2000)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds (default: 5)")
+    args = parser.parse_args()
+
+    rows = transformed_rows(args.rows) + EDGE_CASES
+    print(f"{len(rows)} SquareSpace rows ({len(EDGE_CASES)} edge cases)")
+
+    outputs, timings = {}, {}
+    for label, write in [("dump + DictWriter", legacy_write), ("compiled encoder", encoded_write)]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            f = io.StringIO(newline="")
+            write(f, rows)
+        timings[label] = (time.perf_counter() - start) / (args.repeat * len(rows))
+        outputs[label] = f.getvalue().encode()
+
+    legacy_s, encoded_s = timings.values()
+    for label, per_row in timings.items():
+        print(f"  {label:<18} {per_row * 1e6:7.2f} µs/row")
+    print(f"  {legacy_s / encoded_s:.1f}x faster")
+
+    legacy, encoded = outputs.values()
+    if legacy != encoded:
+        line = next(i for i, (a, b) in enumerate(zip(legacy.splitlines(), encoded.splitlines())) if a != b)
+        print(f"  MISMATCH at CSV line {line + 1}:\n    {legacy.splitlines()[line]}\n    {encoded.splitlines()[line]}")
+        sys.exit(1)
+    print(f"  output byte-identical ({len(encoded) / 1e3:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
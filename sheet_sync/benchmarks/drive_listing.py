@@ -0,0 +1,106 @@
+"""
+Request-count and latency benchmark for DriveClient folder listing.
+
+Lists synthetic Drive folders from drive.fake.FakeDriveService (with a
+simulated round-trip latency) the old way, one folder after another at the
+default page size, and with list_files_in_folders(), concurrent at
+pageSize=1000. Then renames and adds a few images and compares an
+incremental modifiedTime listing merged into the stored folders against a
+fresh full listing.
+
+Usage (from sheet_sync/):
+    python benchmarks/drive_listing.py
+    python benchmarks/drive_listing.py --images 3000 --latency 0.2
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import synthetic
+from drive import DriveClient
+from drive.fake import FakeDriveService
+from resources.configuration import Configuration
+
+FOLDERS = list(Configuration().image_search_folders.values())
+
+
+def legacy_list_files_in_folder(service, folder_id):
+    """list_files_in_folder() as it was: default page size, one folder at a time"""
+    page_token = None
+    files = []
+    while True:
+        response = service.files().list(q=f"'{folder_id}' in parents",
+                                        fields='nextPageToken, files(id, name, webContentLink)',
+                                        pageToken=page_token).execute()
+        for file in response.get('files', []):
+            files.append({"name": file.get("name"), "id": file.get("id"), "download": file.get("webContentLink")})
+        page_token = response.get('nextPageToken', None)
+        if page_token is None:
+            break
+    return files
+
+
+def timed(service, fn):
+    requests, start = service.requests, time.perf_counter()
+    result = fn()
+    return result, service.requests - requests, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, default=1500, help="synthetic images across all folders (default: 1500)")
+    parser.add_argument("--latency", type=float, default=0.1, help="simulated seconds per request (default: 0.1)")
+    args = parser.parse_args()
+
+    files = [
+        {"id": image["id"], "name": image["name"], "webContentLink": image["download"],
+         "parents": [FOLDERS[i % len(FOLDERS)]], "modifiedTime": 1_000_000.0}
+        for i, image in enumerate(synthetic.image_metadata(args.images))
+    ]
+    service = FakeDriveService(files, latency=args.latency)
+    client = DriveClient(service=service)
+
+    legacy, legacy_requests, legacy_s = timed(
+        service, lambda: {folder_id: legacy_list_files_in_folder(service, folder_id) for folder_id in FOLDERS}
+    )
+    full, full_requests, full_s = timed(service, lambda: client.list_files_in_folders(dict.fromkeys(FOLDERS)))
+
+    # Rename a few images and add a few more, then list only what changed
+    for file in files[::97]:
+        file["name"] = "renamed " + file["name"]
+        file["modifiedTime"] = 2_000_000.0
+    for i in range(5):
+        files.append({"id": f"new{i}", "name": f"new image {i}.jpg", "webContentLink": f"https://drive.example/new{i}",
+                      "parents": [FOLDERS[i % len(FOLDERS)]], "modifiedTime": 2_000_000.0})
+
+    changes, incremental_requests, incremental_s = timed(
+        service, lambda: client.list_files_in_folders(dict.fromkeys(FOLDERS, 1_500_000.0))
+    )
+    merged = {}
+    for folder_id in FOLDERS:
+        by_id = {image["id"]: image for image in full[folder_id]}
+        by_id.update((image["id"], image) for image in changes[folder_id])
+        merged[folder_id] = list(by_id.values())
+    relisted = client.list_files_in_folders(dict.fromkeys(FOLDERS))
+
+    print(f"{len(FOLDERS)} folders, {args.images} images, {args.latency * 1000:.0f} ms simulated latency")
+    print(f"  sequential, default page size:  {legacy_requests:3d} requests  {legacy_s * 1000:8.1f} ms")
+    print(f"  concurrent, pageSize=1000:      {full_requests:3d} requests  {full_s * 1000:8.1f} ms")
+    print(f"  incremental ({sum(map(len, changes.values()))} changed files):   "
+          f"{incremental_requests:3d} requests  {incremental_s * 1000:8.1f} ms")
+
+    if legacy != full:
+        print("  MISMATCH between sequential and concurrent listings")
+        sys.exit(1)
+    if merged != relisted:
+        print("  MISMATCH between incremental merge and full relisting")
+        sys.exit(1)
+    print("  listings identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark and equivalence check for resources.image_match.ImageMatchIndex.
+
+Generates synthetic Drive image names (plant names with photo numbers,
+underscores, typos and dropped words) and item queries, then runs the
+original brute-force match_image_metadata() against the index and requires
+identical results for every query.
+
+Usage (from sheet_sync/):
+    python benchmarks/image_match.py
+    python benchmarks/image_match.py --images 2000 --queries 500
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fuzzywuzzy import fuzz, process
+
+from resources.configuration import Configuration
+from resources.image_match import ImageMatchIndex
+
+THRESHOLD = Configuration().fuzzy_match_image_metadata_threshold
+
+GENERA = ["acer", "asclepias", "echinacea", "rudbeckia", "salvia", "monarda", "phlox", "quercus",
+          "viburnum", "ilex", "solidago", "aster", "carex", "baptisia", "coreopsis", "heuchera",
+          "penstemon", "liatris", "amsonia", "itea", "clethra", "hydrangea", "cornus", "pepper",
+          "tomato", "basil", "ficus", "pothos", "monstera", "sansevieria"]
+EPITHETS = ["rubrum", "tuberosa", "purpurea", "hirta", "nemorosa", "fistulosa", "paniculata",
+            "alba", "virginica", "verticillata", "rugosa", "novae-angliae", "pensylvanica",
+            "australis", "verticillata", "villosa", "digitalis", "spicata", "tabernaemontana",
+            "alnifolia", "quercifolia", "florida", "cherokee purple", "sweet banana", "genovese"]
+COMMON = ["red maple", "butterfly weed", "purple coneflower", "black-eyed susan", "woodland sage",
+          "bee balm", "garden phlox", "white oak", "arrowwood", "winterberry", "goldenrod",
+          "new england aster", "sedge", "blue false indigo", "tickseed", "coral bells",
+          "beardtongue", "blazing star", "bluestar", "sweetspire", "summersweet", "oakleaf hydrangea",
+          "flowering dogwood", "bell pepper", "heirloom tomato", "sweet basil", "fiddle leaf fig",
+          "golden pothos", "swiss cheese plant", "snake plant"]
+
+
+def clean_name(name):
+    """Inventory.clean_image_metadata() for one file name."""
+    name = name.lower()
+    name = re.sub(r"[\d\(\)\._]", " ", name)
+    name = re.sub(r"\s+", " ", name)
+    return re.sub(r"jpg", " ", name)
+
+
+def typo(rng, word):
+    if len(word) > 3 and rng.random() < 0.3:
+        i = rng.randrange(len(word))
+        return word[:i] + word[i + 1:]
+    return word
+
+
+def synthetic(rng, n_images, n_queries):
+    plants = [(f"{rng.choice(GENERA)} {rng.choice(EPITHETS)}", rng.choice(COMMON)) for _ in range(n_queries)]
+
+    images = []
+    for i in range(n_images):
+        if rng.random() < 0.7:
+            scientific, common = rng.choice(plants)
+        else:
+            scientific, common = f"{rng.choice(GENERA)} {rng.choice(EPITHETS)}", rng.choice(COMMON)
+        words = [typo(rng, w) for w in f"{scientific} {common}".split()]
+        if rng.random() < 0.3:
+            words = words[:rng.randint(1, len(words))]
+        if rng.random() < 0.3:
+            rng.shuffle(words)
+        name = "_".join(w.capitalize() for w in words) + f" ({rng.randint(1, 4)}).jpg"
+        # A few shared or missing download links, like real Drive listings
+        download = None if rng.random() < 0.01 else f"https://drive.example/{rng.randrange(n_images * 2)}"
+        images.append({"name": name, "cleaned_name": clean_name(name), "id": str(i), "download": download})
+
+    queries = [f"{scientific} {common}".lower() for scientific, common in plants]
+    queries += ["", "x", "zzz qqq", "acer"]
+    return images, queries
+
+
+def legacy_match(image_metadata, query):
+    """The original Inventory.match_image_metadata() body."""
+    choices = {image["download"]: image["cleaned_name"] for image in image_metadata}
+
+    matches = []
+    for scorer in [
+        fuzz.token_set_ratio,
+        fuzz.token_sort_ratio,
+    ]:
+        matches += process.extractBests(query, choices, scorer=scorer, limit=5)
+
+    best_matches = {}
+    for match in matches:
+        best_matches[match[2]] = [
+            match[0],
+            max(match[1], best_matches.get(match[-1], [0, 0, 0])[1]),
+            match[2]
+        ]
+    matches = list(best_matches.values())
+
+    matches = filter(lambda match: match[1] >= THRESHOLD, matches)
+    matches = sorted(matches, key=lambda item: item[1])
+    matches = [match[2] for match in matches]
+
+    if not matches:
+        return None
+
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, default=1000, help="synthetic images (default: 1000)")
+    parser.add_argument("--queries", type=int, default=200, help="synthetic items (default: 200)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    images, queries = synthetic(random.Random(args.seed), args.images, args.queries)
+    print(f"{len(images)} images, {len(queries)} queries, threshold {THRESHOLD}")
+
+    start = time.perf_counter()
+    expected = [legacy_match(images, query) for query in queries]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = ImageMatchIndex(images, THRESHOLD)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = [index.match(query) for query in queries]
+    index_s = time.perf_counter() - start
+
+    print(f"  brute force:  {legacy_s * 1000 / len(queries):8.2f} ms/query")
+    print(f"  index:        {index_s * 1000 / len(queries):8.2f} ms/query  "
+          f"(+{build_s * 1000:.0f} ms build, {legacy_s / (index_s + build_s):.1f}x faster overall)")
+    print(f"  matched:      {sum(1 for m in actual if m)} of {len(queries)} queries")
+
+    mismatches = [i for i, (a, b) in enumerate(zip(expected, actual)) if a != b]
+    if mismatches:
+        i = mismatches[0]
+        print(f"  MISMATCH on {len(mismatches)} queries, e.g. {queries[i]!r}: {expected[i]} vs {actual[i]}")
+        sys.exit(1)
+    print("  results identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Timing and correctness check for the incremental Squarespace export.
+
+Seeds a local store with synthetic data in a temporary directory and runs
+the export CLI three times there, each in its own process with its own
+string hash seed: a first export, a rerun on the unchanged store, which must
+not rewrite any export and must leave every delta and removed list empty,
+and a rerun after editing one veggie row's info, renaming another and
+deleting a third, editing the first of two rows of a SKU whose title another
+SKU's row sits between, and editing the info of a plant with several tags.
+The last veggie delta CSV must hold exactly the rows of the edited, renamed
+and twice-listed veggies, the plant delta exactly the edited plant's rows,
+the removed list the deleted and renamed veggies' old keys, and every export
+CSV must match a from-scratch export of the edited data. Timings include
+interpreter start-up.
+
+Usage (from sheet_sync/):
+    python benchmarks/incremental_export.py
+    python benchmarks/incremental_export.py --rows 3000 --images 200
+"""
+
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SHEET_SYNC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SHEET_SYNC)
+
+import synthetic
+from pipeline import seed_store
+from resources.store import Store
+from sheets import SheetsInventoryMeta
+
+CATEGORIES = ["plants", "veggies", "houseplants"]
+OUTPUTS = [f"data/{category}.csv" for category in CATEGORIES] + ["title_map.csv"]
+
+
+def run():
+    """
+    Runs the export CLI in the current directory in a fresh process, leaving
+    PYTHONHASHSEED unset so set iteration order differs from run to run
+    """
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONHASHSEED"}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SHEET_SYNC, env.get("PYTHONPATH")]))
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", "from resources.inventory import main; main()"],
+        env=env, stdout=subprocess.DEVNULL, check=True,
+    )
+    return time.perf_counter() - start
+
+
+def snapshot(names):
+    """{file name: (mtime, contents)}"""
+    files = {}
+    for name in names:
+        with open(name, "rb") as f:
+            files[name] = (os.stat(name).st_mtime_ns, f.read())
+    return files
+
+
+def read_csv(name):
+    with open(name, newline="") as f:
+        return list(csv.reader(f))[1:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1500, help="synthetic plant rows (default: 1500)")
+    parser.add_argument("--images", type=int, default=100, help="synthetic Drive images (default: 100)")
+    args = parser.parse_args()
+
+    raw_data = synthetic.raw_data(args.rows)
+    image_metadata = synthetic.image_metadata(args.images)
+
+    # Two SKUs sharing a title, sorted into one run as A, B, A
+    twin = list(raw_data["veggies"][3])
+    twin[SheetsInventoryMeta.common_name.index] = "Twin Veggie"
+    twins = [[sku, *twin[1:]] for sku in [9001, 9002, 9001]]
+    raw_data = {**raw_data, "veggies": raw_data["veggies"] + twins}
+
+    # A plant whose Tags and Categories cells are built from several tags
+    tagged = list(raw_data["plants"][0])
+    tagged[SheetsInventoryMeta.scientific_name.index] = "Tagged plantae"
+    tagged[SheetsInventoryMeta.common_name.index] = "Tagged Plant"
+    tagged[SheetsInventoryMeta.category.index] = "native, groundcover"
+    tagged[SheetsInventoryMeta.tags.index] = "part sun, drought, deer, Pollinators, reg water"
+    raw_data = {**raw_data, "plants": [tagged] + raw_data["plants"][1:]}
+
+    veggies = [list(row) for row in raw_data["veggies"]]
+    edited, renamed, deleted = veggies[0], veggies[1], veggies[2]
+    edited[SheetsInventoryMeta.info.index] = "Edited info"
+    old_name = renamed[SheetsInventoryMeta.common_name.index]
+    renamed[SheetsInventoryMeta.common_name.index] = old_name + " Renamed"
+    veggies[-3][SheetsInventoryMeta.info.index] = "Edited twin info"
+    veggies.remove(deleted)
+    plants = [list(row) for row in raw_data["plants"]]
+    plants[0][SheetsInventoryMeta.info.index] = "Edited tagged info"
+    edited_data = {**raw_data, "plants": plants, "veggies": veggies}
+
+    failures = []
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        for directory in ["incremental", "scratch"]:
+            os.makedirs(f"{directory}/data")
+
+        os.chdir(f"{workdir}/incremental")
+        seed_store(Store(), raw_data, image_metadata)
+        first_s = run()
+
+        written = snapshot(OUTPUTS)
+        unchanged_s = run()
+        if snapshot(written) != written:
+            failures.append("unchanged rerun rewrote exports")
+        for category in CATEGORIES:
+            for name in [f"data/{category}.delta.csv", f"data/{category}.removed.csv"]:
+                if read_csv(name):
+                    failures.append(f"{name} not empty after an unchanged rerun")
+
+        seed_store(Store(), edited_data, image_metadata)
+        edited_s = run()
+        incremental = snapshot(OUTPUTS)
+
+        delta = read_csv("data/veggies.delta.csv")
+        delta_titles = {row[5] for row in delta if row[5]}
+        if delta_titles != {edited[SheetsInventoryMeta.common_name.index], old_name + " Renamed", "Twin Veggie"}:
+            failures.append(f"veggies delta holds {sorted(delta_titles)}")
+        # Two pot variants each for the edited, the renamed and both rows of the twice-listed SKU
+        if len(delta) != 2 * 4:
+            failures.append(f"veggies delta holds {len(delta)} rows")
+        removed = {tuple(row) for row in read_csv("data/veggies.removed.csv")}
+        if removed != {(str(deleted[0]), deleted[SheetsInventoryMeta.common_name.index]), (str(renamed[0]), old_name)}:
+            failures.append(f"veggies removed list holds {sorted(removed)}")
+        plant_rows = read_csv("data/plants.csv")
+        start = next(i for i, row in enumerate(plant_rows) if row[5] == "Tagged plantae (Tagged Plant)")
+        end = next((i for i in range(start + 1, len(plant_rows)) if plant_rows[i][5]), len(plant_rows))
+        plant_delta = read_csv("data/plants.delta.csv")
+        if plant_delta != plant_rows[start:end]:
+            failures.append(f"plants delta holds {len(plant_delta)} rows, not the {end - start} of the edited plant")
+        for category in ["houseplants"]:
+            if written[f"data/{category}.csv"][0] != os.stat(f"data/{category}.csv").st_mtime_ns:
+                failures.append(f"unchanged {category} rewritten after a veggies edit")
+
+        os.chdir(f"{workdir}/scratch")
+        seed_store(Store(), edited_data, image_metadata)
+        run()
+        for name, (_, contents) in snapshot(OUTPUTS).items():
+            if contents != incremental[name][1]:
+                failures.append(f"{name} differs from a from-scratch export")
+
+    print(f"{args.rows} plant rows, {args.images} images")
+    print(f"  first export           {first_s * 1000:9.1f} ms")
+    print(f"  unchanged rerun        {unchanged_s * 1000:9.1f} ms")
+    print(f"  rerun after 5 edits    {edited_s * 1000:9.1f} ms")
+
+    if failures:
+        for failure in failures:
+            print(f"  FAILED: {failure}")
+        sys.exit(1)
+    print("  deltas, removed lists and exports correct")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Wall-clock benchmark for syncing the inventory categories on a process pool.
+
+Seeds a local store with synthetic data in a temporary directory, then runs
+Inventory(jobs=1), which syncs plants, veggies and houseplants one after
+another and times each, and Inventory() with one process per category. The
+CSVs, title_map.csv and the category and tag reports must be identical.
+
+Usage (from sheet_sync/):
+    python benchmarks/parallel.py
+    python benchmarks/parallel.py --rows 3000 --images 200
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import pprint
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import synthetic
+from pipeline import seed_store
+from resources.inventory import Inventory
+from resources.store import Store
+
+OUTPUTS = ["data/plants.csv", "data/veggies.csv", "data/houseplants.csv", "title_map.csv"]
+
+
+class TimedInventory(Inventory):
+    """Records how long each category's write(), which drives its whole pipeline, takes"""
+
+    def write(self, file_name, data, previous=None):
+        start = time.perf_counter()
+        products = super().write(file_name, data, previous)
+        self.category_times[file_name] = time.perf_counter() - start
+        return products
+
+
+def run(jobs):
+    TimedInventory.category_times = {}
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        inventory = TimedInventory(jobs=jobs, full=True)
+    elapsed = time.perf_counter() - start
+
+    outputs = {}
+    for name in OUTPUTS:
+        with open(name, "rb") as f:
+            outputs[name] = f.read()
+    outputs["reports"] = (pprint.pformat(inventory.categories) + inventory.tag_resolver.report()).encode()
+    return elapsed, TimedInventory.category_times, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1500, help="synthetic plant rows (default: 1500)")
+    parser.add_argument("--images", type=int, default=100, help="synthetic Drive images (default: 100)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        os.mkdir("data")
+        seed_store(Store(), synthetic.raw_data(args.rows), synthetic.image_metadata(args.images))
+
+        sequential_s, category_times, sequential = run(jobs=1)
+        parallel_s, _, parallel = run(jobs=None)
+
+    print(f"{args.rows} plant rows, {args.images} images")
+    for file_name, elapsed in category_times.items():
+        print(f"  {file_name:<22} {elapsed * 1000:9.1f} ms (sequential)")
+    print(f"  sequential total       {sequential_s * 1000:9.1f} ms")
+    print(f"  process pool total     {parallel_s * 1000:9.1f} ms  ({sequential_s / parallel_s:.1f}x faster)")
+
+    mismatches = [name for name in sequential if sequential[name] != parallel[name]]
+    if mismatches:
+        print(f"  MISMATCH in {', '.join(mismatches)}")
+        sys.exit(1)
+    print("  outputs identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Time and peak-memory benchmark for the Inventory clean/transform/write stages.
+
+Seeds a local store in a temporary directory with synthetic sheet tabs and
+Drive folders and runs a full Inventory() there, so no Google API access is
+needed. Each stage is timed in one run and measured with tracemalloc in a
+second (tracing slows Python down too much to time the same run).
+
+clean() and transform() are generators that write() drives, so their own
+lines only cover creating the generator; the total line covers the whole run.
+Categories are synced in-process (jobs=1) so every stage runs where it is
+measured; benchmarks/parallel.py covers the process pool.
+
+Usage (from sheet_sync/):
+    python benchmarks/pipeline.py
+    python benchmarks/pipeline.py --rows 5000 --images 200
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import synthetic
+from resources.configuration import Configuration
+from resources.inventory import Inventory
+from resources.store import Store
+from sheets import SheetsInventoryMeta
+
+
+def measured_inventory(times, peaks, trace):
+    class MeasuredInventory(Inventory):
+        pass
+
+    def wrap(name):
+        method = getattr(Inventory, name)
+
+        def measured(self, *args):
+            if trace:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            result = method(self, *args)
+            times[name] += time.perf_counter() - start
+            if trace:
+                peaks[name] = max(peaks[name], tracemalloc.get_traced_memory()[1] - base)
+            return result
+
+        setattr(MeasuredInventory, name, measured)
+
+    for name in ["clean_image_metadata", "clean", "transform", "write"]:
+        wrap(name)
+    return MeasuredInventory
+
+
+def run(trace):
+    times, peaks = defaultdict(float), defaultdict(int)
+    inventory_class = measured_inventory(times, peaks, trace)
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        inventory_class(jobs=1, full=True)
+    times["total"] = time.perf_counter() - start
+    if trace:
+        peaks["total"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return times, peaks
+
+
+def seed_store(store, raw_data, image_metadata):
+    """Stores each category's rows as its first sheet tab and the images as the first folder"""
+    for category, sheets in [
+        ("plants", SheetsInventoryMeta.plants_sheet),
+        ("veggies", SheetsInventoryMeta.veggies_sheet),
+        ("houseplants", SheetsInventoryMeta.houseplants_sheet),
+    ]:
+        for i, sheet in enumerate(sheets):
+            store.put("sheet", sheet, raw_data[category] if i == 0 else [])
+
+    for i, folder_id in enumerate(Configuration().image_search_folders.values()):
+        store.put("folder", folder_id, image_metadata if i == 0 else [])
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000, help="synthetic plant rows (default: 2000)")
+    parser.add_argument("--images", type=int, default=100, help="synthetic Drive images (default: 100)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        os.mkdir("data")
+        seed_store(Store(), synthetic.raw_data(args.rows), synthetic.image_metadata(args.images))
+
+        times, _ = run(trace=False)
+        _, peaks = run(trace=True)
+
+    print(f"{args.rows} plant rows, {args.images} images")
+    for name in times:
+        print(f"  {name:<22} {times[name] * 1000:9.1f} ms   peak +{peaks[name] / 1e6:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
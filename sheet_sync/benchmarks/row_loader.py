@@ -0,0 +1,127 @@
+"""
+Equivalence check and benchmark for sheets.RowLoader against per-row
+SheetsInventorySchema().load().
+
+Builds a synthetic sheet (default 10k rows) and salts it with awkward cells:
+numbers in text columns, numeric strings, bools, nan/inf, floats as SKUs,
+bad URLs, short and over-long rows. Both loaders must produce the same
+InventoryItems and the same per-row error messages.
+
+Usage (from sheet_sync/):
+    python benchmarks/row_loader.py
+    python benchmarks/row_loader.py --rows 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import marshmallow
+
+import synthetic
+from sheets import RowLoader, SheetsInventoryMeta, SheetsInventorySchema
+
+AWKWARD_CELLS = [
+    (SheetsInventoryMeta.sku.index, [12.0, 12.5, "77", True, "abc", float("nan"), 10 ** 400]),
+    (SheetsInventoryMeta.scientific_name.index, [123, 4.5, False, "Ünïcode"]),
+    (SheetsInventoryMeta.image_url.index, ["not a url", "https://example.com/x.jpg", 5]),
+    (SheetsInventoryMeta.price.index, ["4.99", "free", True, float("inf"), float("nan"), 10 ** 400, 3, -0.0]),
+    (SheetsInventoryMeta.pot.index, [1, 2.5, None]),
+    (SheetsInventoryMeta.location.index, [0, "", "B2"]),
+]
+
+
+def legacy_clean(data):
+    """Inventory.clean() as it was, recording errors instead of raising the first"""
+    schema = SheetsInventorySchema()
+    items, errors = [], {}
+
+    for i, row in enumerate(data):
+        # convert '' to None and pad missing values at end
+        row = [
+            item if item != "" else None
+            for item in row + [""] * (SheetsInventoryMeta.number_of_columns - len(row))
+        ]
+
+        # skip rows without SKUs
+        if row[SheetsInventoryMeta.sku.index] is None:
+            continue
+
+        try:
+            items.append(schema.load({
+                "sku": row[SheetsInventoryMeta.sku.index],
+                "scientific_name": row[SheetsInventoryMeta.scientific_name.index],
+                "common_name": row[SheetsInventoryMeta.common_name.index],
+                "image_url": row[SheetsInventoryMeta.image_url.index],
+                "category": row[SheetsInventoryMeta.category.index],
+                "tags": row[SheetsInventoryMeta.tags.index],
+                "zone": row[SheetsInventoryMeta.zone.index],
+                "info": row[SheetsInventoryMeta.info.index],
+                "pot": str(row[SheetsInventoryMeta.pot.index]),
+                "price": row[SheetsInventoryMeta.price.index],
+                "location": str(row[SheetsInventoryMeta.location.index]),
+            }))
+        except marshmallow.ValidationError as e:
+            errors[i] = e.messages
+
+    return items, errors
+
+
+def compiled_clean(data):
+    loader = RowLoader()
+    items = list(loader.load(data))
+    return items, {i: messages for i, (_, messages) in loader.errors.items()}
+
+
+def synthetic_sheet(n, seed):
+    rng = random.Random(seed)
+    rows = synthetic.raw_data(n, seed)["plants"]
+    for row in rng.sample(rows, n // 50):
+        index, cells = rng.choice(AWKWARD_CELLS)
+        row += [""] * (index + 1 - len(row))
+        row[index] = rng.choice(cells)
+    for row in rng.sample(rows, n // 200):
+        row.append("extra column")
+    return rows
+
+
+def timed(fn, data, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(data)
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="synthetic sheet rows (default: 10000)")
+    parser.add_argument("--seed", type=int, default=7, help="random seed (default: 7)")
+    parser.add_argument("--repeat", type=int, default=3, help="timing rounds (default: 3)")
+    args = parser.parse_args()
+
+    data = synthetic_sheet(args.rows, args.seed)
+    (legacy_items, legacy_errors), legacy_s = timed(legacy_clean, data, args.repeat)
+    (items, errors), compiled_s = timed(compiled_clean, data, args.repeat)
+
+    print(f"{len(data)} rows: {len(items)} loaded, {len(errors)} invalid")
+    print(f"  schema.load per row:  {legacy_s * 1000:8.1f} ms")
+    print(f"  RowLoader:            {compiled_s * 1000:8.1f} ms  ({legacy_s / compiled_s:.1f}x faster)")
+
+    # repr() also tells 3 from 3.0
+    if list(map(repr, items)) != list(map(repr, legacy_items)):
+        i = next((i for i, (a, b) in enumerate(zip(map(repr, items), map(repr, legacy_items))) if a != b),
+                 min(len(items), len(legacy_items)))
+        print(f"  MISMATCH in items at #{i}")
+        sys.exit(1)
+    if errors != legacy_errors:
+        print(f"  MISMATCH in errors, e.g. rows {sorted(set(errors) ^ set(legacy_errors))[:5]}")
+        sys.exit(1)
+    print("  items and errors identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Request-count benchmark for SheetsClient.get_ranges() against per-tab get_range().
+
+Runs Inventory.get_data() against sheets.fake.FakeSheetsService (with a
+simulated round-trip latency) and an empty local store, once with the old
+one-request-per-tab loop and once with the batchGet path, and requires the
+same rows from both.
+
+Usage (from sheet_sync/):
+    python benchmarks/sheets_batch.py
+    python benchmarks/sheets_batch.py --latency 0.3
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import synthetic
+from resources.inventory import Inventory
+from resources.store import Store
+from sheets import SheetsClient, SheetsInventoryMeta
+from sheets.fake import FakeSheetsService
+
+SPREADSHEET_ID = "fake-spreadsheet"
+
+
+def per_tab_get_ranges(client):
+    """get_ranges() as the old get_data() loop fetched it: one get_range() per tab"""
+    def get_ranges(spreadsheet_id, sheet_names, sheet_range):
+        return {
+            sheet_name: client.get_range(spreadsheet_id, "!".join([f"'{sheet_name}'", sheet_range]))
+            for sheet_name in sheet_names
+        }
+    return get_ranges
+
+
+def get_data(client, workdir):
+    """Runs only Inventory.get_data() against a fresh store, returning the raw rows"""
+    inventory = Inventory.__new__(Inventory)
+    inventory.store = Store(os.path.join(workdir, f"{time.perf_counter_ns()}.sqlite3"))
+    inventory.refresh = False
+    inventory.sheets_client = client
+    with contextlib.redirect_stdout(io.StringIO()):
+        inventory.get_data()
+    return inventory.plants_raw, inventory.veggies_raw, inventory.houseplants_raw
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000, help="synthetic plant rows (default: 2000)")
+    parser.add_argument("--latency", type=float, default=0.15, help="simulated seconds per request (default: 0.15)")
+    args = parser.parse_args()
+
+    raw_data = synthetic.raw_data(args.rows)
+    tabs = {}
+    for category, sheets in [
+        ("plants", SheetsInventoryMeta.plants_sheet),
+        ("veggies", SheetsInventoryMeta.veggies_sheet),
+        ("houseplants", SheetsInventoryMeta.houseplants_sheet),
+    ]:
+        # Header row, then the category's rows split across its tabs
+        for i, sheet in enumerate(sheets):
+            tabs[sheet] = [["SKU", "Scientific Name"]] + raw_data[category][i::len(sheets)]
+
+    os.environ["PLANT_SALE_INVENTORY_SPREADSHEET_ID"] = SPREADSHEET_ID
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for label in ["per-tab", "batchGet"]:
+            service = FakeSheetsService({SPREADSHEET_ID: tabs}, latency=args.latency)
+            client = SheetsClient(service=service)
+            if label == "per-tab":
+                client.get_ranges = per_tab_get_ranges(client)
+
+            start = time.perf_counter()
+            rows = get_data(client, workdir)
+            results[label] = rows, service.requests, time.perf_counter() - start
+
+    print(f"{len(tabs)} tabs, {sum(len(rows) - 1 for rows in tabs.values())} rows, "
+          f"{args.latency * 1000:.0f} ms simulated latency")
+    for label, (_, requests, elapsed) in results.items():
+        print(f"  {label:<9} {requests} requests  {elapsed * 1000:8.1f} ms")
+
+    if results["per-tab"][0] != results["batchGet"][0]:
+        print("  MISMATCH")
+        sys.exit(1)
+    print("  rows identical")
+
+
+if __name__ == "__main__":
+    main()
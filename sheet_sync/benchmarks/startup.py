@@ -0,0 +1,76 @@
+"""
+Import-time profile for the sheet_sync entry point.
+
+Imports resources.inventory in fresh interpreters with -X importtime and
+reports the median total, the slowest packages it pulls in (cumulative,
+first level below the entry point) and whether any Google API client library
+was loaded. Runs served from the local store should never load them.
+
+Usage (from sheet_sync/):
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+SHEET_SYNC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINT = "resources.inventory"
+NETWORK_PACKAGES = ["googleapiclient", "google_auth_oauthlib", "google_auth_httplib2", "httplib2"]
+
+
+def profile():
+    """[(module, depth, cumulative µs)] for one fresh import of ENTRY_POINT, in -X importtime order"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", f"import {ENTRY_POINT}"],
+        cwd=SHEET_SYNC, capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), depth, int(cumulative)))
+    return modules
+
+
+def direct_imports(modules, index):
+    """Modules imported directly by modules[index]: its subtree is listed right before it"""
+    _, depth, _ = modules[index]
+    for name, child_depth, cumulative in reversed(modules[:index]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            yield name, cumulative
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters to profile (default: 10)")
+    parser.add_argument("--top", type=int, default=10, help="packages to list (default: 10)")
+    args = parser.parse_args()
+
+    totals = []
+    children = defaultdict(list)
+    for _ in range(args.runs):
+        modules = profile()
+        index = next(i for i, (name, _, _) in enumerate(modules) if name == ENTRY_POINT)
+        totals.append(modules[index][2])
+        for name, cumulative in direct_imports(modules, index):
+            children[name].append(cumulative)
+    loaded = [name for name in NETWORK_PACKAGES if any(module[0] == name for module in modules)]
+
+    print(f"import {ENTRY_POINT}: {statistics.median(totals) / 1000:.1f} ms (median of {args.runs})")
+    slowest = sorted(children.items(), key=lambda item: -statistics.median(item[1]))[:args.top]
+    for name, times in slowest:
+        print(f"  {name:<28} {statistics.median(times) / 1000:7.1f} ms")
+    print(f"  Google API clients loaded: {', '.join(loaded) if loaded else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
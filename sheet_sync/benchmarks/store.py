@@ -0,0 +1,103 @@
+"""
+Load-time benchmark for resources.store.Store against the old pickle blob.
+
+Stores synthetic sheet tabs (round-tripped through JSON first, so they share
+no objects, like googleapiclient output) both ways, then times loading every
+tab back. Fails unless the store loads identical rows faster than the pickle,
+and refuses a stored blob that references a global.
+
+Usage (from sheet_sync/):
+    python benchmarks/store.py
+    python benchmarks/store.py --rows 50000
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import synthetic
+from resources.store import Store, _table
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def refuses_globals(store_path):
+    """Whether rows() rejects a stored blob that references a global (os.getcwd)"""
+    store = Store(store_path)
+    table = next(iter(store.connection.execute("SELECT kind, name FROM sources")))
+    store.connection.execute(f"UPDATE {_table(*table)} SET rows = ?", (pickle.dumps(os.getcwd),))
+    try:
+        store.rows(*table)
+    except pickle.UnpicklingError:
+        return True
+    finally:
+        store.close()
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000, help="synthetic plant rows (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=10, help="timing rounds (default: 10)")
+    args = parser.parse_args()
+
+    raw_data = json.loads(json.dumps(synthetic.raw_data(args.rows)))
+
+    with tempfile.TemporaryDirectory() as workdir:
+        pickle_path = os.path.join(workdir, "raw_data.pickle")
+        store_path = os.path.join(workdir, "raw_data.sqlite3")
+
+        with open(pickle_path, "wb") as f:
+            pickle.dump(raw_data, f)
+        store = Store(store_path)
+        for tab, rows in raw_data.items():
+            store.put("sheet", tab, rows)
+        store.close()
+
+        def load_pickle():
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        def load_store():
+            store = Store(store_path)
+            rows = {tab: store.rows("sheet", tab) for tab in raw_data}
+            store.close()
+            return rows
+
+        from_pickle, pickle_s = timed(load_pickle, args.repeat)
+        from_store, store_s = timed(load_store, args.repeat)
+        sizes = os.path.getsize(pickle_path), os.path.getsize(store_path)
+        refused = refuses_globals(store_path)
+
+    print(f"{sum(map(len, raw_data.values()))} rows")
+    print(f"  pickle:  {pickle_s * 1000:8.1f} ms  {sizes[0] / 1e6:6.2f} MB")
+    print(f"  store:   {store_s * 1000:8.1f} ms  {sizes[1] / 1e6:6.2f} MB")
+
+    failures = []
+    if from_pickle != raw_data or from_store != raw_data:
+        failures.append("rows differ")
+    if store_s >= pickle_s:
+        failures.append("store loads slower than the pickle")
+    if not refused:
+        failures.append("store loaded a blob referencing a global")
+
+    if failures:
+        for failure in failures:
+            print(f"  FAILED: {failure}")
+        sys.exit(1)
+    print(f"  rows identical, store {pickle_s / store_s:.1f}x faster, globals refused")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Synthetic spreadsheet rows and Drive image listings for the benchmarks.
+
+raw_data() returns lists of rows shaped like SheetsClient.get_range() output
+(A:N, trailing blanks trimmed) whose categories and tags all resolve against
+Configuration, so a full Inventory run succeeds offline.
+"""
+
+import random
+
+GENERA = ["Acer", "Asclepias", "Echinacea", "Rudbeckia", "Salvia", "Monarda",
+          "Phlox", "Quercus", "Viburnum", "Ilex", "Cornus", "Itea"]
+EPITHETS = ["rubrum", "tuberosa", "purpurea", "hirta", "nemorosa", "fistulosa",
+            "paniculata", "alba", "virginica", "florida"]
+COMMON = ["Red Maple", "Butterfly Weed", "Purple Coneflower", "Black-eyed Susan", "Sage", "Bee Balm",
+          "Phlox", "White Oak", "Arrowwood", "Winterberry", "Dogwood", "Sweetspire"]
+PLANT_TAGS = ["rain garden", "pollinator", "Pollinators", "deer", "native", "Sun", "part-shade",
+              "part shade", "shade", "drought", "groundcover", "reg water", "full shade",
+              "drought tolerant", "part sun", "veggie"]
+VEGGIES = ["Tomato", "Pepper", "Basil", "Cucumber", "Sweet Pepper", "Cherry Tomato", "Thyme", "Kale"]
+HOUSEPLANT_TAGS = ["bright light", "indirect light", "sun", "shade", "part-shade", "low light",
+                   "bright direct light", "full sun if outside", "drought", "reg water", "houseplant",
+                   "full shade"]
+
+
+def _row(rng, sku, scientific_name, common_name, category, tags, pot):
+    row = [
+        sku, scientific_name, common_name, rng.choice(["", "https://example.com/a.jpg"]), category, tags,
+        rng.choice(["Zone 3-9", "Zone 5", ""]), rng.choice(["Likes sun", "Easy grower", ""]), pot,
+        rng.choice([4.99, 6, "", 8.5]), "", "", "", rng.choice(["A1", "", 3]),
+    ]
+    # the Sheets API drops trailing empty cells
+    while row and row[-1] == "" and rng.random() < 0.5:
+        row.pop()
+    return row
+
+
+def raw_data(n, seed=11):
+    """{"plants": rows, "veggies": rows, "houseplants": rows} with n plant rows."""
+    rng = random.Random(seed)
+
+    plants = []
+    for i in range(n):
+        category = rng.choice(["native", "tree", "shrub", "native, groundcover"])
+        tags = ", ".join(rng.sample(PLANT_TAGS, rng.randint(1, 4))) + rng.choice(["", "/ native", ","])
+        plants.append(_row(
+            rng, 1000 + i if rng.random() > .05 else "", f"{rng.choice(GENERA)} {rng.choice(EPITHETS)}",
+            rng.choice(COMMON), category, tags, rng.choice(["4\"", "gal", 1, ""]),
+        ))
+
+    veggies = []
+    for i in range(n // 2):
+        name = f"{rng.choice(VEGGIES)} {i}"
+        herb = "Basil" in name or "Thyme" in name
+        veggies.append(_row(
+            rng, 3000 + i, rng.choice(["Solanum lycopersicum", "Capsicum annuum", "Ocimum", "Brassica"]), name,
+            "herb" if herb else "veggie",
+            ", ".join(rng.sample(["sun", "pollinator", "reg water", "part-shade", "drought"], 2)), "3.5\"",
+        ))
+
+    houseplants = []
+    for i in range(n // 3):
+        houseplants.append(_row(
+            rng, 5000 + i, rng.choice(["Ficus lyrata", "Epipremnum aureum", "Monstera deliciosa", "Sansevieria"]),
+            rng.choice(["Fiddle Leaf", "Pothos", "Swiss Cheese", "Snake Plant"]) + f" {i}", "houseplant",
+            ", ".join(rng.sample(HOUSEPLANT_TAGS, 3)), "6\"",
+        ))
+
+    return {"plants": plants, "veggies": veggies, "houseplants": houseplants}
+
+
+def image_metadata(n, seed=11):
+    """DriveClient.list_files_in_folder()-shaped records for n images."""
+    rng = random.Random(seed)
+    images = []
+    for i in range(n):
+        name = f"{rng.choice(GENERA)} {rng.choice(EPITHETS)}_{rng.choice(COMMON + VEGGIES)} ({rng.randint(1, 3)}).jpg"
+        images.append({
+            "name": name.replace(" ", rng.choice([" ", "_"])),
+            "id": str(i),
+            "download": f"https://drive.example/{rng.randrange(n * 2)}",
+        })
+    return images
@@ -0,0 +1,190 @@
+"""
+Golden test and timing for the compiled variant tables.
+
+Builds SquareSpace rows the way Inventory.transform() loads them, from
+synthetic titles and random tag sets (including ones the post_loads reject),
+and requires the compiled post_load of each category to return exactly the
+rows, or raise exactly the error, of the hand-written post_load and variant
+clearing loop they replaced. Edge cases cover the json.dumps() keyword match:
+keywords in any field, in non-ASCII and escaped text, and in both cases.
+
+Usage (from sheet_sync/):
+    python benchmarks/variants.py
+    python benchmarks/variants.py --rows 20000 --repeat 10
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resources.configuration import Configuration
+from squarespace import SquareSpaceInventorySchema
+
+CONFIGURATION = Configuration()
+
+EDGE_TITLES = [
+    "Sweet Pepper", "TOMATO", "Pepper Tomato", "Tab\tomato", "Tab\tOMATO", "Line\nPepper", "İstanbul Tomato",
+    "Peppér", "Tomatö", "Quote\"pepper", "Back\\tomato", "ÉPEPPER", "pep per", "tom-ato", "",
+]
+
+
+def plant_post_load(plant):
+    output = []
+
+    categories = plant["categories"] + [
+        tag.replace(" ", "-") for tag in plant["tags"] if tag != "reg water"
+    ]
+    plant = {**plant, "categories": categories, "option_name_1": "Pot"}
+
+    if "tree" in plant["tags"] or "shrub" in plant["tags"]:
+        plant["product_page"] = "trees-and-shrubs"
+
+        output.append({**plant, "option_value_1": "gal", "price": 8.99})
+    else:
+        plant["product_page"] = "perennials"
+
+        output.append({**plant, "option_value_1": "4\"", "price": 4.99})
+        output.append({**plant, "option_value_1": "qt or 5\"", "price": 6.99})
+        output.append({**plant, "option_value_1": "gal", "price": 8.99})
+
+    return output
+
+
+def veggie_post_load(veggie):
+    output = []
+
+    match_string = json.dumps(veggie).lower()
+    match_pepper = re.search(r"pepper", match_string)
+    match_tomato = re.search(r"tomato", match_string)
+
+    veggie = dict(veggie)
+    if match_pepper and match_tomato:
+        raise Exception("What's a tomato pepper?")
+    elif match_pepper:
+        veggie["categories"] = veggie["categories"] + ["peppers"]
+    elif match_tomato:
+        veggie["categories"] = veggie["categories"] + ["tomatoes"]
+
+    if "veggie" in veggie["tags"] and "herb" in veggie["tags"]:
+        raise Exception("What's an herb veggie?")
+    elif "veggie" in veggie["tags"]:
+        veggie["product_page"] = "veggies"
+    elif"herb" in veggie["tags"]:
+        veggie["product_page"] = "herbs"
+    else:
+        raise Exception("This veggie isn't a veggie or herb.")
+
+    veggie["option_name_1"] = "Pot"
+
+    output.append({**veggie, "option_value_1": "3.5\"", "price": 2.99})
+    output.append({**veggie, "option_value_1": "4\"", "price": 3.99})
+
+    return output
+
+
+def houseplant_post_load(houseplant):
+    output = []
+
+    categories = houseplant["categories"] + [
+        tag.replace(" ", "-") for tag in houseplant["tags"]
+        if tag not in ("reg water", "drought", "houseplant")
+    ]
+
+    output.append({**houseplant, "categories": categories, "product_page": "houseplants"})
+
+    return output
+
+
+LEGACY_POST_LOADS = {"plants": plant_post_load, "veggies": veggie_post_load, "houseplants": houseplant_post_load}
+
+
+def legacy(post_load, row):
+    """post_load plus the variant clearing loop Inventory.transform() ran after it"""
+    post_load_data = post_load(row)
+    for i in range(1, len(post_load_data)):
+        for column in [
+            "product_type",
+            "product_page",
+            "product_url",
+            "title",
+            "description",
+            "categories",
+            "tags",
+            "visible",
+            "image_url",
+        ]:
+            post_load_data[i][column] = None
+    return post_load_data
+
+
+def loaded_rows(category, n, rng):
+    schema = SquareSpaceInventorySchema()
+    tags = getattr(CONFIGURATION, category)["tags"]["valid"]
+    titles = EDGE_TITLES + [f"{rng.choice(['Basil', 'Thyme', 'Kale', 'Aster'])} {i}" for i in range(n)]
+
+    rows = []
+    for i, title in enumerate(titles):
+        image_url = rng.choice([None, [f"https://example.com/{rng.choice(['a', 'tomato', 'pepper'])}.jpg"]])
+        rows.append(schema.load(dict(
+            title=title,
+            description=f"<p>{rng.choice(['Likes sun', 'Pepper-ish', title, ''])}, Zone {i % 9}</p>",
+            tags=rng.sample(tags, rng.randint(0, 4)),
+            image_url=image_url,
+        )))
+    return rows
+
+
+def outcome(post_load, row):
+    try:
+        return post_load(row)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000, help="synthetic rows per category (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds (default: 5)")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    failures = []
+    for category, legacy_post_load in LEGACY_POST_LOADS.items():
+        compiled = getattr(CONFIGURATION, category)["post_load"]
+        rows = loaded_rows(category, args.rows, rng)
+
+        snapshot = json.dumps(rows)
+        mismatches = [row["title"] for row in rows if outcome(compiled, row) != outcome(lambda r: legacy(legacy_post_load, r), row)]
+        if json.dumps(rows) != snapshot:
+            failures.append(f"{category}: a post_load mutated its input")
+        if mismatches:
+            failures.append(f"{category}: {len(mismatches)} rows differ, e.g. {mismatches[0]!r}")
+
+        valid = [row for row in rows if not isinstance(outcome(compiled, row), str)]
+        timings = {}
+        for label, post_load in [("legacy", lambda r: legacy(legacy_post_load, r)), ("compiled", compiled)]:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for row in valid:
+                    post_load(row)
+            timings[label] = (time.perf_counter() - start) / (args.repeat * len(valid))
+
+        print(f"{category} ({len(valid)} valid of {len(rows)} rows)")
+        print(f"  legacy:    {timings['legacy'] * 1e6:7.2f} µs/row")
+        print(f"  compiled:  {timings['compiled'] * 1e6:7.2f} µs/row  ({timings['legacy'] / timings['compiled']:.1f}x faster)")
+
+    if failures:
+        for failure in failures:
+            print(f"  FAILED: {failure}")
+        sys.exit(1)
+    print("rows and errors identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,42 @@
-import os
-import pickle
+import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-from googleapiclient.discovery import build
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+from auth import authorized_http, build_service
 
-from settings import GOOGLE_API_SCOPES
-
-# If modifying these scopes, delete the file token.pickle.
-SCOPES = GOOGLE_API_SCOPES
+PAGE_SIZE = 1000  # the files.list maximum
+WORKERS = 8
 
 
 class DriveClient:
-    def __init__(self):
-        creds = None
-        # The file token.pickle stores the user's access and refresh tokens, and is
-        # created automatically when the authorization flow completes for the first
-        # time.
-        if os.path.exists('token.pickle'):
-            with open('token.pickle', 'rb') as token:
-                creds = pickle.load(token)
-        # If there are no (valid) credentials available, let the user log in.
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    'drive_credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
-            # Save the credentials for the next run
-            with open('token.pickle', 'wb') as token:
-                pickle.dump(creds, token)
-
-        self.service = build('drive', 'v3', credentials=creds)
-
-    def list_files_in_folder(self, folder_id=None):
+    def __init__(self, service=None):
+        # An already built service (e.g. drive.fake.FakeDriveService) skips authorization
+        self.authorized = service is None
+        self.service = build_service('drive', 'v3') if service is None else service
+
+    def _http(self):
+        """
+        httplib2 connections aren't thread-safe, so each thread executes its
+        requests over its own authorized Http
+        """
+        return authorized_http() if self.authorized else None
+
+    def list_files_in_folder(self, folder_id=None, modified_after=None):
+        """
+        Lists a folder's files, or with modified_after (a Unix timestamp) only
+        those created, renamed or otherwise modified since then
+        """
+        query = [f"'{folder_id}' in parents"] if folder_id else []
+        if modified_after is not None:
+            since = datetime.datetime.fromtimestamp(modified_after, datetime.timezone.utc)
+            query.append(f"modifiedTime > '{since.strftime('%Y-%m-%dT%H:%M:%S')}'")
+
         page_token = None
         files = []
         while True:
-            response = self.service.files().list(q=f"'{folder_id}' in parents" if folder_id else None,
+            response = self.service.files().list(q=" and ".join(query) or None,
                                                   fields='nextPageToken, files(id, name, webContentLink)',
-                                                  pageToken=page_token).execute()
+                                                  pageSize=PAGE_SIZE,
+                                                  pageToken=page_token).execute(http=self._http())
             for file in response.get('files', []):
                 files.append({"name": file.get("name"), "id": file.get("id"), "download": file.get("webContentLink")})
             page_token = response.get('nextPageToken', None)
@@ -49,6 +45,21 @@ class DriveClient:
 
         return files
 
+    def list_files_in_folders(self, folders, workers=WORKERS):
+        """
+        Lists several folders concurrently. folders maps each folder ID to a
+        modified_after timestamp, or None for a full listing; returns
+        {folder_id: files}.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(folders)))) as pool:
+            listings = pool.map(lambda item: self.list_files_in_folder(*item), folders.items())
+            return dict(zip(folders, listings))
+
+    def get_modified_time(self, file_id):
+        """Last modification of a Drive file (e.g. a spreadsheet), as a Unix timestamp"""
+        response = self.service.files().get(fileId=file_id, fields='modifiedTime').execute(http=self._http())
+        return datetime.datetime.fromisoformat(response['modifiedTime'].replace('Z', '+00:00')).timestamp()
+
 
 def main():
     """Shows basic usage of the Drive v3 API.
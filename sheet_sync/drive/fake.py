@@ -0,0 +1,83 @@
+"""
+In-memory stand-in for the googleapiclient Drive v3 service.
+
+Supports the calls DriveClient makes: files().list() with "'<folder>' in
+parents" and "modifiedTime > '<RFC 3339>'" queries and page tokens, and
+files().get() for modifiedTime. Counts requests and can simulate latency;
+pass it as DriveClient(service=...) to run without credentials or network.
+"""
+
+import re
+import time
+import datetime
+import threading
+
+DEFAULT_PAGE_SIZE = 100  # files.list default when pageSize is omitted
+
+PARENT_QUERY = re.compile(r"'([^']+)' in parents")
+MODIFIED_QUERY = re.compile(r"modifiedTime > '([^']+)'")
+
+
+def _timestamp(rfc3339):
+    return datetime.datetime.fromisoformat(rfc3339.replace("Z", "+00:00")).replace(
+        tzinfo=datetime.timezone.utc
+    ).timestamp()
+
+
+def _rfc3339(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class FakeRequest:
+    def __init__(self, service, respond):
+        self.service = service
+        self.respond = respond
+
+    def execute(self, http=None, num_retries=0):
+        with self.service.lock:
+            self.service.requests += 1
+        time.sleep(self.service.latency)
+        return self.respond()
+
+
+class FakeDriveService:
+    def __init__(self, files, latency=0.0):
+        """
+        files: list of {"id", "name", "webContentLink", "parents", "modifiedTime"}
+        dicts, modifiedTime as a Unix timestamp
+        latency: seconds each request sleeps, to stand in for the round-trip
+        """
+        self.files_data = files
+        self.latency = latency
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def files(self):
+        return self
+
+    def list(self, q=None, fields=None, pageSize=None, pageToken=None, **kwargs):
+        def respond():
+            matches = self.files_data
+            for folder_id in PARENT_QUERY.findall(q or ""):
+                matches = [file for file in matches if folder_id in file["parents"]]
+            for since in MODIFIED_QUERY.findall(q or ""):
+                matches = [file for file in matches if file["modifiedTime"] > _timestamp(since)]
+
+            start = int(pageToken or 0)
+            end = start + (pageSize or DEFAULT_PAGE_SIZE)
+            response = {"files": [
+                {"id": file["id"], "name": file["name"], "webContentLink": file["webContentLink"]}
+                for file in matches[start:end]
+            ]}
+            if end < len(matches):
+                response["nextPageToken"] = str(end)
+            return response
+
+        return FakeRequest(self, respond)
+
+    def get(self, fileId, fields=None, **kwargs):
+        def respond():
+            file = next(file for file in self.files_data if file["id"] == fileId)
+            return {"modifiedTime": _rfc3339(file["modifiedTime"])}
+
+        return FakeRequest(self, respond)
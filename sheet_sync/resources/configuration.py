@@ -1,6 +1,4 @@
-import re
-import copy
-import json
+from resources.variants import compile_variants
 
 
 class Configuration:
@@ -8,6 +6,7 @@ class Configuration:
     def __init__(self):
         self.fuzzy_match_threshold = 95
         self.fuzzy_match_image_metadata_threshold = 75
+        self.store_max_age = 24 * 60 * 60  # seconds before --refresh re-pulls stored sheet data
         self.image_search_folders = {
             "Veggies": "1zrgXvPJl3E7QK70OINvRQq_dbpW_c9VT",
             "Trees and Shrubs": "1rVevYOv3WSjMCC_ZF-qYA5OyK1M3v59U",
@@ -17,6 +16,7 @@ class Configuration:
         }
 
         self.plants = {
+            "name": "plants",
             "title": "{scientific_name} ({common_name})",
             "tags": {
                 "valid": [
@@ -43,10 +43,20 @@ class Configuration:
                     "part sun": "part-shade",
                 },
             },
-            "post_load": self.plant_post_load,
+            "variants": {
+                "option_name": "Pot",
+                "product_pages": {"trees-and-shrubs": ["tree", "shrub"]},
+                "default_product_page": "perennials",
+                "pots": {
+                    "trees-and-shrubs": [("gal", 8.99)],
+                    "perennials": [("4\"", 4.99), ("qt or 5\"", 6.99), ("gal", 8.99)],
+                },
+                "tag_categories": {"exclude": ["reg water"]},
+            },
         }
 
         self.veggies = {
+            "name": "veggies",
             "title": "{common_name}",
             "tags": {
                 "valid": [
@@ -67,10 +77,24 @@ class Configuration:
                 "replace": {},
                 "exceptions": {},
             },
-            "post_load": self.veggie_post_load,
+            "variants": {
+                "option_name": "Pot",
+                "product_pages": {"veggies": ["veggie"], "herbs": ["herb"]},
+                "pots": {
+                    "veggies": [("3.5\"", 2.99), ("4\"", 3.99)],
+                    "herbs": [("3.5\"", 2.99), ("4\"", 3.99)],
+                },
+                "keyword_categories": {"peppers": "pepper", "tomatoes": "tomato"},
+                "errors": {
+                    "keyword_categories": "What's a tomato pepper?",
+                    "product_pages": "What's an herb veggie?",
+                    "default_product_page": "This veggie isn't a veggie or herb.",
+                },
+            },
         }
 
         self.houseplants = {
+            "name": "houseplants",
             "title": "{common_name} ({scientific_name})",
             "tags": {
                 "valid": [
@@ -102,101 +126,14 @@ class Configuration:
                     "full shade": "indirect light",
                 },
             },
-            "post_load": self.houseplant_post_load,
+            "variants": {
+                "default_product_page": "houseplants",
+                "pots": {"houseplants": []},
+                "tag_categories": {"exclude": ["reg water", "drought", "houseplant"]},
+            },
         }
 
-    @staticmethod
-    def plant_post_load(plant):
-        output = []
-
-        for tag in plant["tags"]:
-            if tag == "reg water":
-                continue
-            plant["categories"].append(tag.replace(" ", "-"))
-
-        plant["option_name_1"] = "Pot"
-
-        if "tree" in plant["tags"] or "shrub" in plant["tags"]:
-            plant["product_page"] = "trees-and-shrubs"
-
-            plant["option_value_1"] = "gal"
-            plant["price"] = 8.99
-
-            output.append(copy.deepcopy(plant))
-        else:
-            plant["product_page"] = "perennials"
-
-            plant["option_value_1"] = "4\""
-            plant["price"] = 4.99
-
-            output.append(copy.deepcopy(plant))
-
-            plant["option_value_1"] = "qt or 5\""
-            plant["price"] = 6.99
-
-            output.append(copy.deepcopy(plant))
-
-            plant["option_value_1"] = "gal"
-            plant["price"] = 8.99
-
-            output.append(copy.deepcopy(plant))
-
-        return output
-
-    @staticmethod
-    def veggie_post_load(veggie):
-        output = []
-
-        match_string = json.dumps(veggie).lower()
-        match_pepper = re.search(r"pepper", match_string)
-        match_tomato = re.search(r"tomato", match_string)
-
-        if match_pepper and match_tomato:
-            raise Exception("What's a tomato pepper?")
-        elif match_pepper:
-            veggie["categories"].append("peppers")
-        elif match_tomato:
-            veggie["categories"].append("tomatoes")
-
-        if "veggie" in veggie["tags"] and "herb" in veggie["tags"]:
-            raise Exception("What's an herb veggie?")
-        elif "veggie" in veggie["tags"]:
-            veggie["product_page"] = "veggies"
-        elif"herb" in veggie["tags"]:
-            veggie["product_page"] = "herbs"
-        else:
-            raise Exception("This veggie isn't a veggie or herb.")
-
-        veggie["option_name_1"] = "Pot"
-
-        veggie["option_value_1"] = "3.5\""
-        veggie["price"] = 2.99
-
-        output.append(copy.deepcopy(veggie))
-
-        veggie["option_value_1"] = "4\""
-        veggie["price"] = 3.99
-
-        output.append(copy.deepcopy(veggie))
-
-        return output
-
-    @staticmethod
-    def houseplant_post_load(houseplant):
-        output = []
-
-        for tag in houseplant["tags"]:
-            if tag == "reg water":
-                continue
-            elif tag == "drought":
-                continue
-            elif tag == "houseplant":
-                continue
-            houseplant["categories"].append(tag.replace(" ", "-"))
-
-        houseplant["product_page"] = "houseplants"
-
-
-        output.append(copy.deepcopy(houseplant))
-
-        return output
+        # Each variant table compiles once into the post_load building a
+        # product's SquareSpace rows (see resources/variants.py)
+        for section in [self.plants, self.veggies, self.houseplants]:
+            section["post_load"] = compile_variants(section["variants"])
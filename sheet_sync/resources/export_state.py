@@ -0,0 +1,61 @@
+"""
+What the last Squarespace export of each category was built from and what
+it contained.
+
+Per category the state keeps a fingerprint of its inputs (sheet tabs, Drive
+folders and pipeline code), a hash of every product's CSV rows keyed by SKU
+and title, and the title_map entries and categories it produced, so a
+category whose inputs are unchanged can be skipped and still be reported.
+"""
+
+import os
+import json
+
+DEFAULT_PATH = "data/export_state.json"
+STATE_VERSION = 1
+
+
+def product_key(sku, title):
+    return f"{sku}\t{title}"
+
+
+class ExportState:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = {}
+
+        # State written by another version is dropped, like the store's tables
+        self.categories = state["categories"] if state.get("version") == STATE_VERSION else {}
+
+    def inputs(self, name):
+        """Input fingerprint of a category's last export, or None"""
+        return self.categories.get(name, {}).get("inputs")
+
+    def products(self, name):
+        """{product key: hash} of a category's last export"""
+        return self.categories.get(name, {}).get("products", {})
+
+    def put(self, name, inputs, products, title_map, categories):
+        self.categories[name] = {
+            "inputs": inputs,
+            "products": products,
+            "title_map": [[*key, title] for key, title in title_map.items()],
+            "categories": {product_page: sorted(seen) for product_page, seen in categories.items()},
+        }
+
+    def restore(self, name):
+        """(title_map, categories) of a category's last export"""
+        category = self.categories[name]
+        title_map = {tuple(entry[:-1]): entry[-1] for entry in category["title_map"]}
+        categories = {product_page: set(seen) for product_page, seen in category["categories"].items()}
+        return title_map, categories
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": STATE_VERSION, "categories": self.categories}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
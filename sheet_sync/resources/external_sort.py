@@ -0,0 +1,48 @@
+import heapq
+import pickle
+import tempfile
+
+CHUNK_SIZE = 5000  # items held in memory per sorted run
+
+
+def _spill(run):
+    f = tempfile.TemporaryFile()
+    for item in run:
+        pickle.dump(item, f, pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+
+def _read(f):
+    with f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def external_sort(items, key, reverse=False, chunk_size=CHUNK_SIZE):
+    """
+    Sort items holding at most chunk_size of them in memory.
+
+    Consumes items immediately, spilling each full chunk to a temporary file
+    as a sorted run, and returns an iterator that merges the runs. Ties keep
+    their input order, like sorted(items, key=key, reverse=reverse).
+    """
+    runs = []
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            chunk.sort(key=key, reverse=reverse)
+            runs.append(_spill(chunk))
+            chunk = []
+
+    chunk.sort(key=key, reverse=reverse)
+    if not runs:
+        return iter(chunk)
+
+    # heapq.merge() takes ties from earlier iterables first, and earlier runs
+    # hold earlier input, so the merge is stable
+    return heapq.merge(*[_read(f) for f in runs], chunk, key=key, reverse=reverse)
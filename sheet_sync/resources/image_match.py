@@ -0,0 +1,250 @@
+"""
+Prebuilt fuzzy-match index for Drive image metadata.
+
+Inventory.match_image_metadata() used to score every image against every item
+with two fuzzywuzzy scorers. ImageMatchIndex preprocesses the image names once
+and, per query, only runs the real scorers on images whose upper bound can
+still reach the threshold:
+
+  * fuzz.ratio() is at most 2 * (shared characters) / (total length), so
+    token_sort_ratio candidates come from a length window over the sorted-token
+    strings and are then bounded by their character counts.
+  * token_set_ratio reaches 100 whenever one token set contains the other, so
+    images sharing a token with the query come from an inverted token index.
+    Images sharing none score ratio() of the two sorted unique-token strings,
+    which is bounded like token_sort_ratio.
+
+Sharing a token is not required for a high score (ratio() compares
+characters), so the inverted index alone would miss matches; the length
+windows cover the rest. match() returns exactly what the old brute-force
+extractBests() pass returned.
+"""
+
+import heapq
+
+from fuzzywuzzy import fuzz, utils
+
+LIMIT = 5  # extractBests() default, per scorer
+
+
+def _ratio_bound(matches, len1, len2):
+    """Upper bound on fuzz.ratio() for strings sharing at most `matches` characters."""
+    if not len1 or not len2:
+        return 0
+    return utils.intr(100 * (2.0 * matches / (len1 + len2)))
+
+
+# Character-count vectors: one slot per processed character, plus one shared
+# slot for anything else (min() of the pooled counts still bounds the overlap)
+_SLOTS = {char: i for i, char in enumerate(" abcdefghijklmnopqrstuvwxyz0123456789")}
+
+
+def _char_vector(s):
+    counts = [0] * (len(_SLOTS) + 1)
+    for char in s:
+        counts[_SLOTS.get(char, len(_SLOTS))] += 1
+    return tuple(counts)
+
+
+def _overlap(vector1, vector2):
+    """Upper bound on the characters two strings can have in common."""
+    return sum(map(min, vector1, vector2))
+
+
+def _joined_length(tokens):
+    """len(" ".join(tokens)) without building the string."""
+    return sum(map(len, tokens)) + len(tokens) - 1 if tokens else 0
+
+
+class ImageEntry:
+    __slots__ = ("key", "processed", "tokens", "sorted_len", "sorted_chars", "unique_len", "unique_chars")
+
+    def __init__(self, key, choice):
+        self.key = key
+        # Same preprocessing extractWithoutOrder() applies to each choice
+        self.processed = utils.full_process(choice, force_ascii=True)
+
+        tokens = self.processed.split()
+        sorted_string = " ".join(sorted(tokens))
+        unique_string = " ".join(sorted(set(tokens)))
+
+        self.tokens = frozenset(tokens)
+        self.sorted_len = len(sorted_string)
+        self.sorted_chars = _char_vector(sorted_string)
+        self.unique_len = len(unique_string)
+        self.unique_chars = _char_vector(unique_string)
+
+
+class ImageMatchIndex:
+    def __init__(self, image_metadata, threshold):
+        if threshold <= 0:
+            raise ValueError("ImageMatchIndex needs a positive threshold to prune candidates")
+        self.threshold = threshold
+
+        # Same choices dict the brute-force version built (later images win on duplicate keys)
+        choices = {image["download"]: image["cleaned_name"] for image in image_metadata}
+        self.entries = [ImageEntry(key, choice) for key, choice in choices.items()]
+
+        self.by_token = {}
+        self.by_sorted_len = {}
+        self.by_unique_len = {}
+        for i, entry in enumerate(self.entries):
+            for token in entry.tokens:
+                self.by_token.setdefault(token, []).append(i)
+            self.by_sorted_len.setdefault(entry.sorted_len, []).append(i)
+            self.by_unique_len.setdefault(entry.unique_len, []).append(i)
+
+        self.windows = {}
+
+    def _window(self, length):
+        """Lengths whose ratio() with a string of `length` can reach the threshold."""
+        if length not in self.windows:
+            lo = next(n for n in range(1, length + 1) if _ratio_bound(n, n, length) >= self.threshold)
+            hi = length
+            while _ratio_bound(length, length, hi + 1) >= self.threshold:
+                hi += 1
+            self.windows[length] = range(lo, hi + 1)
+        return self.windows[length]
+
+    def _length_groups(self, by_len, length, refine):
+        """One (bound, ids, refine) group per candidate length, bounded by length alone."""
+        return [
+            (_ratio_bound(min(n, length), n, length), by_len[n], refine)
+            for n in self._window(length) if n in by_len
+        ]
+
+    def _top(self, scorer, processed_query, groups):
+        """
+        Exact top LIMIT (score, index) pairs with score >= threshold, ranked like
+        heapq.nlargest() over the choices (score desc, then earlier choice first).
+
+        groups are (coarse_bound, ids, refine); each is only refined to per-image
+        bounds when it reaches the front of the queue, and the scorer only runs
+        while a bound can still make the top LIMIT.
+        """
+        queue = []
+        for bound, ids, refine in groups:
+            heapq.heappush(queue, (-bound, ids[0], len(queue), (ids, refine)))
+        seq = len(queue)
+
+        found = []
+        while queue:
+            bound, i, _, group = heapq.heappop(queue)
+            bound = -bound
+            if bound < self.threshold:
+                break
+            if len(found) == LIMIT and (bound, -i) < (found[-1][0], -found[-1][1]):
+                break
+
+            if group is not None:
+                ids, refine = group
+                for j in ids:
+                    refined = refine(j)
+                    if refined is not None:
+                        heapq.heappush(queue, (-refined, j, seq, None))
+                        seq += 1
+                continue
+
+            score = scorer(processed_query, self.entries[i].processed, full_process=False)
+            if score >= self.threshold:
+                found.append((score, i))
+                found.sort(key=lambda f: (-f[0], f[1]))
+                del found[LIMIT:]
+        return found
+
+    def _token_sort_candidates(self, query_tokens):
+        sorted_string = " ".join(sorted(query_tokens))
+        chars = _char_vector(sorted_string)
+
+        def refine(i):
+            entry = self.entries[i]
+            return _ratio_bound(_overlap(chars, entry.sorted_chars), len(sorted_string), entry.sorted_len)
+
+        return self._length_groups(self.by_sorted_len, len(sorted_string), refine)
+
+    def _token_set_candidates(self, query_tokens):
+        query_tokens = set(query_tokens)
+        shared = set()
+        for token in query_tokens:
+            shared.update(self.by_token.get(token, ()))
+
+        # Shared tokens: bounded by lengths, then refined with character counts
+        # of the two "<intersection> <remainder>" strings token_set_ratio compares
+        def refine_shared(i):
+            tokens = self.entries[i].tokens
+            sect = " ".join(sorted(query_tokens & tokens))
+            combined_1to2 = (sect + " " + " ".join(sorted(query_tokens - tokens))).strip()
+            combined_2to1 = (sect + " " + " ".join(sorted(tokens - query_tokens))).strip()
+            return max(
+                _ratio_bound(len(sect), len(sect), len(combined_1to2)),
+                _ratio_bound(len(sect), len(sect), len(combined_2to1)),
+                _ratio_bound(_overlap(_char_vector(combined_1to2), _char_vector(combined_2to1)),
+                             len(combined_1to2), len(combined_2to1)),
+            )
+
+        groups = []
+        for i in shared:
+            tokens = self.entries[i].tokens
+            sect = _joined_length(query_tokens & tokens)
+            rest_1to2 = _joined_length(query_tokens - tokens)
+            rest_2to1 = _joined_length(tokens - query_tokens)
+            len_1to2 = sect + (1 if rest_1to2 else 0) + rest_1to2
+            len_2to1 = sect + (1 if rest_2to1 else 0) + rest_2to1
+            groups.append((max(
+                _ratio_bound(sect, sect, len_1to2),
+                _ratio_bound(sect, sect, len_2to1),
+                _ratio_bound(min(len_1to2, len_2to1), len_1to2, len_2to1),
+            ), [i], refine_shared))
+
+        # No shared token: the score is ratio() of the sorted unique-token strings
+        unique_string = " ".join(sorted(query_tokens))
+        chars = _char_vector(unique_string)
+
+        def refine(i):
+            if i in shared:
+                return None
+            entry = self.entries[i]
+            return _ratio_bound(_overlap(chars, entry.unique_chars), len(unique_string), entry.unique_len)
+
+        return groups + self._length_groups(self.by_unique_len, len(unique_string), refine)
+
+    def _rank_all(self, scorer, processed_query):
+        scored = [(scorer(processed_query, entry.processed, full_process=False), i)
+                  for i, entry in enumerate(self.entries)]
+        return sorted(scored, key=lambda s: (-s[0], s[1]))[:LIMIT]
+
+    def match(self, query):
+        """
+        Return the download links of the images matching query, lowest score
+        first, or None. Same result as taking extractBests(limit=5) with
+        token_set_ratio then token_sort_ratio, keeping each image's best score,
+        dropping scores below the threshold and sorting by score.
+        """
+        processed_query = utils.full_process(query, force_ascii=True)
+        query_tokens = processed_query.split()
+        if not query_tokens:
+            # Both scorers give 100 to images whose names also process to "" and 0 otherwise
+            return [entry.key for entry in self.entries if not entry.processed][:LIMIT] or None
+
+        top_set = self._top(fuzz.token_set_ratio, processed_query, self._token_set_candidates(query_tokens))
+        top_sort = self._top(fuzz.token_sort_ratio, processed_query, self._token_sort_candidates(query_tokens))
+
+        # An image that only clears the threshold on token_sort_ratio keeps its
+        # token_set_ratio slot in the dedup order if it was in that top 5 with a
+        # lower score. That only happens when the top 5 isn't all above threshold.
+        set_ids = {i for _, i in top_set}
+        if len(top_set) < LIMIT and any(i not in set_ids for _, i in top_sort):
+            top_set = self._rank_all(fuzz.token_set_ratio, processed_query)
+
+        best = {}
+        for score, i in top_set + top_sort:
+            best[i] = max(score, best.get(i, 0))
+
+        matches = sorted(
+            [(score, i) for i, score in best.items() if score >= self.threshold],
+            key=lambda m: m[0],
+        )
+        if not matches:
+            return None
+
+        return [self.entries[i].key for _, i in matches]
@@ -1,24 +1,56 @@
 import re
 import os
 import csv
-import copy
+import json
 import pprint
-import pickle
+import time
+import hashlib
+import inspect
+import argparse
+import itertools
+import functools
 import marshmallow
-
-from fuzzywuzzy import fuzz, process
+from collections import Counter
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 
 from drive import DriveClient
-from sheets import SheetsClient, SheetsInventoryMeta, SheetsInventorySchema
-from squarespace import SquareSpaceInventorySchema, INVENTORY_HEADER
+from sheets import RowLoader, SheetsClient, SheetsInventoryMeta
+from squarespace import SquareSpaceInventorySchema, INVENTORY_HEADER, compile_row_encoder
 from resources.configuration import Configuration
+from resources.export_state import ExportState, product_key, DEFAULT_PATH as EXPORT_STATE_PATH
+from resources.external_sort import external_sort
+from resources.image_match import ImageMatchIndex
+from resources.store import Store, DEFAULT_PATH
+from resources.tags import TagResolver, SKIP
+from resources.variants import compile_variants
 
 CONFIGURATION = Configuration()
 FUZZY_MATCH_THRESHOLD = CONFIGURATION.fuzzy_match_threshold
 
+# Seconds subtracted from stored fetch times before asking Drive for files
+# modified since, in case our clock runs ahead of Drive's
+CLOCK_SKEW = 60
+
+
+@functools.cache
+def code_fingerprint():
+    """Hash of the code that shapes the exported rows; editing it invalidates every stored export"""
+    digest = hashlib.sha256()
+    for code in [
+        Inventory, Configuration, compile_variants, RowLoader, SheetsInventoryMeta, SquareSpaceInventorySchema,
+        compile_row_encoder, ImageMatchIndex, TagResolver,
+    ]:
+        with open(inspect.getsourcefile(code), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
 
 class Inventory:
-    def __init__(self):
+    def __init__(
+        self, refresh=False, max_age=CONFIGURATION.store_max_age, store_path=DEFAULT_PATH,
+        sheets_client=None, drive_client=None, jobs=None, full=False, export_state_path=EXPORT_STATE_PATH,
+    ):
         self.categories = {
             "perennials": set(),
             "trees-and-shrubs": set(),
@@ -29,6 +61,29 @@ class Inventory:
 
         self.title_map = {}
 
+        self.tag_resolver = TagResolver(
+            {
+                section["name"]: section["tags"]
+                for section in [CONFIGURATION.plants, CONFIGURATION.veggies, CONFIGURATION.houseplants]
+            },
+            FUZZY_MATCH_THRESHOLD,
+        )
+
+        # Raw tabs and folder listings are only pulled when missing from the
+        # local store, or with refresh when stale or changed
+        self.store = Store(store_path)
+        self.refresh = refresh
+        self.max_age = max_age
+        # API clients are built on first use unless given
+        self.sheets_client = sheets_client
+        self.drive_client = drive_client
+        # Processes syncing categories concurrently; None for one per category
+        self.jobs = jobs
+        # Categories are only synced again when their inputs changed since the
+        # export recorded in export_state, unless full
+        self.export_state = ExportState(export_state_path)
+        self.full = full
+
         print("Getting data... ", end="")
         self.get_data()
         print("Success!")
@@ -37,130 +92,202 @@ class Inventory:
         self.get_image_metadata()
         print("Success!")
 
-        print("Cleaning Image Metadata... ", end="")
-        self.image_metadata = self.clean_image_metadata(self.image_metadata_raw)
-        print("Success!")
-
-        print("Cleaning Plants... ", end="")
-        self.plants = self.clean(self.plants_raw)
-        print("Success!")
-
-        print("Cleaning Veggies... ", end="")
-        self.veggies = self.clean(self.veggies_raw)
-        print("Success!")
-
-        print("Cleaning Houseplants... ", end="")
-        self.houseplants = self.clean(self.houseplants_raw)
-        print("Success!")
-
-        print("Transforming Plants... ", end="")
-        self.plants = self.transform(self.plants, CONFIGURATION.plants)
-        print("Success!")
-
-        print("Transforming Veggies... ", end="")
-        self.veggies = self.transform(self.veggies, CONFIGURATION.veggies)
-        print("Success!")
-
-        print("Transforming Houseplants... ", end="")
-        self.houseplants = self.transform(self.houseplants, CONFIGURATION.houseplants)
-        print("Success!")
+        # Rows stream through clean -> transform -> write one at a time; only
+        # the sort by title in transform() buffers, in bounded sorted runs
+        categories = [
+            ("Plants", "plants", self.plants_raw, "data/plants.csv"),
+            ("Veggies", "veggies", self.veggies_raw, "data/veggies.csv"),
+            ("Houseplants", "houseplants", self.houseplants_raw, "data/houseplants.csv"),
+        ]
+        inputs = {name: self.input_fingerprint(name) for _, name, _, _ in categories}
+        due = [
+            (label, name, raw, file_name) for label, name, raw, file_name in categories
+            if self.full or not os.path.exists(file_name) or self.export_state.inputs(name) != inputs[name]
+        ]
+        results = {}
+
+        if due:
+            print("Cleaning Image Metadata... ", end="")
+            self.image_metadata = self.clean_image_metadata(self.image_metadata_raw)
+            print("Success!")
+
+            print("Indexing Image Metadata... ", end="")
+            self.image_index = ImageMatchIndex(
+                self.image_metadata, CONFIGURATION.fuzzy_match_image_metadata_threshold
+            )
+            print("Success!")
+
+        jobs = min(self.jobs or len(due), len(due))
+        if jobs == 1:
+            for label, name, raw, file_name in due:
+                print(f"Syncing {label}... ", end="")
+                results[name] = self.sync_category(name, raw, file_name, self.export_state.products(name))[:3]
+                print("Success!")
+        elif due:
+            print(f"Syncing {', '.join(label for label, *_ in due)} in {jobs} processes... ", end="")
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = {
+                    name: pool.submit(self.sync_category, name, raw, file_name, self.export_state.products(name))
+                    for _, name, raw, file_name in due
+                }
+                for name, future in futures.items():
+                    *results[name], tag_resolver = future.result()
+                    self.tag_resolver.merge(tag_resolver)
+            print("Success!")
+
+        # Merged in category order, so title_map.csv and the reports come out
+        # exactly as from a sequential run; unchanged categories are restored
+        # from the export state
+        self.title_map = {}
+        self.categories = {product_page: set() for product_page in self.categories}
+        for label, name, _, file_name in categories:
+            if name in results:
+                title_map, categories_seen, products = results[name]
+                self.export_state.put(name, inputs[name], products, title_map, categories_seen)
+            else:
+                print(f"{label} unchanged since the last export.")
+                title_map, categories_seen = self.export_state.restore(name)
+                # The previous delta is no longer news
+                self.clear_delta(file_name)
+            self.title_map.update(title_map)
+            for product_page, seen in categories_seen.items():
+                self.categories[product_page] |= seen
+
+        if due:
+            print("Writing Title Map... ", end="")
+            with open("title_map.csv", "w+") as f:
+                f.write("SKU\tMatch String\tPot\tTitle\n")
+                for (sku, scientific_name, common_name, pot), title in self.title_map.items():
+                    f.write(f"{str(sku)}\t{scientific_name} ({common_name})\t{pot}\t{title}".replace("\n", " ") + "\n")
+            print("Success!")
+
+            self.export_state.save()
 
-        print("Writing Plants... ", end="")
-        self.plants = self.write("data/plants.csv", self.plants)
-        print("Success!")
+        print("\nCategories:")
+        pprint.pprint(self.categories)
 
-        print("Writing Veggies... ", end="")
-        self.plants = self.write("data/veggies.csv", self.veggies)
-        print("Success!")
+        print("\nTag cache:")
+        print(self.tag_resolver.report())
+
+    def __getstate__(self):
+        # What a worker process needs for sync_category(); the store, export
+        # state, API clients and raw data stay here
+        return {
+            "categories": {product_page: set() for product_page in self.categories},
+            "title_map": {},
+            "tag_resolver": self.tag_resolver,
+            "image_index": self.image_index,
+        }
 
-        print("Writing Houseplants... ", end="")
-        self.plants = self.write("data/houseplants.csv", self.houseplants)
-        print("Success!")
+    def sync_category(self, name, raw, file_name, previous):
+        """
+        Cleans, transforms and writes one category, in this or a worker
+        process, into empty title_map and categories accumulators; returns
+        them, the product hashes written and the tag resolver. previous holds
+        the product hashes of the last export, for the delta file.
+        """
+        self.title_map = {}
+        self.categories = {product_page: set() for product_page in self.categories}
+        products = self.write(file_name, self.transform(self.clean(raw), getattr(CONFIGURATION, name)), previous)
+        return self.title_map, self.categories, products, self.tag_resolver
 
-        print("Writing Title Map... ", end="")
-        with open("title_map.csv", "w+") as f:
-            f.write("SKU\tMatch String\tPot\tTitle\n")
-            for (sku, scientific_name, common_name, pot), title in self.title_map.items():
-                f.write(f"{str(sku)}\t{scientific_name} ({common_name})\t{pot}\t{title}".replace("\n", " ") + "\n")
-        print("Success!")
+    def input_fingerprint(self, name):
+        """
+        Hash of everything a category's export is built from: its sheet tabs,
+        the image folders and the pipeline code. Uses the content hashes the
+        store already keeps, so nothing is reloaded to compute it.
+        """
+        sources = [("sheet", sheet) for sheet in getattr(SheetsInventoryMeta, f"{name}_sheet")]
+        sources += [("folder", folder_id) for folder_id in CONFIGURATION.image_search_folders.values()]
+        content_hashes = [self.store.meta(kind, source)[1] for kind, source in sources]
+        return hashlib.sha256(json.dumps([code_fingerprint(), content_hashes]).encode()).hexdigest()
 
-        print("\nCategories:")
-        pprint.pprint(self.categories)
+    def due_sources(self, kind, names, modified_at=None):
+        """
+        Sources to pull: those missing from the store and, with refresh, those
+        fetched more than max_age seconds ago or before modified_at()
+        """
+        due = []
+        for name in names:
+            meta = self.store.meta(kind, name)
+            if meta is None:
+                due.append(name)
+            elif self.refresh:
+                fetched_at = meta[0]
+                if time.time() - fetched_at > self.max_age or (modified_at and modified_at() > fetched_at):
+                    due.append(name)
+        return due
 
     def get_data(self):
         """
         Pulls raw Plants, Veggies, and Houseplants data
         """
+        sheets = SheetsInventoryMeta.plants_sheet + SheetsInventoryMeta.veggies_sheet + SheetsInventoryMeta.houseplants_sheet
 
-        # pull data from pickled store if available
-        if os.path.exists("raw_data.pickle"):
-            print("from pickled store... ", end="")
-            with open("raw_data.pickle", "rb") as f:
-                data = pickle.load(f)
-
-                self.plants_raw = data["plants"]
-                self.veggies_raw = data["veggies"]
-                self.houseplants_raw = data["houseplants"]
-
-            return
-
-        print("from online spreadsheet... ", end="")
-        client = SheetsClient()
-
-        self.plants_raw = []
-        for sheet in SheetsInventoryMeta.plants_sheet:
-            self.plants_raw += client.get_range(
-                os.environ["PLANT_SALE_INVENTORY_SPREADSHEET_ID"],
-                "!".join([f"'{sheet}'", SheetsInventoryMeta.spreadsheet_range])
-            )
-
-        self.veggies_raw = []
-        for sheet in SheetsInventoryMeta.veggies_sheet:
-            self.veggies_raw += client.get_range(
-                os.environ["PLANT_SALE_INVENTORY_SPREADSHEET_ID"],
-                "!".join([f"'{sheet}'", SheetsInventoryMeta.spreadsheet_range])
+        # Tabs can't be checked one by one, but one Drive lookup tells whether
+        # the spreadsheet changed at all since a tab was fetched
+        modified_at = functools.cache(
+            lambda: (self.drive_client or DriveClient()).get_modified_time(
+                os.environ["PLANT_SALE_INVENTORY_SPREADSHEET_ID"]
             )
+        )
 
-        self.houseplants_raw = []
-        for sheet in SheetsInventoryMeta.houseplants_sheet:
-            self.houseplants_raw += client.get_range(
-                os.environ["PLANT_SALE_INVENTORY_SPREADSHEET_ID"],
-                "!".join([f"'{sheet}'", SheetsInventoryMeta.spreadsheet_range])
+        due = self.due_sources("sheet", sheets, modified_at)
+        if due:
+            print(f"from online spreadsheet ({len(due)} of {len(sheets)} tabs)... ", end="")
+            client = self.sheets_client or SheetsClient()
+            tabs = client.get_ranges(
+                os.environ["PLANT_SALE_INVENTORY_SPREADSHEET_ID"], due, SheetsInventoryMeta.spreadsheet_range
             )
+            changed = sum(self.store.put("sheet", sheet, rows) for sheet, rows in tabs.items())
+            print(f"{changed} changed... ", end="")
+        else:
+            print("from local store... ", end="")
 
-        with open("raw_data.pickle", "wb+") as f:
-            pickle.dump({
-                "plants": self.plants_raw,
-                "veggies": self.veggies_raw,
-                "houseplants": self.houseplants_raw,
-            }, f)
+        self.plants_raw = [row for sheet in SheetsInventoryMeta.plants_sheet for row in self.store.rows("sheet", sheet)]
+        self.veggies_raw = [row for sheet in SheetsInventoryMeta.veggies_sheet for row in self.store.rows("sheet", sheet)]
+        self.houseplants_raw = [
+            row for sheet in SheetsInventoryMeta.houseplants_sheet for row in self.store.rows("sheet", sheet)
+        ]
 
     def get_image_metadata(self):
         """
-        Pulls image metadata from Drive folder
+        Pulls image metadata from Drive folders
         """
-
-        # pull data from pickled store if available
-        if os.path.exists("raw_image_metadata.pickle"):
-            print("from pickled store... ", end="")
-            with open("raw_image_metadata.pickle", "rb") as f:
-                data = pickle.load(f)
-                self.image_metadata_raw = data["image_metadata"]
-
-            return
-
-        print("from online folder... ", end="")
-        client = DriveClient()
-
-        self.image_metadata_raw = []
-        for folder_id in CONFIGURATION.image_search_folders.values():
-            self.image_metadata_raw += client.list_files_in_folder(folder_id=folder_id)   
-
-        with open("raw_image_metadata.pickle", "wb+") as f:
-            pickle.dump({"image_metadata": self.image_metadata_raw}, f)
+        folders = list(CONFIGURATION.image_search_folders.values())
+
+        # Missing and stale folders get a full listing. With refresh, the rest
+        # only list files modified since their last full listing, which keeps
+        # its fetch time so deletions still surface once it goes stale.
+        listings = {folder_id: None for folder_id in self.due_sources("folder", folders)}
+        full = len(listings)
+        if self.refresh:
+            for folder_id in folders:
+                if folder_id not in listings:
+                    listings[folder_id] = self.store.meta("folder", folder_id)[0] - CLOCK_SKEW
+
+        if listings:
+            print(f"from online folders ({full} full, {len(listings) - full} incremental)... ", end="")
+            client = self.drive_client or DriveClient()
+            started = time.time()
+            changed = 0
+            for folder_id, files in client.list_files_in_folders(listings).items():
+                if listings[folder_id] is None:
+                    changed += self.store.put("folder", folder_id, files, fetched_at=started)
+                else:
+                    # Modified files replace their stored entry, new ones are appended
+                    merged = {image["id"]: image for image in self.store.rows("folder", folder_id)}
+                    merged.update((image["id"], image) for image in files)
+                    changed += self.store.put(
+                        "folder", folder_id, list(merged.values()), fetched_at=self.store.meta("folder", folder_id)[0]
+                    )
+            print(f"{changed} changed... ", end="")
+        else:
+            print("from local store... ", end="")
+
+        self.image_metadata_raw = [image for folder_id in folders for image in self.store.rows("folder", folder_id)]
 
     def clean_image_metadata(self, data):
-        data = copy.deepcopy(data)
         cleaned_data = []
 
         for image in data:
@@ -180,89 +307,52 @@ class Inventory:
 
     def match_image_metadata(self, item):
         query = f"{item['scientific_name']} {item['common_name']}".lower()
-        choices = {image["download"]: image["cleaned_name"] for image in self.image_metadata}
-
-        matches = []
-        for scorer in [
-            fuzz.token_set_ratio,
-            fuzz.token_sort_ratio,
-        ]:
-            matches += process.extractBests(query, choices, scorer=scorer, limit=5)
-
-        # deduplicate matches from different scorers
-        best_matches = {}
-        for match in matches:
-            best_matches[match[2]] = [
-                match[0],
-                max(match[1], best_matches.get(match[-1], [0, 0, 0])[1]),
-                match[2]
-            ]
-        matches = list(best_matches.values())
-
-        matches = filter(lambda match: match[1] >= CONFIGURATION.fuzzy_match_image_metadata_threshold, matches)
-        matches = sorted(matches, key=lambda item: item[1])
-        matches = [match[2] for match in matches]
-
-        if not matches:
-            return None
-
-        return matches
+        return self.image_index.match(query)
 
     def clean(self, data):
-        data = copy.deepcopy(data)
-        schema = SheetsInventorySchema()
-        cleaned_data = []
-
-        for i, row in enumerate(data):
-            try:
-                # convert '' to None and pad missing values at end
-                row = [
-                    item if item != "" else None
-                    for item in row + [""] * (SheetsInventoryMeta.number_of_columns - len(row))
-                ]
-
-                # skip rows without SKUs
-                if row[SheetsInventoryMeta.sku.index] is None: 
-                    continue
-
-                cleaned_data.append(schema.load({
-                    "sku": row[SheetsInventoryMeta.sku.index],
-                    "scientific_name": row[SheetsInventoryMeta.scientific_name.index],
-                    "common_name": row[SheetsInventoryMeta.common_name.index],
-                    "image_url": row[SheetsInventoryMeta.image_url.index],
-                    "category": row[SheetsInventoryMeta.category.index],
-                    "tags": row[SheetsInventoryMeta.tags.index],
-                    "zone": row[SheetsInventoryMeta.zone.index],
-                    "info": row[SheetsInventoryMeta.info.index],
-                    "pot": str(row[SheetsInventoryMeta.pot.index]),
-                    "price": row[SheetsInventoryMeta.price.index],
-                    "location": str(row[SheetsInventoryMeta.location.index]),
-                }))
-            except Exception as e:
-                print(i, row)
-                raise e
+        """
+        Yields an InventoryItem per valid spreadsheet row with a SKU. Invalid
+        rows are all reported, and raised together once data is exhausted.
+        """
+        loader = RowLoader()
+        yield from loader.load(data)
 
-        return cleaned_data
+        if loader.errors:
+            print("\n" + loader.report())
+            raise marshmallow.ValidationError({i: messages for i, (_, messages) in sorted(loader.errors.items())})
 
     def transform(self, data, transform_configuration):
-        transformed_data = []
+        """
+        Yields (product key, SquareSpace rows) per item of data, in descending
+        title order. The sort and the tag priming below consume all of data
+        before the first product.
+        """
         schema = SquareSpaceInventorySchema()
+        tag_strings = Counter()
 
-        sorted_data = sorted(
-            copy.deepcopy(data),
-            key=lambda item: transform_configuration["title"].format(**item),
-            reverse=True,
-        )
+        def titled(items):
+            for item in items:
+                if item["category"] is not None and item["tags"] is not None:
+                    tag_strings[item["category"] + "," + item["tags"]] += 1
+                yield transform_configuration["title"].format(**item), item
+
+        # Cleaned rows are immutable InventoryItems, so the sorted runs can share them
+        sorted_data = external_sort(titled(data), key=itemgetter(0), reverse=True)
 
-        for item in sorted_data:
+        # Resolve every distinct tag up front so all unresolved tags are reported
+        # before the first one aborts the run below
+        self.tag_resolver.prime(transform_configuration["name"], tag_strings.elements())
+        if self.tag_resolver.unresolved:
+            print("\n" + self.tag_resolver.report())
+
+        for title, item in sorted_data:
             try:
-                title = transform_configuration["title"].format(**item)
                 self.title_map[(item["sku"], item["scientific_name"], item["common_name"], item["pot"])] = title
 
                 description = f"<p>{item['info']}, {item['zone']}</p>"
                 tags = self.transform_tags(
                     item["category"] + "," + item["tags"],
-                    transform_configuration["tags"]
+                    transform_configuration["name"]
                 )
                 image_url = self.match_image_metadata(item)
 
@@ -270,67 +360,115 @@ class Inventory:
                     title=title, description=description, tags=tags, image_url=image_url,
                 ))
 
-                post_load_data = transform_configuration["post_load"](copy.deepcopy(transformed_item))
-                for i in range(1, len(post_load_data)):
-                    for column in [
-                        "product_type",
-                        "product_page",
-                        "product_url",
-                        "title",
-                        "description",
-                        "categories",
-                        "tags",
-                        "visible",
-                        "image_url",
-                    ]:
-                        post_load_data[i][column] = None
+                # post_load never mutates its input, and leaves the product-level
+                # columns of every variant after the first empty
+                post_load_data = transform_configuration["post_load"](transformed_item)
 
                 self.categories[post_load_data[0]["product_page"]] |= set(post_load_data[0]["categories"])
 
-                transformed_data += post_load_data
+                yield product_key(item["sku"], title), post_load_data
             except Exception as e:
                 pprint.pprint(item)
                 raise e
 
-        return transformed_data
-
-    def transform_tags(self, candidate_tags, tag_configuration):
+    def transform_tags(self, candidate_tags, section):
         transformed_tags = set()
 
-        candidate_tags = re.split(r"\s*[,/]+\s*", candidate_tags)
-
-        for tag in candidate_tags:
-            if tag == "":
-                continue
-
-            match = process.extractOne(tag, tag_configuration["valid"])
-            exclude_match = process.extractOne(tag, tag_configuration["exclude"])
-            if match is not None and match[1] >= FUZZY_MATCH_THRESHOLD:
-                transformed_tags.add(tag_configuration["replace"].get(match[0], match[0]))
-            elif exclude_match is not None and exclude_match[1] >= FUZZY_MATCH_THRESHOLD:
+        for tag in TagResolver.split(candidate_tags):
+            resolved = self.tag_resolver.resolve(section, tag)
+            if resolved is SKIP:
                 continue
-            elif tag_configuration["exceptions"].get(tag):
-                transformed_tags.add(tag_configuration["exceptions"].get(tag))
-            else:
+            elif resolved is None:
                 raise Exception(f"No tag match found for '{tag}'.")
+            transformed_tags.add(resolved)
 
-        return list(transformed_tags)
-
-    def write(self, file_name, data):
-        schema = SquareSpaceInventorySchema(many=True)
+        # Sorted, so a product's Tags and Categories cells, and with them its
+        # delta hash, don't depend on the process's string hash seed
+        return sorted(transformed_tags)
 
-        serialized_data = schema.dump(copy.deepcopy(data))
-        with open(file_name, 'w+', newline='') as f:
-            fieldnames = list(SquareSpaceInventorySchema._declared_fields.keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+    @staticmethod
+    def delta_file_names(file_name):
+        """The .delta.csv and .removed.csv written alongside file_name"""
+        base_name = os.path.splitext(file_name)[0]
+        return base_name + ".delta.csv", base_name + ".removed.csv"
 
-            writer.writerow(INVENTORY_HEADER)
-            for item in serialized_data:
-                writer.writerow(item)
+    def write(self, file_name, data, previous=None):
+        """
+        Encodes and writes the products data yields into file_name, the new
+        and changed ones (whose rows hash differently from previous, the
+        {product key: hash} of the last export) into its .delta.csv, and the
+        SKUs and titles of products that are gone into its .removed.csv.
+        Each file is written to a temporary file first and replaced once every
+        product is written. Returns {product key: hash} for this export.
+        """
+        fieldnames, encode = compile_row_encoder(SquareSpaceInventorySchema)
+        header = [INVENTORY_HEADER[name] for name in fieldnames]
+        previous = previous or {}
+        products = {}
+
+        delta_file_name, removed_file_name = self.delta_file_names(file_name)
+        file_names = [file_name, delta_file_name, removed_file_name]
+
+        try:
+            with open(file_name + ".tmp", 'w+', newline='') as f, open(delta_file_name + ".tmp", 'w+', newline='') as delta_f:
+                writer = csv.writer(f)
+                delta_writer = csv.writer(delta_f)
+
+                writer.writerow(header)
+                delta_writer.writerow(header)
+                # data is sorted by title only, so products sharing a key are
+                # contiguous within their title but may interleave with others
+                for _, group in itertools.groupby(data, key=lambda product: product[0].split("\t", 1)[1]):
+                    rows_by_key = {}
+                    for key, variants in group:
+                        rows = [encode(row) for row in variants]
+                        writer.writerows(rows)
+                        rows_by_key.setdefault(key, []).extend(rows)
+
+                    for key, rows in rows_by_key.items():
+                        products[key] = hashlib.sha256(json.dumps(rows).encode()).hexdigest()
+                        if previous.get(key) != products[key]:
+                            delta_writer.writerows(rows)
+
+            with open(removed_file_name + ".tmp", 'w+', newline='') as f:
+                writer = csv.writer(f)
+
+                writer.writerow(["SKU", "Title"])
+                writer.writerows(key.split("\t", 1) for key in previous if key not in products)
+
+            for name in file_names:
+                os.replace(name + ".tmp", name)
+        except BaseException:
+            for name in file_names:
+                if os.path.exists(name + ".tmp"):
+                    os.remove(name + ".tmp")
+            raise
+
+        return products
+
+    def clear_delta(self, file_name):
+        """Leaves the .delta.csv and .removed.csv of an unchanged category with headers only"""
+        fieldnames, _ = compile_row_encoder(SquareSpaceInventorySchema)
+        delta_file_name, removed_file_name = self.delta_file_names(file_name)
+        for name, header in [(delta_file_name, [INVENTORY_HEADER[name] for name in fieldnames]),
+                             (removed_file_name, ["SKU", "Title"])]:
+            with open(name, 'w+', newline='') as f:
+                csv.writer(f).writerow(header)
 
 
 def main():
-    inventory = Inventory()
+    parser = argparse.ArgumentParser(description="Builds the SquareSpace inventory CSVs from the plant sale spreadsheet")
+    parser.add_argument("--refresh", action="store_true",
+                        help="re-pull stored tabs and folders that are stale or changed since they were fetched")
+    parser.add_argument("--max-age", type=float, default=CONFIGURATION.store_max_age / 3600,
+                        help="hours after which --refresh re-pulls a stored tab or folder (default: %(default)g)")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="processes syncing categories concurrently (default: one per category; 1 runs in-process)")
+    parser.add_argument("--full", action="store_true",
+                        help="sync every category, even those unchanged since the last export")
+    args = parser.parse_args()
+
+    inventory = Inventory(refresh=args.refresh, max_age=args.max_age * 3600, jobs=args.jobs, full=args.full)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,119 @@
+"""
+Local SQLite store for raw spreadsheet tabs and Drive folder listings.
+
+Each source (a sheet tab or a Drive folder) gets its own table holding its
+rows as one blob, plus a line in the sources table with when it was fetched
+and a hash of its content. Re-storing a source whose content hash is
+unchanged only bumps its fetch time.
+
+The blob is a pickle of plain lists, dicts, strings and numbers, with equal
+strings stored once (sheet cells repeat a lot), which loads about twice as
+fast as the old whole-file pickle. It is read back by an unpickler that
+refuses every global, so a tampered store can't make loading run code.
+"""
+
+import io
+import json
+import time
+import pickle
+import hashlib
+import sqlite3
+import contextlib
+
+DEFAULT_PATH = "raw_data.sqlite3"
+SCHEMA_VERSION = 2
+
+_PLAIN = (int, float, bool, type(None))
+
+
+class _RowUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Stored rows can't reference {module}.{name}")
+
+
+def _shared(value, strings):
+    """value with equal strings replaced by one object, so the pickle stores each once"""
+    if isinstance(value, str):
+        return strings.setdefault(value, value)
+    if isinstance(value, (list, tuple)):
+        # Tuples come back as lists, as they did through JSON
+        return [_shared(item, strings) for item in value]
+    if isinstance(value, dict):
+        return {_shared(key, strings): _shared(item, strings) for key, item in value.items()}
+    if isinstance(value, _PLAIN):
+        return value
+    raise TypeError(f"Can't store {type(value).__name__} values")
+
+
+def _quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _table(kind, name):
+    return _quote(f"{kind}:{name}")
+
+
+class Store:
+    def __init__(self, path=DEFAULT_PATH):
+        # Autocommit mode, so transaction() also covers DROP/CREATE TABLE
+        self.connection = sqlite3.connect(path, isolation_level=None)
+
+        # A store written by another schema version is a cache like any other: start over
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with self.transaction():
+                tables = self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+                for (table,) in tables:
+                    self.connection.execute(f"DROP TABLE {_quote(table)}")
+                self.connection.execute(
+                    "CREATE TABLE sources ("
+                    "kind TEXT NOT NULL, name TEXT NOT NULL, fetched_at REAL NOT NULL, "
+                    "content_hash TEXT NOT NULL, row_count INTEGER NOT NULL, PRIMARY KEY (kind, name))"
+                )
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextlib.contextmanager
+    def transaction(self):
+        self.connection.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def meta(self, kind, name):
+        """(fetched_at, content_hash) for a stored source, or None"""
+        return self.connection.execute(
+            "SELECT fetched_at, content_hash FROM sources WHERE kind = ? AND name = ?", (kind, name)
+        ).fetchone()
+
+    def rows(self, kind, name):
+        """The stored rows of a source, in their original order"""
+        (blob,) = self.connection.execute(f"SELECT rows FROM {_table(kind, name)}").fetchone()
+        return _RowUnpickler(io.BytesIO(blob)).load()
+
+    def put(self, kind, name, rows, fetched_at=None):
+        """Stores rows for a source; returns whether its content changed"""
+        texts = [json.dumps(row, ensure_ascii=False, separators=(",", ":")) for row in rows]
+        content_hash = hashlib.sha256("\n".join(texts).encode()).hexdigest()
+
+        previous = self.meta(kind, name)
+        changed = previous is None or previous[1] != content_hash
+
+        with self.transaction():
+            if changed:
+                table = _table(kind, name)
+                self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+                self.connection.execute(f"CREATE TABLE {table} (rows BLOB NOT NULL)")
+                blob = pickle.dumps(_shared(rows, {}), pickle.HIGHEST_PROTOCOL)
+                self.connection.execute(f"INSERT INTO {table} VALUES (?)", (blob,))
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)",
+                (kind, name, time.time() if fetched_at is None else fetched_at, content_hash, len(texts)),
+            )
+
+        return changed
+
+    def close(self):
+        self.connection.close()
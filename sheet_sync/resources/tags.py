@@ -0,0 +1,94 @@
+import re
+from collections import Counter
+
+from fuzzywuzzy import process
+
+SPLIT_TAGS = re.compile(r"\s*[,/]+\s*")
+
+
+class _Skip:
+    """Resolution for tags matching a section's "exclude" list"""
+
+    def __reduce__(self):
+        # Unpickles as the module's SKIP, so `is SKIP` holds across processes
+        return "SKIP"
+
+
+SKIP = _Skip()
+
+
+class TagResolver:
+    """
+    Resolves raw spreadsheet tags against the Configuration tag sections.
+
+    The spreadsheet reuses a few dozen raw tag strings across thousands of
+    rows, so each (section, raw tag) pair is fuzzy-matched once and cached.
+    prime() resolves every distinct tag of a run up front, which lets report()
+    list all unresolved tags before transform_tags() stops on the first one.
+    """
+
+    def __init__(self, sections, threshold):
+        self.sections = sections
+        self.threshold = threshold
+        self.cache = {}
+        self.lookups = Counter()
+        self.misses = Counter()
+        self.unresolved = Counter()
+
+    @staticmethod
+    def split(candidate_tags):
+        return [tag for tag in SPLIT_TAGS.split(candidate_tags) if tag != ""]
+
+    def _resolve(self, section, tag):
+        """Tag value, SKIP, or None if the tag matches nothing."""
+        tag_configuration = self.sections[section]
+
+        match = process.extractOne(tag, tag_configuration["valid"])
+        exclude_match = process.extractOne(tag, tag_configuration["exclude"])
+        if match is not None and match[1] >= self.threshold:
+            return tag_configuration["replace"].get(match[0], match[0])
+        elif exclude_match is not None and exclude_match[1] >= self.threshold:
+            return SKIP
+        elif tag_configuration["exceptions"].get(tag):
+            return tag_configuration["exceptions"].get(tag)
+        return None
+
+    def resolve(self, section, tag):
+        key = (section, tag)
+        self.lookups[section] += 1
+        if key not in self.cache:
+            self.misses[section] += 1
+            self.cache[key] = self._resolve(section, tag)
+        return self.cache[key]
+
+    def prime(self, section, candidate_tag_strings):
+        """Resolve every distinct tag in candidate_tag_strings in one batch."""
+        counts = Counter(tag for tags in candidate_tag_strings for tag in self.split(tags))
+        for tag, count in counts.items():
+            key = (section, tag)
+            if key not in self.cache:
+                self.misses[section] += 1
+                self.cache[key] = self._resolve(section, tag)
+            if self.cache[key] is None:
+                self.unresolved[key] += count
+
+    def merge(self, other):
+        """Folds in the cache and counts of a resolver that ran in another process"""
+        self.cache.update(other.cache)
+        self.lookups.update(other.lookups)
+        self.misses.update(other.misses)
+        self.unresolved.update(other.unresolved)
+
+    def report(self):
+        lines = []
+        for section, lookups in self.lookups.items():
+            hits = max(lookups - self.misses[section], 0)
+            distinct = sum(1 for cached_section, _ in self.cache if cached_section == section)
+            lines.append(
+                f"  {section}: {lookups} lookups, {hits / lookups:.1%} cache hits, {distinct} distinct tags"
+            )
+        if self.unresolved:
+            lines.append("Unresolved tags:")
+            for (section, tag), count in self.unresolved.items():
+                lines.append(f"  {section}: '{tag}' ({count} uses)")
+        return "\n".join(lines)
@@ -0,0 +1,123 @@
+"""
+Compiles a category's declarative variant table into its post_load function.
+
+A table gives the option name ("Pot") and the (option value, price) pairs of
+each product page, the rules choosing the product page from a row's tags, and
+the rules adding categories: the row's own tags, or a keyword appearing
+anywhere in the row. The compiled function builds the product's first row and
+one row per further variant straight from the loaded row, without mutating
+it; variant rows have the product-level columns cleared, since SquareSpace
+only reads those from a product's first row.
+
+    "variants": {
+        "option_name": "Pot",
+        "product_pages": {"trees-and-shrubs": ["tree", "shrub"]},  # any tag picks the page
+        "default_product_page": "perennials",  # otherwise; without one, no match is an error
+        "pots": {"trees-and-shrubs": [("gal", 8.99)], "perennials": [...]},  # first pot is the product row
+        "tag_categories": {"exclude": ["reg water"]},  # tags added as categories, spaces as dashes
+        "keyword_categories": {"peppers": "pepper"},  # category added when the keyword is in the row
+        "errors": {...},  # messages for ambiguous keywords or product pages, or no product page
+    }
+"""
+
+from json.encoder import encode_basestring_ascii
+
+# Product-level columns, left empty on every row after a product's first
+PRODUCT_COLUMNS = [
+    "product_type",
+    "product_page",
+    "product_url",
+    "title",
+    "description",
+    "categories",
+    "tags",
+    "visible",
+    "image_url",
+]
+
+# Lowercased JSON text of everything but strings; numbers only add an "e"
+_NON_STRING_TEXT = "null true false nan infinity"
+
+
+def _keyword_matcher(keyword_categories):
+    """
+    Returns found(row), the categories whose keyword is in the lowercased
+    json.dumps(row), without serialising the whole row. Letter-only keywords
+    can't span a quote, so they only match within a key or string value,
+    escaped exactly as json.dumps() escapes it; joining those with quotes
+    lets one escaping call cover them all.
+    """
+    for keyword in keyword_categories.values():
+        if not (keyword.isascii() and keyword.isalpha() and keyword.islower()) or keyword in _NON_STRING_TEXT:
+            raise ValueError(f"Keyword '{keyword}' must be lowercase ASCII letters not found in JSON literals")
+
+    def found(row):
+        strings = list(row)
+        for value in row.values():
+            if value.__class__ is str:
+                strings.append(value)
+            elif value.__class__ is list:
+                # List fields of loaded rows only hold strings
+                strings += value
+        text = encode_basestring_ascii('"'.join(strings)).lower()
+        return [category for category, keyword in keyword_categories.items() if keyword in text]
+
+    return found
+
+
+def compile_variants(table):
+    """Returns post_load(row), the list of SquareSpace rows for one loaded product row"""
+    option_name = table.get("option_name")
+    page_of_tag = {tag: product_page for product_page, tags in table.get("product_pages", {}).items() for tag in tags}
+    default_product_page = table.get("default_product_page")
+    errors = table.get("errors", {})
+
+    tag_categories = table.get("tag_categories")
+    excluded_tags = frozenset(tag_categories["exclude"]) if tag_categories is not None else None
+    keyword_categories = table.get("keyword_categories")
+    found_keywords = _keyword_matcher(keyword_categories) if keyword_categories else None
+
+    # Per product page, the columns each row sets over the product row
+    cleared = dict.fromkeys(PRODUCT_COLUMNS)
+    pots = {
+        product_page: [{"option_value_1": value, "price": price} for value, price in pot_prices]
+        for product_page, pot_prices in table["pots"].items()
+    }
+    variant_columns = {
+        product_page: rows[:1] + [{**row, **cleared} for row in rows[1:]]
+        for product_page, rows in pots.items()
+    }
+
+    def post_load(row):
+        categories = row["categories"]
+        if found_keywords is not None:
+            found = found_keywords(row)
+            if len(found) > 1:
+                raise Exception(errors.get("keyword_categories", f"Keywords of {found} all in one row."))
+            categories = categories + found
+        if excluded_tags is not None:
+            categories = categories + [tag.replace(" ", "-") for tag in row["tags"] if tag not in excluded_tags]
+
+        product_page = None
+        if page_of_tag:
+            for tag in row["tags"]:
+                page = page_of_tag.get(tag)
+                if page is not None and page != product_page:
+                    if product_page is not None:
+                        raise Exception(errors.get("product_pages", f"Tags match product pages {product_page} and {page}."))
+                    product_page = page
+        if product_page is None:
+            if default_product_page is None:
+                raise Exception(errors.get("default_product_page", "Tags match no product page."))
+            product_page = default_product_page
+
+        product = {**row, "categories": categories, "product_page": product_page}
+        if option_name is not None:
+            product["option_name_1"] = option_name
+
+        columns = variant_columns[product_page]
+        if not columns:
+            return [product]
+        return list(map(product.__or__, columns))
+
+    return post_load
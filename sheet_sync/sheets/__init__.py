@@ -1,4 +1,5 @@
 from sheets.client import SheetsClient
-from sheets.schemas import SheetsInventoryMeta, SheetsInventorySchema
+from sheets.schemas import InventoryItem, SheetsInventoryMeta, SheetsInventorySchema
+from sheets.loader import RowLoader
 
-__all__ = [SheetsClient, SheetsInventoryMeta, SheetsInventorySchema]
+__all__ = [SheetsClient, InventoryItem, SheetsInventoryMeta, SheetsInventorySchema, RowLoader]
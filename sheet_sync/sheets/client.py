@@ -1,14 +1,4 @@
-import os
-import pickle
-
-from googleapiclient.discovery import build
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-
-from settings import GOOGLE_API_SCOPES
-
-# If modifying these scopes, delete the file token.pickle.
-SCOPES = GOOGLE_API_SCOPES
+from auth import build_service
 
 # The ID and range of a sample spreadsheet.
 SAMPLE_SPREADSHEET_ID = '1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms'
@@ -16,27 +6,9 @@ SAMPLE_RANGE_NAME = 'Class Data!A2:E'
 
 
 class SheetsClient:
-    def __init__(self):
-        creds = None
-        # The file token.pickle stores the user's access and refresh tokens, and is
-        # created automatically when the authorization flow completes for the first
-        # time.
-        if os.path.exists('token.pickle'):
-            with open('token.pickle', 'rb') as token:
-                creds = pickle.load(token)
-        # If there are no (valid) credentials available, let the user log in.
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                        'sheets_credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
-            # Save the credentials for the next run
-            with open('token.pickle', 'wb') as token:
-                pickle.dump(creds, token)
-
-        self.service = build('sheets', 'v4', credentials=creds)
+    def __init__(self, service=None):
+        # An already built service (e.g. sheets.fake.FakeSheetsService) skips authorization
+        self.service = build_service('sheets', 'v4') if service is None else service
 
     def get_range(self, spreadsheet_id, spreadsheet_range):
         sheet = self.service.spreadsheets()
@@ -47,6 +19,20 @@ class SheetsClient:
         ).execute()
         return result.get('values', [])
 
+    def get_ranges(self, spreadsheet_id, sheet_names, sheet_range):
+        """Fetches sheet_range of every named sheet in one batchGet request, keyed by sheet name"""
+        sheet = self.service.spreadsheets()
+        result = sheet.values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=["!".join([f"'{sheet_name}'", sheet_range]) for sheet_name in sheet_names],
+            valueRenderOption='UNFORMATTED_VALUE',
+        ).execute()
+        # valueRanges come back in request order
+        return {
+            sheet_name: value_range.get('values', [])
+            for sheet_name, value_range in zip(sheet_names, result.get('valueRanges', []))
+        }
+
 
 def main():
     """Shows basic usage of the Sheets API.
@@ -0,0 +1,85 @@
+"""
+In-memory stand-in for the googleapiclient Sheets v4 service.
+
+Supports the calls SheetsClient makes, spreadsheets().values().get() and
+batchGet(), over A1 ranges like 'Perennials'!A2:N, and counts the requests
+that would have gone to the API. Pass it as SheetsClient(service=...) to run
+without credentials or network access.
+"""
+
+import re
+import time
+
+A1_RANGE = re.compile(r"^(?:'(?P<quoted>(?:[^']|'')+)'|(?P<sheet>[^!]+))!(?P<start_col>[A-Z]+)(?P<start_row>\d*)"
+                      r"(?::(?P<end_col>[A-Z]+)(?P<end_row>\d*))?$")
+
+
+def _column_index(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+class FakeRequest:
+    def __init__(self, service, response):
+        self.service = service
+        self.response = response
+
+    def execute(self, num_retries=0):
+        self.service.requests += 1
+        time.sleep(self.service.latency)
+        return self.response
+
+
+class FakeSheetsService:
+    def __init__(self, spreadsheets, latency=0.0):
+        """
+        spreadsheets: {spreadsheet_id: {sheet_name: rows starting at row 1}}
+        latency: seconds each request sleeps, to stand in for the round-trip
+        """
+        self.spreadsheets_data = spreadsheets
+        self.latency = latency
+        self.requests = 0
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def _value_range(self, spreadsheet_id, spreadsheet_range):
+        m = A1_RANGE.match(spreadsheet_range)
+        if m is None:
+            raise ValueError(f"Unsupported range {spreadsheet_range!r}")
+        sheet_name = m["quoted"].replace("''", "'") if m["quoted"] else m["sheet"]
+        rows = self.spreadsheets_data[spreadsheet_id][sheet_name]
+
+        first_row = int(m["start_row"] or 1) - 1
+        last_row = int(m["end_row"]) if m["end_row"] else len(rows)
+        first_col = _column_index(m["start_col"])
+        last_col = _column_index(m["end_col"] or m["start_col"]) + 1
+
+        values = []
+        for row in rows[first_row:last_row]:
+            row = list(row[first_col:last_col])
+            # Like the API, drop trailing empty cells, and trailing empty rows below
+            while row and row[-1] == "":
+                row.pop()
+            values.append(row)
+        while values and not values[-1]:
+            values.pop()
+
+        value_range = {"range": spreadsheet_range, "majorDimension": "ROWS"}
+        if values:
+            value_range["values"] = values
+        return value_range
+
+    def get(self, spreadsheetId, range, **kwargs):
+        return FakeRequest(self, self._value_range(spreadsheetId, range))
+
+    def batchGet(self, spreadsheetId, ranges, **kwargs):
+        return FakeRequest(self, {
+            "spreadsheetId": spreadsheetId,
+            "valueRanges": [self._value_range(spreadsheetId, r) for r in ranges],
+        })
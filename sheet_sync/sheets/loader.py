@@ -0,0 +1,117 @@
+"""
+Column-projection loader for spreadsheet rows.
+
+RowLoader compiles SheetsInventoryMeta and SheetsInventorySchema once into a
+column index and a coercion function per field, then loads rows a chunk at a
+time, one column at a time. Each coercion function takes a fast path for
+values that need no conversion (str for String, int for Integer, finite float
+for Float, None) and otherwise calls the field's own deserialize(), so every
+result and every error message matches SheetsInventorySchema().load().
+Invalid rows are collected rather than raised one at a time.
+"""
+
+import dataclasses
+
+import marshmallow
+
+from sheets.schemas import InventoryItem, SheetsInventoryMeta, SheetsInventorySchema
+
+CHUNK_SIZE = 1000  # rows loaded per column pass
+
+
+def _coercion(field):
+    """field.deserialize() with a fast path for values it would return unchanged"""
+    deserialize = field.deserialize
+    fast_type = None
+    if not field.validators:
+        if isinstance(field, marshmallow.fields.String):
+            fast_type = str
+        elif isinstance(field, marshmallow.fields.Integer):
+            fast_type = int
+        elif isinstance(field, marshmallow.fields.Float) and not field.allow_nan:
+            fast_type = float
+
+    if fast_type is float:
+        def coerce(value):
+            # value - value is nan for nan and inf, which Float rejects
+            if type(value) is float and value - value == 0:
+                return value
+            return None if value is None else deserialize(value)
+    elif fast_type is not None:
+        def coerce(value):
+            if type(value) is fast_type:
+                return value
+            return None if value is None else deserialize(value)
+    else:
+        def coerce(value):
+            return None if value is None else deserialize(value)
+
+    if not field.allow_none:
+        return deserialize
+    return coerce
+
+
+class RowLoader:
+    def __init__(self, schema_class=SheetsInventorySchema, meta=SheetsInventoryMeta, chunk_size=CHUNK_SIZE):
+        fields = schema_class._declared_fields
+        if list(fields) != [field.name for field in dataclasses.fields(InventoryItem)]:
+            raise TypeError(f"{schema_class.__name__} fields don't match InventoryItem")
+
+        # (name, column index, stringified, coerce) per field, in InventoryItem order
+        self.fields = [
+            (name, getattr(meta, name).index, name in meta.stringified, _coercion(field))
+            for name, field in fields.items()
+        ]
+        self.sku_index = meta.sku.index
+        self.chunk_size = chunk_size
+        self.errors = {}  # row index -> (raw row, {field: messages})
+
+    def load(self, rows):
+        """Yields an InventoryItem per valid row with a SKU, recording invalid rows in errors"""
+        chunk = []
+        for i, row in enumerate(rows):
+            # skip rows without SKUs
+            sku = row[self.sku_index] if self.sku_index < len(row) else ""
+            if sku == "" or sku is None:
+                continue
+            chunk.append((i, row))
+            if len(chunk) == self.chunk_size:
+                yield from self._load_chunk(chunk)
+                chunk = []
+        yield from self._load_chunk(chunk)
+
+    def _load_chunk(self, chunk):
+        columns = []
+        for name, index, stringified, coerce in self.fields:
+            # '' and cells past the end of a short row are None
+            column = [row[index] if index < len(row) else None for _, row in chunk]
+            column = [None if value == "" else value for value in column]
+            if stringified:
+                column = [str(value) for value in column]
+
+            try:
+                columns.append(list(map(coerce, column)))
+            except marshmallow.ValidationError:
+                columns.append(self._coerce_each(name, coerce, column, chunk))
+
+        for (i, _), values in zip(chunk, zip(*columns)):
+            if i not in self.errors:
+                yield InventoryItem(*values)
+
+    def _coerce_each(self, name, coerce, column, chunk):
+        """Slow path for a column with invalid values: record every error"""
+        values = []
+        for (i, row), value in zip(chunk, column):
+            try:
+                values.append(coerce(value))
+            except marshmallow.ValidationError as e:
+                self.errors.setdefault(i, (row, {}))[1][name] = e.messages
+                values.append(None)
+        return values
+
+    def report(self):
+        lines = [f"{len(self.errors)} invalid rows:"]
+        for i, (row, messages) in sorted(self.errors.items()):
+            lines.append(f"  row {i}: {messages}")
+            lines.append(f"    {row}")
+        return "\n".join(lines)
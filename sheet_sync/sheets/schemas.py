@@ -1,3 +1,5 @@
+import dataclasses
+
 import marshmallow
 
 
@@ -27,6 +29,35 @@ class SheetsInventoryMeta:
     # index of location column + 1
     number_of_columns = ColumnEnum("N").index + 1
 
+    # columns passed through str() before loading, so empty cells load as "None"
+    stringified = ["pot", "location"]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class InventoryItem:
+    """
+    One cleaned spreadsheet row. Immutable, so pipeline stages can share rows
+    instead of copying them; supports item["field"] and **item like the dicts
+    it replaces.
+    """
+    sku: int | None
+    scientific_name: str | None
+    common_name: str | None
+    image_url: str | None
+    category: str | None
+    tags: str | None
+    zone: str | None
+    info: str | None
+    pot: str | None
+    price: float | None
+    location: str | None
+
+    def keys(self):
+        return [field.name for field in dataclasses.fields(self)]
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
 
 class SheetsInventorySchema(marshmallow.Schema):
     sku = marshmallow.fields.Integer(required=True, allow_none=True)
@@ -40,3 +71,7 @@ class SheetsInventorySchema(marshmallow.Schema):
     pot = marshmallow.fields.String(required=True, allow_none=True)
     price = marshmallow.fields.Float(required=True, allow_none=True)
     location = marshmallow.fields.String(required=True, allow_none=True)
+
+    @marshmallow.post_load
+    def make_item(self, data, **kwargs):
+        return InventoryItem(**data)
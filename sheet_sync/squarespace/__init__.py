@@ -1,3 +1,4 @@
 from squarespace.schemas import SquareSpaceInventorySchema, INVENTORY_HEADER
+from squarespace.encoder import compile_row_encoder
 
-__all__ = [SquareSpaceInventorySchema, INVENTORY_HEADER]
+__all__ = [SquareSpaceInventorySchema, INVENTORY_HEADER, compile_row_encoder]
@@ -0,0 +1,59 @@
+"""
+Row encoder for the SquareSpace inventory CSV.
+
+compile_row_encoder() turns the schema's declared fields into one function
+mapping a loaded row dict straight to the tuple of CSV cells, producing the
+same text as SquareSpaceInventorySchema().dump() through csv.DictWriter.
+Validation stays on the load path: rows reaching the encoder were built by
+SquareSpaceInventorySchema().load(), and dump() never validated either.
+"""
+
+import marshmallow
+
+from squarespace.schemas import SquareSpaceInventorySchema, JOINED_LISTS
+
+
+def _text(value):
+    return None if value is None else str(value)
+
+
+def _number(num_type):
+    def encode(value):
+        return None if value is None else num_type(value)
+    return encode
+
+
+def _joined(separator):
+    def encode(value):
+        return separator.join(map(_text, value)) if value else ""
+    return encode
+
+
+def _field_encoder(name, field):
+    """Mirrors field._serialize(), plus join_lists() for the joined list fields"""
+    if name in JOINED_LISTS:
+        if not isinstance(field, marshmallow.fields.List) or not isinstance(field.inner, marshmallow.fields.String):
+            raise TypeError(f"Joined field '{name}' must be a List of String")
+        return _joined(JOINED_LISTS[name])
+    if isinstance(field, marshmallow.fields.Number) and not field.as_string:
+        return _number(field.num_type)
+    if isinstance(field, marshmallow.fields.String):
+        return _text
+    raise TypeError(f"No CSV encoding for {type(field).__name__} field '{name}'")
+
+
+def compile_row_encoder(schema_class=SquareSpaceInventorySchema):
+    """
+    Returns (fieldnames, encode), where encode(row) gives the CSV cells of a
+    row dict in fieldnames order. None cells are written empty by csv.writer,
+    like missing keys are by csv.DictWriter.
+    """
+    fields = schema_class._declared_fields
+    fieldnames = tuple(fields)
+    encoders = tuple((name, _field_encoder(name, field)) for name, field in fields.items())
+
+    def encode(row):
+        get = row.get
+        return tuple([encoder(get(name)) for name, encoder in encoders])
+
+    return fieldnames, encode
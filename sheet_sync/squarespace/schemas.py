@@ -30,6 +30,14 @@ INVENTORY_HEADER = {
 }
 
 
+# List fields the CSV holds as one cell, and the separator joining their items
+JOINED_LISTS = {
+    "categories": ", ",
+    "tags": ", ",
+    "image_url": " ",
+}
+
+
 class SquareSpaceInventorySchema(marshmallow.Schema):
     product_id = marshmallow.fields.String(missing=None)
     variant_id = marshmallow.fields.String(missing=None)
@@ -60,9 +68,7 @@ class SquareSpaceInventorySchema(marshmallow.Schema):
 
     @marshmallow.post_dump
     def join_lists(self, data, many, **kwargs):
-        for list_field in ["categories", "tags"]:
-            data[list_field] = ", ".join(data[list_field] or [])
-
-        data["image_url"] = " ".join(data["image_url"] or [])
+        for list_field, separator in JOINED_LISTS.items():
+            data[list_field] = separator.join(data[list_field] or [])
 
         return data
@@ -6,19 +6,31 @@ and writes an enriched plants.csv suitable for upload to the sign generator.
 
 Usage:
     python3 convert.py [INFOSHEET_DIR] [--output OUTPUT_CSV] [--skip-bonap] [--bonap-workers N]
+                       [--offline] [--cache-ttl DAYS] [--jobs N] [--manifest PATH] [--profile]
 
 Defaults:
     INFOSHEET_DIR  ../initial_info/email1/2026 plant infosheets/
     --output       ~/Downloads/upload/plants.improved.csv
+    --manifest     ~/.cache/plant-sale/infosheet_manifest.json
+
+Infosheets are parsed on a process pool. Each parsed plant is recorded in the
+manifest with the file's size, mtime and SHA-256, so reruns only reparse
+infosheets that changed (or everything, when this script itself changes).
 """
 
+import os
 import csv
 import re
 import sys
+import json
+import time
+import hashlib
 import zipfile
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
+from xml.parsers import expat
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # ─── Ali's highlight lookup ────────────────────────────────────────────────────
 
@@ -78,28 +90,76 @@ def get_ali_highlight(latin: str, ali_highlights: dict) -> str:
 # Import the Piedmont native classifier (sibling directory)
 sys.path.insert(0, str(Path(__file__).parent.parent / 'piedmont_native_classifier'))
 try:
-    from piedmont_check import check as _bonap_check
     from piedmont_check import _clean_latin as _bonap_clean_latin
+    from piedmont_check import configure_cache as _bonap_configure_cache
+    from piedmont_check import check_many as _bonap_check_many
+    from piedmont_check import fetch_summary as _bonap_fetch_summary
+    from piedmont_check import REGIONS as _BONAP_REGIONS
     BONAP_AVAILABLE = True
 except ImportError:
     BONAP_AVAILABLE = False
+    _BONAP_REGIONS = {'piedmont': None}
     print('Warning: could not import piedmont_check — BONAP checks disabled', file=sys.stderr)
 
+# One '<region>_native' output column per registered BONAP region (piedmont first)
+REGION_COLUMNS = [f'{region}_native' for region in _BONAP_REGIONS]
+
 
 # ─── docx reading ─────────────────────────────────────────────────────────────
 
-def read_docx(path: Path) -> str:
-    """Extract flat text from a .docx file (strips all XML tags)."""
+_W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_W_P, _W_T = f'{_W} p', f'{_W} t'
+
+
+def read_docx_paragraphs(path: Path) -> list[str]:
+    """
+    Return the text of each non-empty paragraph in a .docx, in document order.
+
+    Streams word/document.xml through an expat (SAX-style) parser and keeps
+    only w:t runs, so the document is never held as one string and entities
+    are decoded by the parser. Runs are joined with a space (matching the old
+    tag-stripping extractor) and whitespace is collapsed. A paragraph nested
+    inside another (e.g. in a text box) splits the outer one.
+    """
+    paragraphs = []
+    runs = []
+
+    def flush():
+        text = ' '.join(' '.join(runs).split())
+        if text:
+            paragraphs.append(text)
+        runs.clear()
+
+    def text(data):
+        runs[-1] += data
+
+    def start(name, attrs):
+        if name == _W_T:
+            runs.append('')
+            parser.CharacterDataHandler = text
+        elif name == _W_P:
+            flush()
+
+    def end(name):
+        if name == _W_T:
+            parser.CharacterDataHandler = None
+        elif name == _W_P:
+            flush()
+
+    parser = expat.ParserCreate(namespace_separator=' ')
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
     with zipfile.ZipFile(path) as z:
         with z.open('word/document.xml') as f:
-            xml = f.read().decode('utf-8', errors='replace')
-    for entity, char in [
-        ('&amp;', '&'), ('&lt;', '<'), ('&gt;', '>'),
-        ('&apos;', "'"), ('&quot;', '"'), ('&nbsp;', ' '),
-    ]:
-        xml = xml.replace(entity, char)
-    text = re.sub(r'<[^>]+>', ' ', xml)
-    return re.sub(r'\s+', ' ', text).strip()
+            parser.ParseFile(f)
+    flush()
+    return paragraphs
+
+
+def read_docx(path: Path) -> str:
+    """Extract flat text from a .docx file (w:t runs only, whitespace collapsed)."""
+    return ' '.join(read_docx_paragraphs(path))
 
 
 # ─── field segmentation ───────────────────────────────────────────────────────
@@ -133,26 +193,50 @@ FIELD_LABELS = [
 ]
 
 
+def _compile_segmenter(labels: list) -> re.Pattern:
+    """
+    One regex matching any label (plus optional parenthetical and colon), with a
+    named group per label so m.lastgroup says which one matched.
+    """
+    lowered = [fn.lower() for fn in labels]
+    for a in lowered:
+        for b in lowered:
+            # A label that prefixes another could match at the same position
+            if a != b and b.startswith(a):
+                raise ValueError(f'label {a!r} is a prefix of {b!r}')
+    alternation = '|'.join(f'(?P<f{i}>{re.escape(fn)})' for i, fn in enumerate(labels))
+    return re.compile(rf'(?<!\w)(?:{alternation})\s*(?:\([^)]*\))?\s*:', re.IGNORECASE)
+
+
+_SEGMENTER = _compile_segmenter(FIELD_LABELS)
+_SOURCES_RE = re.compile(r'\.?\s*Sources?:.*$', re.DOTALL | re.IGNORECASE)
+_URL_PAREN_RE = re.compile(r'\s*\(https?://[^)]+\)')
+_WS_RE = re.compile(r'\s+')
+
+
 def segment_fields(text: str) -> dict:
     """Return {lowercase_field_name: cleaned_value} for all found fields."""
-    # Find the first occurrence of each known field label
-    positions = []
-    for fn in FIELD_LABELS:
-        pattern = rf'(?<!\w){re.escape(fn)}\s*(?:\([^)]*\))?\s*:'
-        m = re.search(pattern, text, re.IGNORECASE)
-        if m:
-            positions.append((m.start(), fn, m.end()))
-    positions.sort(key=lambda x: x[0])
+    # Find the first occurrence of each known field label. Matches may overlap
+    # (a label inside another's parenthetical), so resume just past each start.
+    first = {}
+    pos = 0
+    while len(first) < len(FIELD_LABELS):
+        m = _SEGMENTER.search(text, pos)
+        if not m:
+            break
+        first.setdefault(m.lastgroup, (m.start(), FIELD_LABELS[int(m.lastgroup[1:])], m.end()))
+        pos = m.start() + 1
+    positions = sorted(first.values(), key=lambda x: x[0])
 
     fields = {}
     for i, (_, fn, val_start) in enumerate(positions):
         end = positions[i + 1][0] if i + 1 < len(positions) else len(text)
         val = text[val_start:end].strip()
         # Strip "Source:" / "Sources:" citations (can appear multiple times)
-        val = re.sub(r'\.?\s*Sources?:.*$', '', val, flags=re.DOTALL | re.IGNORECASE)
+        val = _SOURCES_RE.sub('', val)
         # Strip inline URLs in parens
-        val = re.sub(r'\s*\(https?://[^)]+\)', '', val)
-        val = re.sub(r'\s+', ' ', val).strip().strip('., ')
+        val = _URL_PAREN_RE.sub('', val)
+        val = _WS_RE.sub(' ', val).strip().strip('., ')
         fields[fn.lower()] = val
 
     return fields
@@ -167,6 +251,53 @@ def get(fields: dict, *keys: str) -> str:
     return ''
 
 
+class PlantFields(dict):
+    """segment_fields() output plus a per-plant cache of lowercased values."""
+
+    def __init__(self, fields: dict):
+        super().__init__(fields)
+        self.lowered = {}
+
+
+def get_lower(fields: dict, *keys: str) -> str:
+    """get(...).lower(), computed once per plant when fields is a PlantFields."""
+    cache = getattr(fields, 'lowered', None)
+    if cache is None:
+        return get(fields, *keys).lower()
+    if keys not in cache:
+        cache[keys] = get(fields, *keys).lower()
+    return cache[keys]
+
+
+# ─── precompiled normalizer patterns ──────────────────────────────────────────
+
+_INCHES_RE = re.compile(r'(\d+(?:\.\d+)?)\s*-?\s*(\d+(?:\.\d+)?)?\s*(?:in\b|inches?)', re.IGNORECASE)
+_FEET_RE = re.compile(
+    r'(?:Up\s+to\s+)?(\d+(?:\.\d+)?)\s*(?:-|to)?\s*(\d+(?:\.\d+)?)?\s*(?:ft\b|feet|foot)',
+    re.IGNORECASE,
+)
+_NOT_NC_RE = re.compile(r'not native to north carolina|native to north carolina[:\s]+no\b')
+_IS_NC_RE = re.compile(r'native to north carolina|nc native|nc regions')
+_NOT_NA_RE = re.compile(r'not native to north america|native to north america[:\s]+no\b')
+_ORIGINS = [
+    (re.compile(r'(?:east(?:ern)?\s+)?asia|china|japan|korea'), 'Asia'),
+    (re.compile(r'mediterranean|western asia'), 'western Asia/Mediterranean'),
+    (re.compile(r'europe\b'), 'Europe'),
+    (re.compile(r'south\s+america'), 'South America'),
+    (re.compile(r'africa\b'), 'Africa'),
+]
+_NATIVE_TO_RE = re.compile(r'native to ([A-Za-z ,/]+?)(?:\.|;|$)', re.IGNORECASE)
+_ZONE_RANGE_RE = re.compile(r'(\d+)[ab]?\s*-\s*(\d+)[ab]?')
+_DIGITS_RE = re.compile(r'(\d+)')
+_NO_RE = re.compile(r'\bno\b')
+_PARTIAL_RE = re.compile(r'partial\s*(?:shade|sun)|part[-\s]shade|dappled')
+_DRY_RE = re.compile(r'\bdry\b')
+_WET_RE = re.compile(r'\bwet\b')
+_POLLINATOR_RE = re.compile(r'bee|butterfl|pollinator|hummingbird|moth|wasp|lepidoptera')
+_INFOSHEET_SUFFIX_RE = re.compile(r'_infosheet', re.IGNORECASE)
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+
 # ─── measurement helper ───────────────────────────────────────────────────────
 
 def clean_measurement(val: str) -> str:
@@ -176,7 +307,7 @@ def clean_measurement(val: str) -> str:
     val = val.replace('–', '-').replace('—', '-').replace('~', ' ').strip()
 
     # Inches → feet
-    m = re.match(r'(\d+(?:\.\d+)?)\s*-?\s*(\d+(?:\.\d+)?)?\s*(?:in\b|inches?)', val, re.IGNORECASE)
+    m = _INCHES_RE.match(val)
     if m:
         lo = float(m.group(1))
         hi = float(m.group(2)) if m.group(2) else lo
@@ -187,10 +318,7 @@ def clean_measurement(val: str) -> str:
         return f'{fmt(lo / 12)}-{fmt(hi / 12)} ft' if lo != hi else f'{fmt(lo / 12)} ft'
 
     # Feet
-    m = re.match(
-        r'(?:Up\s+to\s+)?(\d+(?:\.\d+)?)\s*(?:-|to)?\s*(\d+(?:\.\d+)?)?\s*(?:ft\b|feet|foot)',
-        val, re.IGNORECASE,
-    )
+    m = _FEET_RE.match(val)
     if m:
         lo, hi = m.group(1), m.group(2)
         return f'{lo}-{hi} ft' if hi else f'{lo} ft'
@@ -213,7 +341,7 @@ def normalize_size(fields: dict) -> str:
 
 def normalize_bloom(fields: dict) -> str:
     bloom = get(fields, 'bloom time and color')
-    if not bloom or 'information not found' in bloom.lower():
+    if not bloom or 'information not found' in get_lower(fields, 'bloom time and color'):
         return ''
     # Take the first segment (before semicolons/parentheticals)
     return bloom.split(';')[0].split('(')[0].strip().rstrip('.')
@@ -221,7 +349,8 @@ def normalize_bloom(fields: dict) -> str:
 
 def normalize_soil(fields: dict) -> str:
     soil = get(fields, 'soil and moisture preferences', 'soil & moisture preferences')
-    if not soil or 'information not found' in soil.lower():
+    if not soil or 'information not found' in get_lower(fields, 'soil and moisture preferences',
+                                                         'soil & moisture preferences'):
         return ''
     # First clause only, capped at 7 words
     part = soil.split(';')[0].strip()
@@ -236,29 +365,23 @@ def normalize_native_range(fields: dict) -> tuple[str, bool, bool]:
     display_string examples: 'North America, NC native', 'North America', 'Asia'
     """
     nr_raw = get(fields, 'native range')
-    nr = nr_raw.lower()
+    nr = get_lower(fields, 'native range')
     if not nr:
         return '', False, False
 
     # NC native?
-    not_nc = bool(re.search(r'not native to north carolina|native to north carolina[:\s]+no\b', nr))
-    is_nc = not not_nc and bool(re.search(r'native to north carolina|nc native|nc regions', nr))
+    not_nc = bool(_NOT_NC_RE.search(nr))
+    is_nc = not not_nc and bool(_IS_NC_RE.search(nr))
 
     # Is it North American?
-    not_na = bool(re.search(r'not native to north america|native to north america[:\s]+no\b', nr))
+    not_na = bool(_NOT_NA_RE.search(nr))
 
     if not_na:
         # Identify actual origin
-        for pat, label in [
-            (r'(?:east(?:ern)?\s+)?asia|china|japan|korea', 'Asia'),
-            (r'mediterranean|western asia', 'western Asia/Mediterranean'),
-            (r'europe\b', 'Europe'),
-            (r'south\s+america', 'South America'),
-            (r'africa\b', 'Africa'),
-        ]:
-            if re.search(pat, nr):
+        for pat, label in _ORIGINS:
+            if pat.search(nr):
                 return label, False, False
-        m = re.search(r'native to ([A-Za-z ,/]+?)(?:\.|;|$)', nr_raw, re.IGNORECASE)
+        m = _NATIVE_TO_RE.search(nr_raw)
         return (m.group(1).strip() if m else 'Non-native'), False, False
 
     display = 'North America, NC native' if is_nc else 'North America'
@@ -267,38 +390,38 @@ def normalize_native_range(fields: dict) -> tuple[str, bool, bool]:
 
 def normalize_zone(fields: dict) -> str:
     zone = get(fields, 'usda plant hardiness zone')
-    if not zone or 'information not found' in zone.lower() or 'not found' in zone.lower():
+    if not zone or 'not found' in get_lower(fields, 'usda plant hardiness zone'):
         return ''
     zone = zone.replace('–', '-').replace('—', '-')
     # Match range like "3a-9b" or "4-8"
-    m = re.search(r'(\d+)[ab]?\s*-\s*(\d+)[ab]?', zone)
+    m = _ZONE_RANGE_RE.search(zone)
     if m:
         return f'{m.group(1)}-{m.group(2)}'
-    m = re.search(r'(\d+)', zone)
+    m = _DIGITS_RE.search(zone)
     return m.group(1) if m else ''
 
 
 def normalize_deer(fields: dict) -> str:
     """Return 'yes', 'moderate', 'no', or '' if unknown."""
-    deer = get(fields, 'deer resistance').lower()
-    if not deer or 'information not found' in deer or 'not found' in deer:
+    deer = get_lower(fields, 'deer resistance')
+    if not deer or 'not found' in deer:
         return ''
     if 'moderate' in deer:
         return 'moderate'
     if 'yes' in deer or 'resistant' in deer:
         return 'yes'
-    if re.search(r'\bno\b', deer):
+    if _NO_RE.search(deer):
         return 'no'
     return ''
 
 
 def normalize_sun(fields: dict) -> str:
     """Return 'full_sun', 'part_shade', or 'shade'."""
-    sun = get(fields, 'sunlight preference').lower()
+    sun = get_lower(fields, 'sunlight preference')
     if not sun:
         return ''
     has_full = 'full sun' in sun
-    has_partial = bool(re.search(r'partial\s*(?:shade|sun)|part[-\s]shade|dappled', sun))
+    has_partial = bool(_PARTIAL_RE.search(sun))
     has_shade = 'shade' in sun
 
     if has_full and not has_shade:
@@ -310,21 +433,20 @@ def normalize_sun(fields: dict) -> str:
 
 def normalize_moisture(fields: dict) -> str:
     """Return 'wet', 'average', or 'drought'."""
-    soil = get(fields, 'soil and moisture preferences', 'soil & moisture preferences').lower()
+    soil = get_lower(fields, 'soil and moisture preferences', 'soil & moisture preferences')
     if not soil:
         return ''
-    if 'drought tolerant' in soil or re.search(r'\bdry\b', soil):
+    if 'drought tolerant' in soil or _DRY_RE.search(soil):
         return 'drought'
     if 'well-drained' in soil or 'well drained' in soil:
         return 'average'
-    if re.search(r'\bwet\b', soil) or ('moist' in soil and 'well' not in soil):
+    if _WET_RE.search(soil) or ('moist' in soil and 'well' not in soil):
         return 'wet'
     return 'average'
 
 
 def normalize_pollinator(fields: dict) -> bool:
-    wv = get(fields, 'wildlife value').lower()
-    return bool(re.search(r'bee|butterfl|pollinator|hummingbird|moth|wasp|lepidoptera', wv))
+    return bool(_POLLINATOR_RE.search(get_lower(fields, 'wildlife value')))
 
 
 def normalize_common(fields: dict) -> str:
@@ -340,64 +462,115 @@ def normalize_latin(fields: dict, filename: str) -> str:
             return latin
     # Fallback: filename up to "_infosheet"
     stem = Path(filename).stem
-    parts = re.split(r'_infosheet', stem, flags=re.IGNORECASE)[0]
+    parts = _INFOSHEET_SUFFIX_RE.split(stem)[0]
     return parts.replace('_', ' ')
 
 
 def normalize_highlight(fields: dict) -> str:
     """Use Cultural notes as the highlight line (first 1-2 sentences)."""
     notes = get(fields, 'cultural notes')
-    if not notes or 'information not found' in notes.lower():
+    if not notes or 'information not found' in get_lower(fields, 'cultural notes'):
         return ''
-    sentences = re.split(r'(?<=[.!?])\s+', notes.strip())
+    sentences = _SENTENCE_RE.split(notes.strip())
     result = ' '.join(sentences[:2])
     if len(result) > 220:
         result = result[:217].rsplit(' ', 1)[0] + '...'
     return result
 
 
-def build_attributes_line(fields: dict) -> tuple[str, bool, bool]:
-    """Return (attributes_line, is_north_american, is_nc_native)."""
-    nat_display, is_na, is_nc = normalize_native_range(fields)
+def _attributes_line(size, bloom, soil, native_range, zone, deer) -> str:
     parts = []
-    if size := normalize_size(fields):
+    if size:
         parts.append(f'Size: {size}')
-    if bloom := normalize_bloom(fields):
+    if bloom:
         parts.append(f'Bloom: {bloom}')
-    if soil := normalize_soil(fields):
+    if soil:
         parts.append(f'Soil: {soil}')
-    if nat_display:
-        parts.append(f'Native range: {nat_display}')
-    if zone := normalize_zone(fields):
+    if native_range:
+        parts.append(f'Native range: {native_range}')
+    if zone:
         parts.append(f'USDA zone: {zone}')
-    if deer := normalize_deer(fields):
+    if deer:
         parts.append(f'Deer Resistance: {deer}')
-    return '; '.join(parts), is_na, is_nc
+    return '; '.join(parts)
 
 
-# ─── BONAP Piedmont native check ──────────────────────────────────────────────
+def build_attributes_line(fields: dict) -> tuple[str, bool, bool]:
+    """Return (attributes_line, is_north_american, is_nc_native)."""
+    fields = PlantFields(fields)
+    nat_display, is_na, is_nc = normalize_native_range(fields)
+    attrs = _attributes_line(
+        normalize_size(fields), normalize_bloom(fields), normalize_soil(fields),
+        nat_display, normalize_zone(fields), normalize_deer(fields),
+    )
+    return attrs, is_na, is_nc
+
+
+# Every normalizer build_plant() runs, once each (name is used in --profile)
+NORMALIZERS = [
+    ('native_range', normalize_native_range),
+    ('size',         normalize_size),
+    ('bloom',        normalize_bloom),
+    ('soil',         normalize_soil),
+    ('zone',         normalize_zone),
+    ('deer',         normalize_deer),
+    ('common',       normalize_common),
+    ('highlight',    normalize_highlight),
+    ('sun',          normalize_sun),
+    ('moisture',     normalize_moisture),
+    ('pollinator',   normalize_pollinator),
+]
 
 
-def bonap_check_plant(latin: str) -> tuple:
-    """
-    Run the BONAP Piedmont native check.
-    Returns (is_native: bool | None, error: str | None).
-    Uses only genus + species (first two words) for the lookup.
-    """
-    words = _bonap_clean_latin(latin).split()
-    if len(words) < 2:
-        return None, 'Need at least genus + species'
+def _timed(timings: dict | None, name: str, fn, *args):
+    """Call fn(*args), adding its wall time to timings[name] when profiling."""
+    if timings is None:
+        return fn(*args)
+    start = time.perf_counter()
+    result = fn(*args)
+    timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+    return result
 
-    species_latin = ' '.join(words)
 
-    try:
-        _, _, total, _, is_native = _bonap_check(species_latin)
-        if total == 0:
-            return False, 'No valid county pixels sampled (map may be missing or offset)'
-        return is_native, None
-    except Exception as e:
-        code = getattr(e, 'code', None)
-        return False, f'HTTP {code}' if code else str(e)[:80]
+def build_plant(fields: dict, filename: str, timings: dict | None = None) -> dict | None:
+    """Run every normalizer once over one shared field view and return the plant row."""
+    fields = PlantFields(fields)
+    latin = _timed(timings, 'latin', normalize_latin, fields, filename)
+    if not latin:
+        return None
+
+    v = {name: _timed(timings, name, fn, fields) for name, fn in NORMALIZERS}
+    nat_display, is_na, is_nc = v['native_range']
+
+    return {
+        'latin':             latin,
+        'common':            v['common'],
+        'attributes_line':   _attributes_line(v['size'], v['bloom'], v['soil'],
+                                              nat_display, v['zone'], v['deer']),
+        'highlight_line':    v['highlight'],
+        'sun_level':         v['sun'],
+        'moisture':          v['moisture'],
+        'is_pollinator':     v['pollinator'],
+        'is_deer_resistant': v['deer'] in ('yes', 'moderate'),
+        'source':            'infosheet',
+        # Internal — used for flag computation, stripped before CSV write
+        '_is_north_american': is_na,
+        '_is_nc_native':      is_nc,
+    }
+
+
+# ─── BONAP Piedmont native check ──────────────────────────────────────────────
+
+
+def bonap_verdict(result, error) -> tuple:
+    """Map a piedmont_check result tuple (or the exception raised) to (is_native, error)."""
+    if error is not None:
+        code = getattr(error, 'code', None)
+        return False, f'HTTP {code}' if code else str(error)[:80]
+    _, _, total, _, is_native = result
+    if total == 0:
+        return False, 'No valid county pixels sampled (map may be missing or offset)'
+    return is_native, None
 
 
 # ─── flag computation ─────────────────────────────────────────────────────────
@@ -447,33 +620,132 @@ def file_priority(path: Path) -> int:
 
 # ─── per-file processor ───────────────────────────────────────────────────────
 
-def process_infosheet(path: Path) -> dict | None:
-    text = read_docx(path)
-    fields = segment_fields(text)
+def process_infosheet(path: Path, timings: dict | None = None) -> dict | None:
+    text = _timed(timings, 'read_docx', read_docx, path)
+    fields = _timed(timings, 'segment_fields', segment_fields, text)
+    return build_plant(fields, path.name, timings)
 
-    latin = normalize_latin(fields, path.name)
-    if not latin:
+
+def parse_infosheet(path: Path) -> tuple:
+    """Process-pool entry point: returns (plant | None, error | None)."""
+    try:
+        return process_infosheet(path), None
+    except Exception as e:
+        return None, str(e)
+
+
+# ─── Phase 1 manifest (skip unchanged infosheets) ─────────────────────────────
+
+DEFAULT_MANIFEST = Path.home() / '.cache' / 'plant-sale' / 'infosheet_manifest.json'
+
+# Any edit to the parser invalidates every manifest entry
+PARSER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_manifest(path: Path) -> dict:
+    """Return {file_path: entry} from the manifest, or {} if missing/stale."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('parser') != PARSER_VERSION:
+        return {}
+    return data.get('files', {})
+
+
+def save_manifest(path: Path, files: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'parser': PARSER_VERSION, 'files': files}, f)
+    os.replace(tmp, path)
+
+
+def manifest_lookup(manifest: dict, path: Path) -> dict | None:
+    """
+    Return the manifest entry for path if the file is unchanged, else None.
+    Size + mtime match is trusted; otherwise the content hash decides (and the
+    entry's stat fields are refreshed so the next run skips hashing).
+    """
+    entry = manifest.get(str(path))
+    if entry is None:
         return None
+    st = path.stat()
+    if entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+        return entry
+    if entry['size'] == st.st_size and entry['sha256'] == _sha256_file(path):
+        entry['mtime_ns'] = st.st_mtime_ns
+        return entry
+    return None
 
-    deer = normalize_deer(fields)
-    attrs, is_na, is_nc = build_attributes_line(fields)
 
+def manifest_entry(path: Path, plant: dict | None, error: str | None) -> dict:
+    st = path.stat()
     return {
-        'latin':             latin,
-        'common':            normalize_common(fields),
-        'attributes_line':   attrs,
-        'highlight_line':    normalize_highlight(fields),
-        'sun_level':         normalize_sun(fields),
-        'moisture':          normalize_moisture(fields),
-        'is_pollinator':     normalize_pollinator(fields),
-        'is_deer_resistant': deer in ('yes', 'moderate'),
-        'source':            'infosheet',
-        # Internal — used for flag computation, stripped before CSV write
-        '_is_north_american': is_na,
-        '_is_nc_native':      is_nc,
+        'size':     st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'sha256':   _sha256_file(path),
+        'plant':    plant,
+        'error':    error,
     }
 
 
+def parse_all(docx_files: list, manifest_path: Path | None, jobs: int | None,
+              timings: dict | None = None) -> list:
+    """
+    Parse every infosheet, reusing manifest entries for unchanged files.
+    Returns [(path, plant | None, error | None)] in docx_files order.
+
+    With timings (--profile), every file is reparsed in this process so the
+    per-stage times cover the whole directory.
+    """
+    manifest = load_manifest(manifest_path) if manifest_path and timings is None else {}
+    entries = {}
+    stale = []
+    for path in docx_files:
+        entry = manifest_lookup(manifest, path)
+        if entry is not None:
+            entries[path] = entry
+        else:
+            stale.append(path)
+
+    print(f'Parsing {len(stale)} changed infosheets '
+          f'({len(entries)} unchanged, reused from manifest)')
+    if timings is not None:
+        for path in stale:
+            try:
+                entries[path] = manifest_entry(path, process_infosheet(path, timings), None)
+            except Exception as e:
+                entries[path] = manifest_entry(path, None, str(e))
+    elif stale:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for path, (plant, error) in zip(stale, pool.map(parse_infosheet, stale, chunksize=4)):
+                entries[path] = manifest_entry(path, plant, error)
+
+    if manifest_path:
+        save_manifest(manifest_path, {str(path): entries[path] for path in docx_files})
+
+    return [(path, entries[path]['plant'], entries[path]['error']) for path in docx_files]
+
+
+def print_profile(timings: dict, n_files: int):
+    """Per-stage parse time across the directory, slowest first."""
+    total = sum(timings.values())
+    print(f'\nParse profile ({n_files} infosheets, {total * 1e3:.1f} ms total):')
+    for name, secs in sorted(timings.items(), key=lambda kv: -kv[1]):
+        print(f'  {name:<16} {secs * 1e3:9.2f} ms  {secs / total * 100:5.1f}%  '
+              f'{secs / max(n_files, 1) * 1e6:8.1f} µs/file')
+
+
 # ─── main ─────────────────────────────────────────────────────────────────────
 
 def main():
@@ -504,7 +776,27 @@ def main():
     )
     parser.add_argument(
         '--bonap-workers', type=int, default=50, metavar='N',
-        help='Parallel BONAP requests (default: 50)',
+        help='Parallel BONAP lookups (default: 50; HTTP is further rate limited)',
+    )
+    parser.add_argument(
+        '--offline', action='store_true',
+        help='Serve BONAP maps only from the local cache (no network)',
+    )
+    parser.add_argument(
+        '--cache-ttl', type=float, default=None, metavar='DAYS',
+        help='Revalidate cached BONAP maps older than DAYS (default: 30)',
+    )
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=None, metavar='N',
+        help='Parallel infosheet parsers (default: one per CPU)',
+    )
+    parser.add_argument(
+        '--manifest', default=str(DEFAULT_MANIFEST), metavar='PATH',
+        help=f'Parsed-infosheet manifest (default: {DEFAULT_MANIFEST}); "" disables it',
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='Reparse every infosheet in-process and report time per parse stage/normalizer',
     )
     args = parser.parse_args()
 
@@ -532,11 +824,13 @@ def main():
     plants_by_latin: dict = {}   # latin → (plant_dict, priority)
     warnings: list[str] = []
 
-    for path in docx_files:
-        try:
-            plant = process_infosheet(path)
-        except Exception as e:
-            warnings.append(f'  ERROR {path.name}: {e}')
+    manifest_path = Path(args.manifest).expanduser() if args.manifest else None
+    timings = {} if args.profile else None
+
+    # Results come back in sorted file order, so dedup matches a sequential run
+    for path, plant, error in parse_all(docx_files, manifest_path, args.jobs, timings):
+        if error is not None:
+            warnings.append(f'  ERROR {path.name}: {error}')
             continue
 
         if not plant:
@@ -562,9 +856,12 @@ def main():
         p for p, _ in sorted(plants_by_latin.values(), key=lambda x: x[0]['latin'])
     ]
     print(f'Parsed {len(plants)} unique plants')
+    if timings is not None:
+        print_profile(timings, len(docx_files))
 
     # ── Phase 2: BONAP Piedmont native checks ─────────────────────────────────
     if run_bonap:
+        _bonap_configure_cache(offline=args.offline, ttl_days=args.cache_ttl)
         workers = args.bonap_workers
         print(f'\nRunning BONAP checks ({len(plants)} plants, {workers} workers)...')
 
@@ -572,27 +869,44 @@ def main():
         plant_by_latin = {p['latin']: p for p in plants}
         completed = 0
 
-        with ThreadPoolExecutor(max_workers=workers) as pool:
-            futures = {
-                pool.submit(bonap_check_plant, p['latin']): p['latin']
-                for p in plants
-            }
-            for future in as_completed(futures):
-                latin = futures[future]
-                bonap_native, bonap_error = future.result()
-                plant = plant_by_latin[latin]
-                plant['piedmont_native'] = bonap_native
-                plant['_bonap_error'] = bonap_error
-                completed += 1
-
-                status = 'ERROR' if bonap_error else ('YES' if bonap_native else 'no ')
-                print(f'  [{completed:3}/{len(plants)}] {status}  {latin}' +
-                      (f'  ({bonap_error})' if bonap_error else ''))
+        def report(latin, bonap_native, bonap_error, regions=None):
+            nonlocal completed
+            plant = plant_by_latin[latin]
+            plant['piedmont_native'] = bonap_native
+            plant['_bonap_error'] = bonap_error
+            for region, result in (regions or {}).items():
+                if region != 'piedmont':
+                    plant[f'{region}_native'] = bonap_verdict(result, None)[0]
+            completed += 1
+
+            status = 'ERROR' if bonap_error else ('YES' if bonap_native else 'no ')
+            extra = ''.join(
+                f'  {region}={"YES" if plant[f"{region}_native"] else "no"}'
+                for region in _BONAP_REGIONS if region != 'piedmont' and not bonap_error
+            )
+            print(f'  [{completed:3}/{len(plants)}] {status}  {latin}{extra}' +
+                  (f'  ({bonap_error})' if bonap_error else ''))
+
+        lookups = []
+        for latin in plant_by_latin:
+            if len(_bonap_clean_latin(latin).split()) < 2:
+                report(latin, None, 'Need at least genus + species')
+            else:
+                lookups.append(latin)
+
+        for latin, results, error in _bonap_check_many(lookups, workers):
+            if error is not None:
+                report(latin, *bonap_verdict(None, error))
+            else:
+                report(latin, *bonap_verdict(results['piedmont'], None), regions=results)
+
+        print(_bonap_fetch_summary())
     else:
         reason = '--skip-bonap' if args.skip_bonap else 'piedmont_check not available'
         print(f'\nSkipping BONAP checks ({reason})')
         for plant in plants:
-            plant['piedmont_native'] = ''
+            for column in REGION_COLUMNS:
+                plant[column] = ''
             plant['_bonap_error'] = None
 
     # ── Phase 3: compute review flags ────────────────────────────────────────
@@ -606,7 +920,7 @@ def main():
     fieldnames = [
         'latin', 'common', 'attributes_line', 'highlight_line',
         'sun_level', 'moisture', 'is_pollinator', 'is_deer_resistant',
-        'piedmont_native', 'flag_for_review', 'reason_for_review', 'source',
+        *REGION_COLUMNS, 'flag_for_review', 'reason_for_review', 'source',
     ]
     # Strip internal _ keys before writing
     for plant in plants:
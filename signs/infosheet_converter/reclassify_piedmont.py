@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 """
 Re-run BONAP piedmont-native classification on an existing plants.csv,
-updating ONLY the piedmont_native column.
+updating ONLY the piedmont_native column (plus a <region>_native column for
+every other region registered in piedmont_check.REGIONS, added if missing).
 
 Usage:
-  python3 infosheet_converter/reclassify_piedmont.py [INPUT_CSV] [--workers N]
+  python3 infosheet_converter/reclassify_piedmont.py [INPUT_CSV] [--workers N] [--offline]
 
 Defaults:
   INPUT_CSV  ~/Downloads/original-updated-full-ai/plants.improved.20260316_152831.csv
   --workers  10
 
+Flags:
+  --offline  Serve BONAP maps only from the local cache (no network).
+
 Rows with no latin name are left unchanged.
 Rows where BONAP 404s keep their original value and are noted in output.
 Output is written to the same directory as INPUT_CSV with a new timestamp suffix.
@@ -20,12 +24,11 @@ import io
 import os
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Allow importing from sibling directory
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'piedmont_native_classifier'))
-from piedmont_check import check
+from piedmont_check import REGIONS, check_many, configure_cache, fetch_summary
 
 DEFAULT_INPUT = os.path.expanduser(
     '~/Downloads/original-updated-full-ai/plants.improved.20260316_152831.csv'
@@ -42,6 +45,11 @@ def reclassify(input_path, n_workers):
     if 'piedmont_native' not in fieldnames:
         sys.exit(f"No 'piedmont_native' column found in {input_path}")
 
+    # Extra regions get their own column right after piedmont_native
+    extra_regions = [r for r in REGIONS if r != 'piedmont']
+    at = fieldnames.index('piedmont_native') + 1
+    fieldnames[at:at] = [f'{r}_native' for r in extra_regions if f'{r}_native' not in fieldnames]
+
     # Use latin column if present, otherwise fall back to common (which may be "Latin (Common)")
     def get_latin(row):
         return row.get('latin', '').strip() or row.get('common', '').strip()
@@ -51,39 +59,36 @@ def reclassify(input_path, n_workers):
     skipped  = len(rows) - len(to_check)
     print(f"Rows total: {len(rows)}  |  to classify: {len(to_check)}  |  skipping (no latin): {skipped}")
 
-    results  = {}   # index → new piedmont_native value (bool or original string on error)
+    results  = {}   # index → {column: new value} (original piedmont_native kept on error)
     errors   = []   # (index, common, latin, error_msg)
     done     = 0
 
-    def classify_row(idx, row):
-        latin = get_latin(row)
-        native, non_native, total, ratio, is_native = check(latin)
-        return idx, is_native, ratio, total
-
-    with ThreadPoolExecutor(max_workers=n_workers) as pool:
-        futures = {pool.submit(classify_row, i, row): (i, row) for i, row in to_check}
-        for fut in as_completed(futures):
-            i, row = futures[fut]
-            done += 1
-            try:
-                idx, is_native, ratio, total = fut.result()
-                old = row['piedmont_native']
-                new = str(is_native).lower()   # 'true' / 'false'
-                changed = old.lower() not in ('', new)
-                results[idx] = new
-                flag = ' ← CHANGED' if changed else ''
-                print(f"  [{done}/{len(to_check)}] {row['common'] or row['latin']:<45} "
-                      f"{'YES' if is_native else 'NO':>3}  ({ratio*100:.0f}%, {total} px)  "
-                      f"was={old}{flag}")
-            except Exception as e:
-                errors.append((i, row.get('common', ''), row.get('latin', ''), str(e)))
-                results[i] = row['piedmont_native']  # keep original on error
-                print(f"  [{done}/{len(to_check)}] ERROR {row.get('latin', '')}: {e}")
+    for (i, row), result, error in check_many(to_check, n_workers, key=lambda item: get_latin(item[1])):
+        done += 1
+        if error is None:
+            native, non_native, total, ratio, is_native = result['piedmont']
+            old = row['piedmont_native']
+            new = str(is_native).lower()   # 'true' / 'false'
+            changed = old.lower() not in ('', new)
+            results[i] = {'piedmont_native': new}
+            for region in extra_regions:
+                results[i][f'{region}_native'] = str(result[region][4]).lower()
+            flag = ' ← CHANGED' if changed else ''
+            extra = ''.join(f"  {r}={'YES' if result[r][4] else 'NO'}" for r in extra_regions)
+            print(f"  [{done}/{len(to_check)}] {row['common'] or row['latin']:<45} "
+                  f"{'YES' if is_native else 'NO':>3}  ({ratio*100:.0f}%, {total} px)  "
+                  f"was={old}{flag}{extra}")
+        else:
+            errors.append((i, row.get('common', ''), row.get('latin', ''), str(error)))
+            results[i] = {}  # keep original on error
+            print(f"  [{done}/{len(to_check)}] ERROR {row.get('latin', '')}: {error}")
+
+    print(fetch_summary())
 
     # Apply results
     for i, row in enumerate(rows):
         if i in results:
-            row['piedmont_native'] = results[i]
+            row.update(results[i])
 
     # Write output
     stem = os.path.basename(input_path)
@@ -112,6 +117,9 @@ if __name__ == '__main__':
         if a == '--workers' and i + 2 < len(sys.argv):
             workers = int(sys.argv[i + 2])
 
+    if '--offline' in sys.argv[1:]:
+        configure_cache(offline=True)
+
     input_path = os.path.expanduser(args[0]) if args else DEFAULT_INPUT
     if not os.path.exists(input_path):
         sys.exit(f"Input not found: {input_path}")
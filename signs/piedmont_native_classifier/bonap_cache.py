@@ -0,0 +1,141 @@
+"""
+Persistent on-disk cache for BONAP county maps.
+
+Map PNGs are stored content-addressed (blobs/<sha256>.png) and each cleaned
+binomial gets a small JSON entry (entries/<binomial>.json) recording the blob
+hash, the ETag / Last-Modified validators, when it was fetched and the HTTP
+status. 404s are cached as negative entries so missing species are not
+retried on every run.
+
+Entries younger than the TTL are served without touching the network; older
+ones are revalidated with a conditional GET (a 304 only bumps the timestamp).
+In offline mode every lookup is served from the cache regardless of age, and
+anything missing raises CacheMiss.
+
+Environment:
+  BONAP_CACHE_DIR       cache location (default ~/.cache/plant-sale/bonap)
+  BONAP_CACHE_TTL_DAYS  freshness window in days (default 30)
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import urllib.parse
+from pathlib import Path
+
+import requests
+
+import bonap_fetch
+
+CACHE_DIR = Path(os.environ.get('BONAP_CACHE_DIR', Path.home() / '.cache' / 'plant-sale' / 'bonap'))
+DEFAULT_TTL_DAYS = float(os.environ.get('BONAP_CACHE_TTL_DAYS', 30))
+
+
+class CacheMiss(LookupError):
+    """Raised in offline mode when a species map is not in the cache."""
+
+
+def atomic_write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _not_found(url):
+    """Build the same HTTPError raise_for_status() gives for a 404."""
+    resp = requests.Response()
+    resp.status_code = 404
+    resp.reason = 'Not Found'
+    resp.url = url
+    return requests.exceptions.HTTPError(f'404 Client Error: Not Found for url: {url}', response=resp)
+
+
+class BonapCache:
+    def __init__(self, root=CACHE_DIR, ttl_days=DEFAULT_TTL_DAYS, offline=False, fetcher=None):
+        self.root = Path(root)
+        self.ttl = ttl_days * 86400
+        self.offline = offline
+        self.fetcher = fetcher or bonap_fetch.fetcher
+
+    def _entry_path(self, key):
+        return self.root / 'entries' / f"{urllib.parse.quote(key, safe='')}.json"
+
+    def _blob_path(self, sha):
+        return self.root / 'blobs' / f'{sha}.png'
+
+    def entry(self, key):
+        """Return the cached entry dict for key, or None."""
+        try:
+            with open(self._entry_path(key), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key, entry):
+        atomic_write(self._entry_path(key), json.dumps(entry).encode('utf-8'))
+
+    @staticmethod
+    def _hit(entry, url):
+        if entry['status'] == 404:
+            raise _not_found(url)
+        return entry['sha256']
+
+    def fetch(self, key, url, headers=None):
+        """Return the PNG bytes for key, downloading or revalidating as needed."""
+        return self.read(self.resolve(key, url, headers))
+
+    def read(self, sha):
+        """Return the cached PNG bytes for a blob hash."""
+        with open(self._blob_path(sha), 'rb') as f:
+            return f.read()
+
+    def resolve(self, key, url, headers=None):
+        """
+        Make sure key has a fresh cached map and return its blob hash.
+        Raises the cached/live HTTPError for missing species, CacheMiss offline.
+        """
+        entry = self.entry(key)
+        if entry and entry['status'] == 200 and not self._blob_path(entry['sha256']).exists():
+            entry = None  # blob was pruned; refetch
+
+        if entry and (self.offline or time.time() - entry['fetched_at'] < self.ttl):
+            self.fetcher.stats.add('cached')
+            return self._hit(entry, url)
+        if self.offline:
+            raise CacheMiss(f'{key!r} not in BONAP cache (offline)')
+
+        headers = dict(headers or {})
+        if entry and entry['status'] == 200:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            resp = self.fetcher.get(url, headers)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                self._store(key, {'status': 404, 'fetched_at': time.time()})
+            raise
+
+        if resp.status_code == 304 and entry:
+            entry['fetched_at'] = time.time()
+            self._store(key, entry)
+            return self._hit(entry, url)
+
+        content = resp.content
+        sha = hashlib.sha256(content).hexdigest()
+        if not self._blob_path(sha).exists():
+            atomic_write(self._blob_path(sha), content)
+        self._store(key, {
+            'status':        200,
+            'sha256':        sha,
+            'etag':          resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'fetched_at':    time.time(),
+        })
+        return sha
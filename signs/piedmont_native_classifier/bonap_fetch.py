@@ -0,0 +1,186 @@
+"""
+Shared HTTP engine for BONAP map downloads.
+
+Every request goes through one pooled requests.Session, a token-bucket rate
+limit and a per-host concurrency cap, so concurrent callers reuse TLS
+connections and bonap.net sees a polite, bounded request rate. Transient
+failures are retried with jittered exponential backoff.
+
+run_concurrently() drives many lookups on a thread pool and yields results as
+they finish, which lets convert.py and reclassify_piedmont.py stay plain
+synchronous scripts.
+
+Environment:
+  BONAP_RATE      sustained requests per second (default 10)
+  BONAP_PER_HOST  max simultaneous connections per host (default 8)
+"""
+
+import os
+import time
+import random
+import threading
+import urllib.parse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RATE = float(os.environ.get('BONAP_RATE', 10))
+PER_HOST = int(os.environ.get('BONAP_PER_HOST', 8))
+
+RETRIES = 3
+TIMEOUT = 15
+BACKOFF = 0.5       # seconds before the first retry, doubled each attempt
+BACKOFF_MAX = 10.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a request may go out."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+
+class FetchStats:
+    """Counters for one run, reported by summary() at the end."""
+
+    FIELDS = ('requests', 'downloaded', 'not_modified', 'not_found', 'cached', 'retries', 'failures', 'bytes')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = None     # set by the first recorded event
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def add(self, field, n=1):
+        with self.lock:
+            if self.started is None:
+                self.started = time.monotonic()
+            setattr(self, field, getattr(self, field) + n)
+
+    def summary(self):
+        elapsed = time.monotonic() - self.started if self.started else 0
+        rate = self.requests / elapsed if elapsed > 0 else 0
+        return (
+            f'BONAP: {self.requests} requests in {elapsed:.1f}s ({rate:.1f}/s, '
+            f'{self.bytes / 1e6:.1f} MB) — {self.downloaded} downloaded, '
+            f'{self.not_modified} not modified, {self.not_found} not found, '
+            f'{self.cached} served from cache, {self.retries} retries, {self.failures} failures'
+        )
+
+
+class Fetcher:
+    def __init__(self, rate=RATE, per_host=PER_HOST, retries=RETRIES, timeout=TIMEOUT):
+        self.retries = retries
+        self.timeout = timeout
+        self.per_host = per_host
+        self.bucket = TokenBucket(rate)
+        self.stats = FetchStats()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=per_host)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+
+    def _host_slot(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+        with self._hosts_lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return self._hosts[host]
+
+    def _backoff(self, attempt):
+        delay = min(BACKOFF_MAX, BACKOFF * 2 ** attempt)
+        time.sleep(delay * random.uniform(0.5, 1.5))
+
+    def get(self, url, headers=None):
+        """GET url, retrying transient failures. 404s are raised immediately."""
+        for attempt in range(self.retries):
+            try:
+                self.bucket.acquire()
+                with self._host_slot(url):
+                    self.stats.add('requests')
+                    resp = self.session.get(url, headers=headers, timeout=self.timeout)
+                resp.raise_for_status()
+
+                if resp.status_code == 304:
+                    self.stats.add('not_modified')
+                else:
+                    self.stats.add('downloaded')
+                    self.stats.add('bytes', len(resp.content))
+                return resp
+
+            except requests.exceptions.HTTPError as e:
+                # 404 means the species map doesn't exist — don't retry
+                if e.response is not None and e.response.status_code == 404:
+                    self.stats.add('not_found')
+                    raise
+                if attempt == self.retries - 1:
+                    self.stats.add('failures')
+                    raise
+                self.stats.add('retries')
+                self._backoff(attempt)
+
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                if attempt == self.retries - 1:
+                    self.stats.add('failures')
+                    raise
+                self.stats.add('retries')
+                self._backoff(attempt)
+
+
+fetcher = Fetcher()
+
+
+def run_concurrently(fn, items, workers, maxsize=0):
+    """
+    Call fn(item) for every item on `workers` threads. Yields (item, result,
+    error) in completion order; error is the exception fn raised, or None.
+
+    With maxsize, items are only submitted while fewer than workers + maxsize
+    are unfinished or waiting for the consumer, so a slow consumer bounds
+    memory. Closing the generator early cancels the items not yet started
+    and waits for the running ones.
+    """
+    def call(item):
+        try:
+            return item, fn(item), None
+        except Exception as e:
+            return item, None, e
+
+    limit = workers + maxsize if maxsize else None
+    pool = ThreadPoolExecutor(max_workers=workers)
+    pending = set()
+    try:
+        for item in items:
+            pending.add(pool.submit(call, item))
+            if limit is not None and len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -5,27 +5,44 @@ Check whether a plant is an NC Piedmont native using BONAP county maps.
 Usage:
   python3 piedmont_check.py "Andropogon gerardii"
   python3 piedmont_check.py "Coreopsis verticillata" --show-map
+  python3 piedmont_check.py "Andropogon gerardii" --offline
 
 Reads the Piedmont region from the red blob painted in bonap_reference_map.png,
 samples those pixels on the BONAP species map, skips border/background pixels,
 and reports native if ≥10% of valid county pixels show a native-presence color.
 
+Maps are cached on disk (see bonap_cache.py) alongside verdicts.json, an index
+of per-species pixel counts that answers repeat lookups without decoding a map.
+
 Flags:
-  --show-map   Open the BONAP map with a red Piedmont outline overlaid.
+  --show-map   Open the BONAP map with the region outlines overlaid in red.
+  --offline    Serve maps only from the local BONAP cache (see bonap_cache.py).
+  --build-index
+               Recompile bonap_regions.idx.npy, the region/outline pixel index
+               (also rebuilt automatically when a region map changes).
+
+Further regions (Coastal Plain, Mountains, ...) can be registered in REGIONS;
+each is reported from the same single pass over the species map.
 
-Requires: Pillow, numpy  (pip install pillow numpy)
+Requires: Pillow, numpy, requests  (pip install pillow numpy requests)
 """
 
 import io
 import re
 import os
 import sys
-import time
-import requests
+import json
+import atexit
+import multiprocessing
+import hashlib
+import warnings
+import threading
 import tempfile
 import subprocess
 import urllib.parse
 import urllib.request
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
 
 try:
     import numpy as np
@@ -33,6 +50,9 @@ try:
 except ImportError:
     sys.exit("Missing dependencies: pip install pillow numpy")
 
+from bonap_cache import BonapCache, CacheMiss, atomic_write
+from bonap_fetch import fetcher, run_concurrently
+
 REF_MAP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bonap_reference_map.png')
 
 # BONAP colors that indicate native / present in a county
@@ -53,6 +73,29 @@ BORDER_COLORS = {
 
 THRESHOLD = 0.10  # ≥10% of valid county pixels must be native-colored
 
+# Native-range regions, each painted as a red blob on its own copy of the BONAP
+# base map (same size as bonap_reference_map.png). Registering another, e.g.
+# 'coastal_plain': <path to painted map>, adds a verdict and a '<name>_native'
+# column in convert.py / reclassify_piedmont.py from the same decoded species map.
+REGIONS = {
+    'piedmont': REF_MAP,
+}
+REGION_THRESHOLDS = {}  # per-region override of THRESHOLD
+
+_here = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(_here, 'bonap_regions.idx.npy')
+INDEX_META_PATH = os.path.join(_here, 'bonap_regions.idx.json')
+
+
+def _pack_rgb(arr):
+    """Pack an (..., 3) RGB array into 0xRRGGBB integers."""
+    arr = arr.astype(np.uint32)
+    return (arr[..., 0] << 16) | (arr[..., 1] << 8) | arr[..., 2]
+
+
+NATIVE_PACKED = _pack_rgb(np.array(sorted(NATIVE_COLORS)))
+BORDER_PACKED = _pack_rgb(np.array(sorted(BORDER_COLORS)))
+
 def _clean_latin(latin):
     latin = latin[:latin.index("'") if "'" in latin else len(latin)]
     latin = latin[:latin.index("(") if "(" in latin else len(latin)]
@@ -67,84 +110,455 @@ def _red_mask(arr):
     return (arr[:,:,0] > 200) & (arr[:,:,1] < 50) & (arr[:,:,2] < 50)
 
 
-def load_piedmont_pixels(ref_path=REF_MAP):
-    """Return (x, y) coords of all red pixels in the reference map."""
-    arr = np.array(Image.open(ref_path).convert('RGB'))
-    coords = np.argwhere(_red_mask(arr))  # (row, col)
-    return [(int(c), int(r)) for r, c in coords]  # → (x, y)
-
-
-def get_outline_pixels(ref_path=REF_MAP):
-    """Return red pixels that have at least one non-red neighbor."""
-    arr = np.array(Image.open(ref_path).convert('RGB'))
-    mask = _red_mask(arr)
-    # A red pixel is on the outline if any 4-connected neighbor is not red
+def _outline_mask(mask):
+    """Red pixels that have at least one non-red 4-connected neighbor."""
     shifted_up    = np.pad(mask, ((1,0),(0,0)), mode='constant')[:-1, :]
     shifted_down  = np.pad(mask, ((0,1),(0,0)), mode='constant')[1:,  :]
     shifted_left  = np.pad(mask, ((0,0),(1,0)), mode='constant')[:, :-1]
     shifted_right = np.pad(mask, ((0,0),(0,1)), mode='constant')[:, 1: ]
     all_neighbors_red = shifted_up & shifted_down & shifted_left & shifted_right
-    outline_mask = mask & ~all_neighbors_red
-    coords = np.argwhere(outline_mask)
-    return [(int(c), int(r)) for r, c in coords]  # → (x, y)
-
-
-def _fetch_bonap(latin):
+    return mask & ~all_neighbors_red
+
+
+def _sha256_file(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _region_threshold(name):
+    return REGION_THRESHOLDS.get(name, THRESHOLD)
+
+
+class RegionIndex:
+    """
+    Compiled pixel index for every registered region, memory-mapped from
+    bonap_regions.idx.npy:
+
+      pixels    flat row-major indices of every pixel inside any region
+      labels    per pixel, a bitmask of the regions containing it (bit i → names[i])
+      outlines  per region, flat indices of its outline (for --show-map)
+    """
+
+    def __init__(self, names, shape, pixels, labels, outlines):
+        self.names = names
+        self.shape = shape
+        self.pixels = pixels
+        self.labels = labels
+        self.outlines = outlines
+
+    def region_pixels(self, name):
+        bit = 1 << self.names.index(name)
+        return self.pixels[(self.labels & bit) != 0]
+
+
+def _index_meta(regions):
+    return {
+        'regions': [[name, _sha256_file(path)] for name, path in regions.items()],
+    }
+
+
+def build_region_index(regions=None):
+    """
+    Compile the painted region maps into one label array and write it to
+    bonap_regions.idx.npy (+ .idx.json with source hashes, shape and offsets).
+    If the files can't be written the index is still returned for this process.
+    """
+    regions = regions or REGIONS
+    if len(regions) > 32:
+        raise ValueError('At most 32 regions fit in the label bitmask')
+
+    labels = None
+    outlines = {}
+    for bit, (name, path) in enumerate(regions.items()):
+        mask = _red_mask(np.array(Image.open(path).convert('RGB')))
+        if labels is None:
+            labels = np.zeros(mask.shape, dtype=np.uint32)
+        elif mask.shape != labels.shape:
+            raise ValueError(f'{path} is {mask.shape}, expected {labels.shape} like the other region maps')
+        labels[mask] |= np.uint32(1 << bit)
+        outlines[name] = np.flatnonzero(_outline_mask(mask)).astype(np.uint32)
+
+    shape = labels.shape
+    pixels = np.flatnonzero(labels).astype(np.uint32)
+    labels = labels.ravel()[pixels]
+
+    meta = _index_meta(regions)
+    meta['shape'] = list(shape)
+    meta['pixels'] = int(pixels.size)
+    meta['outlines'] = [int(outlines[name].size) for name in regions]
+    try:
+        buf = io.BytesIO()
+        np.save(buf, np.concatenate([pixels, labels, *outlines.values()]))
+        atomic_write(Path(INDEX_PATH), buf.getvalue())
+        atomic_write(Path(INDEX_META_PATH), json.dumps(meta, indent=2).encode('utf-8'))
+    except OSError as e:
+        print(f"Warning: could not write region index ({e}); using it in memory", file=sys.stderr)
+    return RegionIndex(list(regions), shape, pixels, labels, outlines)
+
+
+def load_region_index(regions=None):
+    """
+    Return the RegionIndex, memory-mapped from disk. Rebuilds it first if it is
+    missing or any region map (or the registry itself) changed.
+    """
+    regions = regions or REGIONS
+    try:
+        with open(INDEX_META_PATH, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['regions'] == _index_meta(regions)['regions']:
+            flat = np.load(INDEX_PATH, mmap_mode='r')
+            n = meta['pixels']
+            outlines, offset = {}, 2 * n
+            for name, size in zip(regions, meta['outlines']):
+                outlines[name] = flat[offset:offset + size]
+                offset += size
+            return RegionIndex(list(regions), tuple(meta['shape']), flat[:n], flat[n:2 * n], outlines)
+    except (OSError, ValueError, KeyError):
+        pass
+    return build_region_index(regions)
+
+
+def _flat_to_xy(flat, shape):
+    rows, cols = np.unravel_index(flat, shape)
+    return [(int(c), int(r)) for r, c in zip(rows, cols)]  # → (x, y)
+
+
+def _region_of(ref_path, region):
+    """
+    Region for the deprecated ref_path argument, which used to name the painted
+    map itself: the registered region painted on that file. Maps that aren't in
+    REGIONS are rejected rather than silently classified against another one.
+    """
+    if ref_path is None:
+        return region
+    warnings.warn("ref_path is deprecated; pass region=<name in REGIONS> instead",
+                  DeprecationWarning, stacklevel=3)
+    for name, path in REGIONS.items():
+        if os.path.realpath(path) == os.path.realpath(ref_path):
+            return name
+    raise ValueError(f"{ref_path} is not a registered region map; add it to REGIONS")
+
+
+def load_piedmont_pixels(ref_path=None, *, region='piedmont'):
+    """
+    Return (x, y) coords of all red pixels in the region's reference map.
+    ref_path (deprecated) selects the region by its map file instead.
+    """
+    index = get_classifier().index
+    return _flat_to_xy(index.region_pixels(_region_of(ref_path, region)), index.shape)
+
+
+def get_outline_pixels(ref_path=None, *, region='piedmont'):
+    """
+    Return red pixels that have at least one non-red neighbor.
+    ref_path (deprecated) selects the region by its map file instead.
+    """
+    index = get_classifier().index
+    return _flat_to_xy(index.outlines[_region_of(ref_path, region)], index.shape)
+
+
+def _sample(arr, flat, shape):
+    """
+    View of arr's pixels at the reference map's flat indices. Same-size maps
+    use the flat indices directly; otherwise fall back to (row, col) lookup.
+    """
+    if arr.shape[:2] == shape:
+        return arr.reshape(-1, arr.shape[2])[flat]
+    rows, cols = np.unravel_index(flat, shape)
+    if rows.size and (rows.max() >= arr.shape[0] or cols.max() >= arr.shape[1]):
+        raise IndexError('image index out of range')
+    return arr[rows, cols]
+
+
+def reference_signature(regions=None):
+    """Hash of everything a verdict depends on besides the species map itself."""
+    regions = regions or REGIONS
+    digest = hashlib.sha256(repr((sorted(NATIVE_COLORS), sorted(BORDER_COLORS))).encode())
+    for name, path in regions.items():
+        digest.update(name.encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _result(native, non_native, threshold):
+    total = native + non_native
+    ratio = native / total if total > 0 else 0
+    return native, non_native, total, ratio, ratio >= threshold
+
+
+class RegionClassifier:
+    """
+    Region index loaded once (memory-mapped); classify() samples a BONAP image
+    for every region in a single NumPy pass instead of one getpixel() per pixel.
+    """
+
+    def __init__(self, regions=None):
+        self.index = load_region_index(regions)
+
+    def classify(self, img):
+        """Return {region: (native, non_native, total, ratio, is_native)} for an RGB image."""
+        index = self.index
+        arr = np.asarray(img.convert('RGB') if img.mode != 'RGB' else img)
+        colors = _pack_rgb(_sample(arr, index.pixels, index.shape))
+        border = np.isin(colors, BORDER_PACKED)
+        native = np.isin(colors, NATIVE_PACKED)
+
+        results = {}
+        for bit, name in enumerate(index.names):
+            inside = (index.labels & (1 << bit)) != 0
+            n_native = int(np.count_nonzero(native & inside))
+            n_border = int(np.count_nonzero(border & inside))
+            n_non_native = int(np.count_nonzero(inside)) - n_border - n_native
+            results[name] = _result(n_native, n_non_native, _region_threshold(name))
+        return results
+
+
+_classifier = None
+_classifier_lock = threading.Lock()
+
+
+def get_classifier():
+    """Return the shared RegionClassifier, loading it on first use."""
+    global _classifier
+    with _classifier_lock:
+        if _classifier is None:
+            _classifier = RegionClassifier()
+        return _classifier
+
+
+class VerdictIndex:
+    """
+    Pixel counts per cleaned binomial, persisted as verdicts.json in the cache dir.
+
+    Each entry records the BONAP map hash it was computed from and, per region,
+    the counts, the ratio and the threshold in force at the time. The file
+    carries the classifier signature (region maps + color tables) and is
+    discarded wholesale when that changes. Verdicts are recomputed against the
+    current thresholds, so tweaking them needs no map downloads or decodes.
+    """
+
+    def __init__(self, path, signature):
+        self.path = path
+        self.signature = signature
+        self.entries = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('signature') == signature:
+                self.entries = data['entries']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def get(self, binomial, map_sha):
+        """Return {region: result tuple} for binomial if it was computed from map_sha."""
+        entry = self.entries.get(binomial)
+        if not entry or entry['map_sha256'] != map_sha:
+            return None
+        return {
+            name: _result(counts['native'], counts['non_native'], _region_threshold(name))
+            for name, counts in entry['regions'].items()
+        }
+
+    def put(self, binomial, map_sha, results):
+        with self.lock:
+            self.entries[binomial] = {
+                'map_sha256': map_sha,
+                'regions': {
+                    name: {
+                        'native':     native,
+                        'non_native': non_native,
+                        'ratio':      ratio,
+                        'threshold':  _region_threshold(name),
+                    }
+                    for name, (native, non_native, _, ratio, _) in results.items()
+                },
+            }
+            self.dirty = True
+
+    def flush(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {'signature': self.signature, 'entries': self.entries}
+            atomic_write(self.path, json.dumps(data, sort_keys=True).encode('utf-8'))
+            self.dirty = False
+
+
+_cache = BonapCache()
+_verdicts = None
+
+
+def get_verdicts():
+    """Return the shared VerdictIndex, loading it on first use."""
+    global _verdicts
+    with _classifier_lock:
+        if _verdicts is None or _verdicts.path.parent != _cache.root:
+            _verdicts = VerdictIndex(_cache.root / 'verdicts.json', reference_signature())
+            atexit.register(_verdicts.flush)
+        return _verdicts
+
+
+def configure_cache(offline=None, ttl_days=None, root=None):
+    """Adjust the shared BONAP map cache (used by the CLI flags of the calling scripts)."""
+    global _cache
+    _cache = BonapCache(
+        root=_cache.root if root is None else root,
+        ttl_days=_cache.ttl / 86400 if ttl_days is None else ttl_days,
+        offline=_cache.offline if offline is None else offline,
+        fetcher=_cache.fetcher,
+    )
+
+
+def _bonap_url(latin):
+    """Return (cleaned binomial, BONAP county map URL) for a latin name."""
     words = _clean_latin(latin).split()
     if len(words) < 2:
         raise ValueError(f"Need at least genus + species, got: {latin!r}")
-    path = urllib.parse.quote(f"{' '.join(words)}.png", safe="")
+    binomial = ' '.join(words)
+    path = urllib.parse.quote(f"{binomial}.png", safe="")
+    return binomial, f"https://bonap.net/MapGallery/County/{path}"
 
-    url = f"https://bonap.net/MapGallery/County/{path}"
-    headers = {"User-Agent": "Mozilla/5.0"}
 
-    retries = 3
-    timeout = 15
-    for attempt in range(retries):
-        try:
-            resp = requests.get(url, headers=headers, timeout=timeout)
-            resp.raise_for_status()
-            return Image.open(io.BytesIO(resp.content)).convert("RGB")
-
-        except requests.exceptions.HTTPError as e:
-            # 404 means the species map doesn't exist — don't retry
-            if e.response is not None and e.response.status_code == 404:
-                raise
-            if attempt == retries - 1:
-                raise
-            time.sleep(1)
-
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
-            if attempt == retries - 1:
-                raise
-            time.sleep(1)
-
-
-def check(latin, ref_path=REF_MAP):
-    """Return (native, non_native, total, ratio, is_piedmont_native)."""
-    pixels = load_piedmont_pixels(ref_path)
-    img = _fetch_bonap(latin)
-
-    native = non_native = 0
-    for (x, y) in pixels:
-        color = img.getpixel((x, y))
-        if color in BORDER_COLORS:
-            continue
-        if color in NATIVE_COLORS:
-            native += 1
-        else:
-            non_native += 1
+HEADERS = {"User-Agent": "Mozilla/5.0"}
 
-    total = native + non_native
-    ratio = native / total if total > 0 else 0
-    return native, non_native, total, ratio, ratio >= THRESHOLD
 
+def _fetch_bonap(latin):
+    binomial, url = _bonap_url(latin)
+    content = _cache.fetch(binomial, url, headers=HEADERS)
+    return Image.open(io.BytesIO(content)).convert("RGB")
+
+
+def check_regions(latin):
+    """Return {region: (native, non_native, total, ratio, is_native)} for every region."""
+    binomial, url = _bonap_url(latin)
+    map_sha = _cache.resolve(binomial, url, headers=HEADERS)
+
+    # Repeat lookups are answered from stored counts without decoding the map
+    verdicts = get_verdicts()
+    results = verdicts.get(binomial, map_sha)
+    if results is None:
+        img = Image.open(io.BytesIO(_cache.read(map_sha))).convert("RGB")
+        results = get_classifier().classify(img)
+        verdicts.put(binomial, map_sha, results)
+    return results
+
+
+def check(latin, ref_path=None, *, region='piedmont'):
+    """
+    Return (native, non_native, total, ratio, is_piedmont_native).
+    ref_path (deprecated) selects the region by its map file instead.
+    """
+    return check_regions(latin)[_region_of(ref_path, region)]
+
+
+def _resolve(latin):
+    """I/O stage: stored verdicts, or the map bytes that still need classifying."""
+    binomial, url = _bonap_url(latin)
+    map_sha = _cache.resolve(binomial, url, headers=HEADERS)
+    results = get_verdicts().get(binomial, map_sha)
+    if results is not None:
+        return binomial, map_sha, results, None
+    return binomial, map_sha, None, _cache.read(map_sha)
+
+
+def _classify_png(png_bytes):
+    """CPU stage (runs in a worker process): decode one map and classify it."""
+    img = Image.open(io.BytesIO(png_bytes)).convert("RGB")
+    return get_classifier().classify(img)
+
+
+def check_many(items, workers=10, key=None, cpu_workers=None):
+    """
+    Check many species, yielding (item, results, error) as each one finishes.
+    results is check_regions()'s dict; key(item) gives the latin name
+    (default: item).
+
+    Pipelined: `workers` I/O threads resolve maps through the cache/fetch
+    engine, a bounded number ahead of the consumer, while a process pool
+    decodes and classifies them, so network stalls and pixel work overlap.
+    Species already in the verdict index skip the CPU stage. At most a few
+    maps per CPU are held in memory at once, however many species are
+    checked.
+    """
+    key = key or (lambda item: item)
+    cpu_workers = cpu_workers or os.cpu_count() or 1
+    in_flight = 2 * cpu_workers
+    verdicts = get_verdicts()
+
+    resolved = run_concurrently(
+        lambda item: _resolve(key(item)), items, workers, maxsize=in_flight,
+    )
+
+    pool = None
+    pending = {}    # future → (item, binomial, map_sha)
+
+    def finished(futures):
+        for future in futures:
+            item, binomial, map_sha = pending.pop(future)
+            try:
+                results = future.result()
+            except Exception as e:
+                yield item, None, e
+                continue
+            verdicts.put(binomial, map_sha, results)
+            yield item, results, None
 
-def show_map(latin, ref_path=REF_MAP):
-    """Open the BONAP map with a red Piedmont outline overlaid."""
-    img = _fetch_bonap(latin)
-    for (x, y) in get_outline_pixels(ref_path):
-        img.putpixel((x, y), (255, 0, 0))
+    try:
+        for item, fetched, error in resolved:
+            if error is not None:
+                yield item, None, error
+                continue
+
+            binomial, map_sha, results, png_bytes = fetched
+            if results is not None:
+                yield item, results, None
+                continue
+
+            if pool is None:
+                # Spawned, not forked: the I/O threads are already running and
+                # may hold _classifier_lock, which a forked worker would inherit
+                # locked and deadlock on in get_classifier()
+                pool = ProcessPoolExecutor(max_workers=cpu_workers, initializer=get_classifier,
+                                           mp_context=multiprocessing.get_context('spawn'))
+            pending[pool.submit(_classify_png, png_bytes)] = (item, binomial, map_sha)
+
+            # Report whatever is done; block only when the pool is saturated
+            ready, _ = wait(pending, timeout=0)
+            if len(pending) - len(ready) >= in_flight:
+                ready, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from finished(ready)
+
+        yield from finished(as_completed(list(pending)))
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def fetch_summary():
+    """One-line throughput / failure report for the BONAP requests made so far."""
+    return fetcher.stats.summary()
+
+
+def show_map(latin, ref_path=None):
+    """
+    Open the BONAP map with every region's outline overlaid in red, or only
+    the outline painted on ref_path (deprecated; a registered region map).
+    """
+    index = get_classifier().index
+    if ref_path is None:
+        outline = np.concatenate(list(index.outlines.values()))
+    else:
+        outline = index.outlines[_region_of(ref_path, None)]
+    arr = np.array(_fetch_bonap(latin))
+    if arr.shape[:2] == index.shape:
+        arr.reshape(-1, 3)[outline] = (255, 0, 0)
+    else:
+        rows, cols = np.unravel_index(outline, index.shape)
+        arr[rows, cols] = (255, 0, 0)
+    img = Image.fromarray(arr)
     tmp = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
     img.save(tmp.name)
     subprocess.run(['open', tmp.name])
@@ -155,21 +569,31 @@ if __name__ == "__main__":
     args  = [a for a in sys.argv[1:] if not a.startswith('--')]
     flags = {a for a in sys.argv[1:] if a.startswith('--')}
 
+    if '--build-index' in flags:
+        index = build_region_index()
+        print(f"Wrote {INDEX_PATH}  ({index.pixels.size} pixels, regions: {', '.join(index.names)})")
+        sys.exit(0)
+
     if not args:
         print(__doc__)
         sys.exit(1)
 
     latin = " ".join(args)
 
+    if '--offline' in flags:
+        configure_cache(offline=True)
+
     if '--show-map' in flags:
         print(f"Opening map for {latin}…")
         show_map(latin)
         sys.exit(0)
 
     try:
-        native, non_native, total, ratio, is_native = check(latin)
+        results = check_regions(latin)
     except urllib.error.HTTPError as e:
         sys.exit(f"BONAP returned HTTP {e.code} for {latin!r} — check the species name")
+    except CacheMiss as e:
+        sys.exit(f"Error: {e.args[0]} — run without --offline to fetch it")
     except Exception as e:
         sys.exit(f"Error: {e}")
 
@@ -179,7 +603,12 @@ if __name__ == "__main__":
     png_url   = f"https://bonap.net/MapGallery/County/{urllib.parse.quote(' '.join(words))}.png"
 
     print(f"{latin}")
-    print(f"  Valid county pixels: {total}  ({native} native, {non_native} non-native)")
-    print(f"  Piedmont native: {'YES' if is_native else 'NO'}  ({ratio*100:.0f}%)")
+    for region, (native, non_native, total, ratio, is_native) in results.items():
+        name = region.replace('_', ' ').title()
+        if len(results) > 1:
+            print(f"  {name} valid county pixels: {total}  ({native} native, {non_native} non-native)")
+        else:
+            print(f"  Valid county pixels: {total}  ({native} native, {non_native} non-native)")
+        print(f"  {name} native: {'YES' if is_native else 'NO'}  ({ratio*100:.0f}%)")
     print(f"  BONAP genus page: {genus_url}")
     print(f"  BONAP county map: {png_url}")
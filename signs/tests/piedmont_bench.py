@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the BONAP Piedmont pixel classifier.
+
+Builds synthetic BONAP-style species maps (random mix of native, border and
+other county colors, same size as the reference map), then times the original
+per-pixel getpixel() loop against RegionClassifier.classify() and checks that
+both return the same (native, non_native, total, ratio, is_native) tuple.
+
+No network access — BONAP is never contacted.
+
+Usage:
+    python tests/piedmont_bench.py              # 200 maps, seed=42
+    python tests/piedmont_bench.py --n 1000     # more maps
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'piedmont_native_classifier'))
+import piedmont_check as pc
+
+OTHER_COLORS = [(255, 255, 255), (255, 255, 0), (0, 0, 255), (255, 0, 255)]
+
+
+def legacy_check(img, ref_path=pc.REF_MAP):
+    """The pre-vectorization check(): re-derive the mask, then getpixel() per pixel."""
+    arr = np.array(Image.open(ref_path).convert('RGB'))
+    pixels = [(int(c), int(r)) for r, c in np.argwhere(pc._red_mask(arr))]
+
+    native = non_native = 0
+    for (x, y) in pixels:
+        color = img.getpixel((x, y))
+        if color in pc.BORDER_COLORS:
+            continue
+        if color in pc.NATIVE_COLORS:
+            native += 1
+        else:
+            non_native += 1
+
+    total = native + non_native
+    ratio = native / total if total > 0 else 0
+    return native, non_native, total, ratio, ratio >= pc.THRESHOLD
+
+
+def synthetic_maps(n, seed):
+    rng = np.random.default_rng(seed)
+    ref = Image.open(pc.REF_MAP)
+    palette = np.array(sorted(pc.NATIVE_COLORS) + sorted(pc.BORDER_COLORS) + OTHER_COLORS, dtype=np.uint8)
+    maps = []
+    for _ in range(n):
+        # Skew the mix per map so verdicts land on both sides of THRESHOLD
+        weights = rng.random(len(palette)) ** 3
+        weights[:len(pc.NATIVE_COLORS)] *= rng.random() * 0.3
+        idx = rng.choice(len(palette), size=(ref.height, ref.width), p=weights / weights.sum())
+        maps.append(Image.fromarray(palette[idx], 'RGB'))
+    return maps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--n', type=int, default=200, help='Number of synthetic maps (default: 200)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    maps = synthetic_maps(args.n, args.seed)
+    print(f'{len(maps)} synthetic maps, {len(pc.load_piedmont_pixels())} Piedmont pixels each')
+
+    start = time.perf_counter()
+    legacy = [legacy_check(img) for img in maps]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    classifier = pc.get_classifier()
+    vectorized = [classifier.classify(img)['piedmont'] for img in maps]
+    vectorized_s = time.perf_counter() - start
+
+    mismatches = [i for i, (a, b) in enumerate(zip(legacy, vectorized)) if a != b]
+    natives = sum(1 for r in vectorized if r[4])
+
+    print(f'  legacy loop:   {legacy_s * 1000 / len(maps):8.3f} ms/map')
+    print(f'  vectorized:    {vectorized_s * 1000 / len(maps):8.3f} ms/map  '
+          f'({legacy_s / vectorized_s:.1f}x faster)')
+    print(f'  verdicts:      {natives} native, {len(maps) - natives} not native')
+
+    if mismatches:
+        print(f'  MISMATCH on {len(mismatches)} maps, e.g. #{mismatches[0]}: '
+              f'{legacy[mismatches[0]]} vs {vectorized[mismatches[0]]}')
+        sys.exit(1)
+    print('  results identical')
+
+
+if __name__ == '__main__':
+    main()
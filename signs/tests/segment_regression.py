@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Regression check and timing for convert.segment_fields().
+
+Runs the original per-label segmenter (24 re.search scans plus inline-compiled
+cleanup regexes) and the compiled single-pass segmenter over every infosheet
+in a directory and requires identical output. Each document is also checked
+lowercased, uppercased and with its paragraphs reversed, which moves labels
+around and exercises the first-occurrence logic.
+
+By default it runs over tests/fixtures/infosheets, a few small infosheets
+covering the label edge cases (parentheticals, a label inside another's
+parenthetical, "&" for "and", repeated and missing labels, Sources and URL
+cleanup). Point it at the full infosheet folder for real-world coverage and
+timing; a missing or empty directory fails the check.
+
+Usage:
+    python tests/segment_regression.py                   # fixture infosheets
+    python tests/segment_regression.py DIR --repeat 20   # e.g. initial_info/email1/2026 plant infosheets
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'infosheet_converter'))
+import convert
+
+DEFAULT_DIR = Path(__file__).parent / 'fixtures' / 'infosheets'
+
+
+def legacy_segment_fields(text):
+    """segment_fields() as it was before the compiled segmenter."""
+    positions = []
+    for fn in convert.FIELD_LABELS:
+        pattern = rf'(?<!\w){re.escape(fn)}\s*(?:\([^)]*\))?\s*:'
+        m = re.search(pattern, text, re.IGNORECASE)
+        if m:
+            positions.append((m.start(), fn, m.end()))
+    positions.sort(key=lambda x: x[0])
+
+    fields = {}
+    for i, (_, fn, val_start) in enumerate(positions):
+        end = positions[i + 1][0] if i + 1 < len(positions) else len(text)
+        val = text[val_start:end].strip()
+        val = re.sub(r'\.?\s*Sources?:.*$', '', val, flags=re.DOTALL | re.IGNORECASE)
+        val = re.sub(r'\s*\(https?://[^)]+\)', '', val)
+        val = re.sub(r'\s+', ' ', val).strip().strip('., ')
+        fields[fn.lower()] = val
+    return fields
+
+
+def corpus(infosheet_dir):
+    texts = []
+    for path in sorted(infosheet_dir.glob('*.docx')):
+        try:
+            paragraphs = convert.read_docx_paragraphs(path)
+        except Exception as e:
+            print(f'  skip {path.name}: {e}')
+            continue
+        text = ' '.join(paragraphs)
+        texts += [(path.name, text), (f'{path.name} [lower]', text.lower()),
+                  (f'{path.name} [upper]', text.upper()),
+                  (f'{path.name} [reversed]', ' '.join(reversed(paragraphs)))]
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('infosheet_dir', nargs='?', default=str(DEFAULT_DIR),
+                        help=f'Directory of .docx infosheets (default: {DEFAULT_DIR})')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing rounds (default: 5)')
+    args = parser.parse_args()
+
+    if not Path(args.infosheet_dir).is_dir():
+        sys.exit(f'Infosheet directory not found: {args.infosheet_dir}')
+    texts = corpus(Path(args.infosheet_dir))
+    if not texts:
+        sys.exit(f'No readable .docx files in {args.infosheet_dir}')
+    print(f'{len(texts)} documents ({sum(len(t) for _, t in texts) / 1e3:.0f} KB of text)')
+
+    mismatches = [name for name, text in texts if legacy_segment_fields(text) != convert.segment_fields(text)]
+
+    timings = {}
+    for label, fn in [('legacy', legacy_segment_fields), ('compiled', convert.segment_fields)]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for _, text in texts:
+                fn(text)
+        timings[label] = (time.perf_counter() - start) / (args.repeat * len(texts))
+
+    print(f'  legacy:    {timings["legacy"] * 1e6:8.1f} µs/doc')
+    print(f'  compiled:  {timings["compiled"] * 1e6:8.1f} µs/doc  '
+          f'({timings["legacy"] / timings["compiled"]:.1f}x faster)')
+
+    if mismatches:
+        print(f'  MISMATCH on {len(mismatches)} documents, e.g. {mismatches[0]}')
+        sys.exit(1)
+    print('  output identical')
+
+
+if __name__ == '__main__':
+    main()